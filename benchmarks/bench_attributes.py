@@ -0,0 +1,58 @@
+"""
+Benchmark reading and setting items of caseless dictionaries as attributes.
+
+Prints the time to read and set ``config.host_name`` of a
+`SnakeCaselessAttrDict`, whose class keeps the stored key of the attribute
+name, of a class which goes through `__getitem__` and `__setitem__` like
+`ModifiableItemsAttrDict`, of item access, and of a `types.SimpleNamespace`
+for reference.
+
+Usage:
+    python -m benchmarks.bench_attributes
+"""
+import timeit
+import types
+
+from modifiable_items_dictionary.modifiable_items_attribute_dictionary import (
+    ModifiableItemsAttrDict,
+)
+
+from caseless_dictionary import SnakeCaselessAttrDict
+
+NUMBER = 1_000_000
+
+
+class ItemMethodsAttrDict(SnakeCaselessAttrDict):
+    """Reads and sets attributes through `__getitem__` and `__setitem__`."""
+
+    __getattr__ = ModifiableItemsAttrDict.__getattr__
+    __setattr__ = ModifiableItemsAttrDict.__setattr__
+
+
+def main() -> None:
+    """Print the time of reading and setting an attribute."""
+    namespace = {
+        'config': SnakeCaselessAttrDict({'Host Name': 'db1'}),
+        'item_methods': ItemMethodsAttrDict({'Host Name': 'db1'}),
+        'simple': types.SimpleNamespace(host_name='db1'),
+    }
+    for name, statement in (
+        ('getattr', 'config.host_name'),
+        ('setattr', 'config.host_name = "db2"'),
+        ('getattr (item methods)', 'item_methods.host_name'),
+        ('setattr (item methods)', 'item_methods.host_name = "db2"'),
+        ('getitem', 'config["host_name"]'),
+        ('setitem', 'config["host_name"] = "db2"'),
+        ('SimpleNamespace get', 'simple.host_name'),
+        ('SimpleNamespace set', 'simple.host_name = "db2"'),
+    ):
+        seconds = min(
+            timeit.repeat(
+                statement, number=NUMBER, repeat=7, globals=namespace
+            )
+        )
+        print(f'{name:<24} {seconds / NUMBER * 1e9:>8.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
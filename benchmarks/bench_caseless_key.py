@@ -0,0 +1,54 @@
+"""
+Benchmark looking up pre-normalized keys of a caseless dictionary.
+
+Prints the time to look up a `CaselessKey` in a `CaselessDict`, a *str*
+which the key modifiers normalize, the normalized *str* in a `dict`, and
+the normalized *str* in a `dict` subclass whose `__getitem__` is written in
+Python, which is the least a caseless dictionary can cost.
+
+Usage:
+    python -m benchmarks.bench_caseless_key
+"""
+import timeit
+from typing import Any
+
+from caseless_dictionary import CaselessDict
+
+NUMBER = 1_000_000
+
+
+class PythonGetItemDict(dict):
+    """Looks up its keys through a `__getitem__` written in Python."""
+
+    def __getitem__(self, key: Any) -> Any:
+        return dict.__getitem__(self, key)
+
+
+def main() -> None:
+    """Print the time of looking up a key."""
+    namespace = {
+        'headers': CaselessDict({'Content-Type': 'text/html'}),
+        'CONTENT_TYPE': CaselessDict.caseless_key('Content-Type'),
+        'plain': {'content-type': 'text/html'},
+        'python_getitem': PythonGetItemDict({'content-type': 'text/html'}),
+        'key': 'content-type',
+    }
+    for name, statement in (
+        ('CaselessKey getitem', 'headers[CONTENT_TYPE]'),
+        ('CaselessKey contains', 'CONTENT_TYPE in headers'),
+        ('CaselessKey get', 'headers.get(CONTENT_TYPE)'),
+        ('str getitem', 'headers["Content-Type"]'),
+        ('dict getitem', 'plain[key]'),
+        ('dict get', 'plain.get(key)'),
+        ('Python __getitem__', 'python_getitem[key]'),
+    ):
+        seconds = min(
+            timeit.repeat(
+                statement, number=NUMBER, repeat=7, globals=namespace
+            )
+        )
+        print(f'{name:<24} {seconds / NUMBER * 1e9:>8.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark the case functions of `caseless_dictionary.cases` on ASCII keys.
+
+Each case function is compared against the plain unicode path it replaced
+(`str.strip` followed by the `str` case method) and against the ASCII
+alternatives that were considered (`str.lower` and `str.translate`) for
+key lengths from 8 to 512 characters.
+
+Usage:
+    python -m benchmarks.bench_cases
+"""
+import timeit
+
+from caseless_dictionary.cases import (
+    case_fold,
+    title,
+    snake_case,
+    kebab_case,
+    constant_case,
+)
+
+KEY_LENGTHS = (8, 32, 128, 512)
+NUMBER = 100_000
+
+_SNAKE_TABLE = str.maketrans(
+    {' ': '_', **{chr(code): chr(code + 32) for code in range(65, 91)}}
+)
+
+CANDIDATES = {
+    'case_fold': (
+        ('cases.case_fold', case_fold),
+        ('unicode strip().casefold()', lambda v: v.strip().casefold()),
+        ('ascii strip().lower()', lambda v: v.strip().lower()),
+    ),
+    'title': (
+        ('cases.title', title),
+        ('unicode strip().title()', lambda v: v.strip().title()),
+    ),
+    'snake_case': (
+        ('cases.snake_case', snake_case),
+        (
+            'unicode replace().casefold()',
+            lambda v: v.strip().replace(' ', '_').casefold(),
+        ),
+        ('ascii translate()', lambda v: v.strip().translate(_SNAKE_TABLE)),
+    ),
+    'kebab_case': (
+        ('cases.kebab_case', kebab_case),
+        (
+            'unicode replace().casefold()',
+            lambda v: v.strip().replace(' ', '-').casefold(),
+        ),
+    ),
+    'constant_case': (
+        ('cases.constant_case', constant_case),
+        (
+            'unicode replace().upper()',
+            lambda v: v.strip().replace(' ', '_').upper(),
+        ),
+    ),
+}
+
+
+def make_key(length: int) -> str:
+    """Create an ASCII key of *length* characters with mixed case words."""
+    words = ('Content', 'TYPE', 'header', 'Name')
+    key = ' '.join(words * (length // 20 + 1))[: length - 2]
+    return f' {key} '
+
+
+def main() -> None:
+    """Print the time per call in nanoseconds of every candidate."""
+    for length in KEY_LENGTHS:
+        key = make_key(length)
+        print(f'\nkey length {length}')
+        for name, candidates in CANDIDATES.items():
+            for label, function in candidates:
+                seconds = min(
+                    timeit.repeat(
+                        lambda: function(key), number=NUMBER, repeat=5
+                    )
+                )
+                nanoseconds = seconds / NUMBER * 1e9
+                print(f'  {name:<14} {label:<30} {nanoseconds:8.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark the throughput of a caseless dictionary shared by threads.
+
+Every thread runs the same mix of operations on one shared dictionary:
+lookups, setting items and computing missing values, for 1 to 8 threads.
+`ConcurrentCaselessDict` with its striped locks is compared with a
+`CaselessDict` whose changes are serialized by one lock.
+
+With the GIL, only one thread runs Python code at a time, so the throughput
+does not grow with the number of threads; this measures the cost of the
+locks. On a free-threaded build of Python, such as 3.13t, the threads of
+`ConcurrentCaselessDict` mostly take different locks and run in parallel.
+
+Usage:
+    python -m benchmarks.bench_concurrent
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from caseless_dictionary import CaselessDict
+from caseless_dictionary.concurrent_caseless_dict import (
+    ConcurrentCaselessDict,
+)
+
+THREAD_COUNTS = (1, 2, 4, 8)
+OPERATIONS = 100_000
+KEYS = [f'Header Name {index}' for index in range(1_000)]
+
+
+def _locked_caseless_dict() -> Callable[[int], None]:
+    caseless_dict = CaselessDict()
+    lock = threading.Lock()
+
+    def run(offset: int) -> None:
+        for index in range(OPERATIONS):
+            key = KEYS[(index + offset) % len(KEYS)]
+            caseless_dict.get(key)
+            with lock:
+                caseless_dict[key.upper()] = index
+            with lock:
+                if key not in caseless_dict:
+                    caseless_dict[key] = len(key)
+
+    return run
+
+
+def _concurrent_caseless_dict() -> Callable[[int], None]:
+    caseless_dict = ConcurrentCaselessDict()
+
+    def run(offset: int) -> None:
+        for index in range(OPERATIONS):
+            key = KEYS[(index + offset) % len(KEYS)]
+            caseless_dict.get(key)
+            caseless_dict[key.upper()] = index
+            caseless_dict.get_or_compute(key, len)
+
+    return run
+
+
+def _operations_per_second(
+    create: Callable[[], Callable[[int], Any]], threads: int
+) -> float:
+    run = create()
+    with ThreadPoolExecutor(threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(run, range(0, threads * 97, 97)))
+        seconds = time.perf_counter() - start
+    return threads * OPERATIONS * 3 / seconds
+
+
+def main() -> None:
+    """Print the operations per second of both dictionaries for every number
+    of threads."""
+    print(f'{"threads":>7} {"one lock":>15} {"striped locks":>15}')
+    for threads in THREAD_COUNTS:
+        locked = max(
+            _operations_per_second(_locked_caseless_dict, threads)
+            for _ in range(3)
+        )
+        striped = max(
+            _operations_per_second(_concurrent_caseless_dict, threads)
+            for _ in range(3)
+        )
+        print(f'{threads:>7} {locked:>10,.0f} op/s {striped:>10,.0f} op/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark copying and converting caseless dictionaries.
+
+Compares normalizing the keys of a caseless dictionary again, as copying
+one through the constructor did before, with `copy`, `copy.copy`,
+`copy.deepcopy`, construction from a dictionary of the same class and
+`convert_to` for dictionaries of 10 to 100,000 keys.
+
+Usage:
+    python -m benchmarks.bench_copy
+"""
+import copy
+import timeit
+
+from caseless_dictionary import (
+    CaselessDict,
+    ConstantCaselessDict,
+    SnakeCaselessDict,
+)
+
+SIZES = (10, 1_000, 100_000)
+
+
+def main() -> None:
+    """Print the time per key in nanoseconds of every approach."""
+    for size in SIZES:
+        snake_dict = SnakeCaselessDict(
+            {f'Header Name {index}': index for index in range(size)}
+        )
+        statements = (
+            'SnakeCaselessDict(dict(d))',
+            'd.copy()',
+            'copy.copy(d)',
+            'copy.deepcopy(d)',
+            'SnakeCaselessDict(d)',
+            'd.convert_to(CaselessDict)',
+            'd.convert_to(ConstantCaselessDict)',
+        )
+        number = max(1, 200_000 // size)
+        print(f'\n{size} keys')
+        for statement in statements:
+            seconds = min(
+                timeit.repeat(
+                    statement,
+                    number=number,
+                    repeat=5,
+                    globals={
+                        'copy': copy,
+                        'CaselessDict': CaselessDict,
+                        'ConstantCaselessDict': ConstantCaselessDict,
+                        'SnakeCaselessDict': SnakeCaselessDict,
+                        'd': snake_dict,
+                    },
+                )
+            )
+            nanoseconds = seconds / number / size * 1e9
+            print(f'  {statement:<36} {nanoseconds:8.1f} ns/key')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark lazily wrapping a nested document with the `deep` option.
+
+Builds a configuration tree of 10,000 services with nested settings, then
+prints the time to read one setting of one service after converting the
+whole tree up front with a recursive converter, and after wrapping only the
+top level in a dictionary class whose `deep` option is True.
+
+Usage:
+    python -m benchmarks.bench_deep
+"""
+import time
+from typing import Any, Callable
+
+from caseless_dictionary import SnakeCaselessAttrDict
+
+COUNT = 10_000
+
+
+class DeepSnakeCaselessAttrDict(SnakeCaselessAttrDict):
+    """Wraps nested dictionaries and lists when they are read."""
+
+    deep = True
+
+
+def _convert(value: Any) -> Any:
+    """Convert every nested dictionary of a document up front."""
+    if isinstance(value, dict):
+        return SnakeCaselessAttrDict(
+            (key, _convert(item)) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return [_convert(item) for item in value]
+    return value
+
+
+def _eager(tree: Any) -> Any:
+    return _convert(tree).services[1234].settings.max_connections
+
+
+def _lazy(tree: Any) -> Any:
+    return (
+        DeepSnakeCaselessAttrDict(tree).services[1234].settings.max_connections
+    )
+
+
+def _time(read: Callable[[Any], Any], tree: Any) -> float:
+    start = time.perf_counter()
+    read(tree)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print the time to read one setting of the converted tree."""
+    tree = {
+        'Services': [
+            {
+                'Service Name': f'service-{index}',
+                'Settings': {'Max Connections': index, 'Time Out': 30},
+                'Endpoints': [{'Host Name': 'a'}, {'Host Name': 'b'}],
+            }
+            for index in range(COUNT)
+        ]
+    }
+    for read in (_eager, _lazy):
+        seconds = min(_time(read, tree) for _ in range(5))
+        print(f'{read.__name__:<8} {seconds * 1e3:>9.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
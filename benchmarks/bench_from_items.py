@@ -0,0 +1,52 @@
+"""
+Benchmark `CaselessDict.from_items` against the `CaselessDict` constructor.
+
+Both build a dictionary from a plain `dict` and from a list of
+(key, value) pairs with 10k, 100k and 1M keys.
+
+Usage:
+    python -m benchmarks.bench_from_items
+"""
+import timeit
+
+from caseless_dictionary import CaselessDict
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def make_items(size: int) -> list:
+    """Create *size* (key, value) pairs with mixed case keys."""
+    return [(f'  Header Name {index} ', index) for index in range(size)]
+
+
+def main() -> None:
+    """Print the time in milliseconds of every approach."""
+    for size in SIZES:
+        items = make_items(size)
+        mapping = dict(items)
+        number = max(1, 1_000_000 // size)
+        print(f'\n{size} keys')
+        approaches = (
+            ('CaselessDict(mapping)', lambda: CaselessDict(mapping)),
+            (
+                'CaselessDict.from_items(mapping)',
+                lambda: CaselessDict.from_items(mapping),
+            ),
+            ('CaselessDict(items)', lambda: CaselessDict(items)),
+            (
+                'CaselessDict.from_items(items)',
+                lambda: CaselessDict.from_items(items),
+            ),
+            (
+                "from_items(items, on_collision='first')",
+                lambda: CaselessDict.from_items(items, on_collision='first'),
+            ),
+        )
+        for label, function in approaches:
+            seconds = min(timeit.repeat(function, number=number, repeat=3))
+            milliseconds = seconds / number * 1e3
+            print(f'  {label:<42} {milliseconds:9.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark the memory and the lookups of the frozen caseless mapping.
+
+Builds an `UpperCaselessDict` and a `FrozenCaselessDict` of the same
+product codes, for 1,000 and 100,000 keys, and prints the bytes per entry
+of the containers, without the keys and the values they share, and the time
+of a lookup which hits and one which misses.
+
+Usage:
+    python -m benchmarks.bench_frozen
+"""
+import sys
+import timeit
+
+from caseless_dictionary import UpperCaselessDict
+from caseless_dictionary.frozen_caseless_dict import FrozenCaselessDict
+
+LENGTHS = (1_000, 100_000)
+NUMBER = 200_000
+
+
+def _frozen_size(frozen_dict: FrozenCaselessDict) -> int:
+    # pylint: disable=protected-access
+    return (
+        sys.getsizeof(frozen_dict)
+        + sys.getsizeof(frozen_dict._keys)
+        + sys.getsizeof(frozen_dict._values)
+        + sys.getsizeof(frozen_dict._index)
+    )
+
+
+def main() -> None:
+    """Print the bytes per entry and the lookup times of both mappings."""
+    print(f'{"":<28} {"bytes/entry":>11} {"hit":>10} {"miss":>10}')
+    for length in LENGTHS:
+        codes = {f'sku-{index:06d}': index for index in range(length)}
+        caseless_dict = UpperCaselessDict(codes)
+        frozen_dict = FrozenCaselessDict(codes, UpperCaselessDict)
+        for name, mapping, size in (
+            ('UpperCaselessDict', caseless_dict, sys.getsizeof(caseless_dict)),
+            ('FrozenCaselessDict', frozen_dict, _frozen_size(frozen_dict)),
+        ):
+            times = [
+                min(
+                    timeit.repeat(
+                        f'd.get({key!r})',
+                        number=NUMBER,
+                        repeat=7,
+                        globals={'d': mapping},
+                    )
+                )
+                / NUMBER
+                * 1e9
+                for key in ('Sku-000123', 'Sku-999999x')
+            ]
+            print(
+                f'{f"{name} ({length:,})":<28} {size / length:>11.1f}'
+                f' {times[0]:>7.1f} ns {times[1]:>7.1f} ns'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark the key methods generated for every caseless dictionary class.
+
+Compares the generic methods of `BaseCaselessDict`, which call the compiled
+`_normalize_key` of the class, with the methods generated for the class,
+which inline its key modifiers for *str* keys, for `CaselessDict`,
+`SnakeCaselessDict` and a subclass whose key modifiers are not case
+functions.
+
+Usage:
+    python -m benchmarks.bench_generated_methods
+"""
+import timeit
+
+from caseless_dictionary import CaselessDict, SnakeCaselessDict
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
+
+
+def _strip_dashes(key):
+    if isinstance(key, str):
+        return key.replace('-', ' ')
+    return key
+
+
+class DashCaselessDict(CaselessDict):
+    """Caseless dictionary which replaces dashes in keys with spaces."""
+
+    _key_modifiers = [_strip_dashes, CaselessDict._key_modifiers[0]]
+
+
+CLASSES = (CaselessDict, SnakeCaselessDict, DashCaselessDict)
+METHODS = (
+    ('__getitem__', "{}(d, 'CONTENT TYPE')"),
+    ('__contains__', "{}(d, 'CONTENT TYPE')"),
+    ('get', "{}(d, 'CONTENT TYPE')"),
+    ('__setitem__', "{}(d, 'Content Type', 1)"),
+    ('setdefault', "{}(d, 'Content Type', 1)"),
+    ('pop', "{}(d, 'Missing', None)"),
+)
+NUMBER = 200_000
+
+
+def _nanoseconds(statement: str, namespace: dict) -> float:
+    seconds = min(
+        timeit.repeat(statement, number=NUMBER, repeat=9, globals=namespace)
+    )
+    return seconds / NUMBER * 1e9
+
+
+def main() -> None:
+    """Print the time in nanoseconds of the generic and the generated version
+    of every method for every class."""
+    for caseless_class in CLASSES:
+        print(f'\n{caseless_class.__name__}')
+        print(f'  {"method":<14} {"generic":>10} {"generated":>10}')
+        namespace = {
+            'd': caseless_class({'Content Type': 0}),
+            'generic': BaseCaselessDict,
+            'generated': caseless_class,
+        }
+        for name, statement in METHODS:
+            generic = _nanoseconds(
+                statement.format(f'generic.{name}'), namespace
+            )
+            generated = _nanoseconds(
+                statement.format(f'generated.{name}'), namespace
+            )
+            print(f'  {name:<14} {generic:7.1f} ns {generated:7.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark the memory of many small records with and without `intern_keys`.
+
+Builds `SnakeCaselessAttrDict` records from JSON-like rows, where every row
+spells its keys in a freshly allocated string, and prints the memory per
+record measured with `tracemalloc`.
+
+Usage:
+    python -m benchmarks.bench_intern_keys
+"""
+import json
+import tracemalloc
+
+from caseless_dictionary import SnakeCaselessAttrDict
+
+RECORDS = 50_000
+ROW = json.dumps(
+    {
+        'User ID': 1,
+        'First Name': 'Ada',
+        'Last Name': 'Lovelace',
+        'Email Address': 'ada@example.com',
+        'Account Status': 'active',
+        'Created At': '2024-01-01',
+    }
+)
+
+
+class InternedSnakeCaselessAttrDict(SnakeCaselessAttrDict):
+    """Snake caseless attribute dictionary which interns its keys."""
+
+    __slots__ = ()
+    intern_keys = True
+
+
+def measure(caseless_class: type) -> float:
+    """Return the bytes per record of *RECORDS* records of *caseless_class*."""
+    rows = [json.loads(ROW) for _ in range(RECORDS)]
+    tracemalloc.start()
+    records = [caseless_class(row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size / RECORDS
+
+
+def main() -> None:
+    """Print the memory per record with and without interning."""
+    for caseless_class in (
+        SnakeCaselessAttrDict,
+        InternedSnakeCaselessAttrDict,
+    ):
+        print(
+            f'{caseless_class.__name__:<32} '
+            f'{measure(caseless_class):8.1f} bytes/record'
+        )
+
+
+if __name__ == '__main__':
+    main()
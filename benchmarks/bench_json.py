@@ -0,0 +1,68 @@
+"""
+Benchmark loading JSON into caseless dictionaries.
+
+Loads a newline-delimited JSON document of 100,000 nested records once with
+`json.loads` followed by wrapping every object in a `CaselessAttrDict`, and
+once with `caseless_dictionary.json.iterload`, which builds every object
+directly as a `CaselessAttrDict`, and prints the throughput of each.
+
+Usage:
+    python -m benchmarks.bench_json
+"""
+import json
+import time
+from typing import Any, Callable, List
+
+from caseless_dictionary import CaselessAttrDict
+from caseless_dictionary.json import iterload
+
+COUNT = 100_000
+
+
+def _wrap(value: Any) -> Any:
+    """Wrap every object of a decoded document after it is loaded."""
+    if isinstance(value, dict):
+        return CaselessAttrDict(
+            (key, _wrap(item)) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return [_wrap(item) for item in value]
+    return value
+
+
+def _load_and_wrap(lines: List[str]) -> List[Any]:
+    return [_wrap(json.loads(line)) for line in lines]
+
+
+def _iterload(lines: List[str]) -> List[Any]:
+    return list(iterload(lines, CaselessAttrDict))
+
+
+def _time(loader: Callable[[List[str]], List[Any]], lines: List[str]) -> float:
+    start = time.perf_counter()
+    loader(lines)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print the records per second of both ways of loading."""
+    lines = [
+        json.dumps(
+            {
+                'Record ID': index,
+                'User Name': f'User {index}',
+                'Address': {'Street Name': 'Main', 'Zip Code': '12345'},
+                'Tags': [{'Tag Name': 'a'}, {'Tag Name': 'b'}],
+            }
+        )
+        for index in range(COUNT)
+    ]
+    for loader in (_load_and_wrap, _iterload):
+        seconds = min(_time(loader, lines) for _ in range(3))
+        print(
+            f'{loader.__name__:<16} {COUNT / seconds / 1e3:>7.0f}k records/s'
+        )
+
+
+if __name__ == '__main__':
+    main()
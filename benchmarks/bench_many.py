@@ -0,0 +1,51 @@
+"""
+Benchmark extracting a fixed set of fields from caseless dictionaries.
+
+Compares pulling 10 and 30 fields out of a request-like `CaselessDict` one
+key at a time with `get_many`, and the other batch methods with their one
+key at a time equivalents.
+
+Usage:
+    python -m benchmarks.bench_many
+"""
+import timeit
+
+from caseless_dictionary import CaselessDict
+
+FIELD_COUNTS = (10, 30)
+NUMBER = 4_000
+REPEAT = 25
+
+
+def main() -> None:
+    """Print the time per key in nanoseconds of every approach."""
+    for count in FIELD_COUNTS:
+        items = {f'X-Header-Name-{index}': index for index in range(60)}
+        fields = [f'x-header-name-{index * 2}' for index in range(count)]
+        caseless_dict = CaselessDict(items)
+        pairs = [(field.upper(), 0) for field in fields]
+        statements = (
+            '[d.get(key) for key in fields]',
+            'd.get_many(fields)',
+            '[key in d for key in fields]',
+            'd.contains_many(fields)',
+            'for key, value in pairs: d[key] = value',
+            'd.set_many(pairs)',
+        )
+        namespace = {'d': caseless_dict, 'fields': fields, 'pairs': pairs}
+        # The statements take turns, so a slow spell of the machine does not
+        # only slow down one of them.
+        times: dict = {statement: [] for statement in statements}
+        for _ in range(REPEAT):
+            for statement in statements:
+                times[statement].append(
+                    timeit.timeit(statement, number=NUMBER, globals=namespace)
+                )
+        print(f'\n{count} fields')
+        for statement in statements:
+            nanoseconds = min(times[statement]) / NUMBER / count * 1e9
+            print(f'  {statement:<42} {nanoseconds:8.1f} ns/key')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark merging caseless dictionaries.
+
+Compares the generic `ModifiableItemsDict.update`, which normalized the keys
+of every mapping, with `update`, `|` and `|=` of two `SnakeCaselessDict`
+instances, whose keys are not normalized again, and of a `SnakeCaselessDict`
+and a plain `dict`, for dictionaries of 10 to 100,000 keys.
+
+Usage:
+    python -m benchmarks.bench_merge
+"""
+import timeit
+
+from modifiable_items_dictionary import ModifiableItemsDict
+
+from caseless_dictionary import SnakeCaselessDict
+
+SIZES = (10, 1_000, 100_000)
+
+
+def main() -> None:
+    """Print the time per key in nanoseconds of every approach."""
+    for size in SIZES:
+        keys = [f'Header Name {index}' for index in range(size)]
+        plain_dict = dict.fromkeys(keys, 1)
+        snake_dict = SnakeCaselessDict(plain_dict)
+        statements = (
+            'ModifiableItemsDict.update(SnakeCaselessDict(), other)',
+            'SnakeCaselessDict().update(other)',
+            'SnakeCaselessDict() | other',
+            'e = SnakeCaselessDict(); e |= other',
+            'ModifiableItemsDict.update(SnakeCaselessDict(), plain)',
+            'SnakeCaselessDict().update(plain)',
+            'SnakeCaselessDict() | plain',
+        )
+        number = max(1, 200_000 // size)
+        print(f'\n{size} keys')
+        for statement in statements:
+            seconds = min(
+                timeit.repeat(
+                    statement,
+                    number=number,
+                    repeat=5,
+                    globals={
+                        'ModifiableItemsDict': ModifiableItemsDict,
+                        'SnakeCaselessDict': SnakeCaselessDict,
+                        'other': snake_dict,
+                        'plain': plain_dict,
+                    },
+                )
+            )
+            nanoseconds = seconds / number / size * 1e9
+            print(f'  {statement:<56} {nanoseconds:8.1f} ns/key')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark lookups of a workload where most keys are missing.
+
+Probes a caseless dictionary with keys of which 90% are missing using
+`try: d[key] except KeyError`, `key in d`, `d.get(key)` and
+`d.try_get(key)`, for `CaselessDict` and for a caseless dictionary with the
+lookups and the tuple *KeyError* of `__missing__` it had before.
+
+Usage:
+    python -m benchmarks.bench_misses
+"""
+import timeit
+from typing import Callable, Dict, List
+
+from modifiable_items_dictionary.modifiable_items_dictionary import (
+    ModifiableItemsDict,
+)
+
+from caseless_dictionary import CaselessDict
+
+KEYS = 1_000
+PROBES = 10_000
+
+
+class PreviousCaselessDict(CaselessDict):
+    """Caseless dictionary with the lookups it had before."""
+
+    __slots__ = ()
+    __getitem__ = ModifiableItemsDict.__getitem__
+    __contains__ = ModifiableItemsDict.__contains__
+    get = ModifiableItemsDict.get
+
+    def __missing__(self, key):
+        raise KeyError('Missing key of some case variant of ', key)
+
+
+def try_getitem(caseless_dict: Dict, probes: List[str]) -> int:
+    """Count the found *probes* with `caseless_dict[key]`."""
+    found = 0
+    for key in probes:
+        try:
+            caseless_dict[key]
+        except KeyError:
+            continue
+        found += 1
+    return found
+
+
+def contains(caseless_dict: Dict, probes: List[str]) -> int:
+    """Count the found *probes* with `key in caseless_dict`."""
+    return sum(key in caseless_dict for key in probes)
+
+
+def get(caseless_dict: Dict, probes: List[str]) -> int:
+    """Count the found *probes* with `caseless_dict.get(key)`."""
+    return sum(caseless_dict.get(key) is not None for key in probes)
+
+
+def try_get(caseless_dict: Dict, probes: List[str]) -> int:
+    """Count the found *probes* with `caseless_dict.try_get(key)`."""
+    return sum(caseless_dict.try_get(key)[0] for key in probes)
+
+
+def main() -> None:
+    """Print the time per probe in nanoseconds of every approach."""
+    items = {f'Header Name {index}': index for index in range(KEYS)}
+    probes = [
+        f'HEADER NAME {index}' if index % 10 == 0 else f'Other {index}'
+        for index in range(PROBES)
+    ]
+    approaches: List[Callable[[Dict, List[str]], int]] = [
+        try_getitem,
+        contains,
+        get,
+    ]
+    for caseless_class in (PreviousCaselessDict, CaselessDict):
+        caseless_dict = caseless_class(items)
+        print(f'\n{caseless_class.__name__}')
+        for approach in approaches + (
+            [try_get] if caseless_class is CaselessDict else []
+        ):
+            seconds = min(
+                timeit.repeat(
+                    lambda a=approach: a(caseless_dict, probes),
+                    number=10,
+                    repeat=5,
+                )
+            )
+            print(
+                f'  {approach.__name__:<12} '
+                f'{seconds / 10 / PROBES * 1e9:8.1f} ns/probe'
+            )
+
+
+if __name__ == '__main__':
+    main()
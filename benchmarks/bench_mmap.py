@@ -0,0 +1,72 @@
+"""
+Benchmark opening and looking up a memory-mapped caseless dictionary file.
+
+Writes a `CaselessDict` of 1,000,000 identifiers once as a pickle and once
+with `write_caseless_dict`, then prints the time a process takes to load
+the pickle or to open the file with `MmapCaselessDict`, which is the
+startup of every worker, and the time of a lookup in each.
+
+Usage:
+    python -m benchmarks.bench_mmap
+"""
+import os
+import pickle
+import tempfile
+import time
+import timeit
+
+from caseless_dictionary import CaselessDict
+from caseless_dictionary.mmap_caseless_dict import (
+    MmapCaselessDict,
+    write_caseless_dict,
+)
+
+COUNT = 1_000_000
+NUMBER = 100_000
+
+
+def main() -> None:
+    """Print the startup time, the file size and the lookup time of the
+    pickle and of the memory-mapped file."""
+    caseless_dict = CaselessDict(
+        (f'Device-{index:07d}.Example.NET', index) for index in range(COUNT)
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        pickle_path = os.path.join(directory, 'table.pickle')
+        mmap_path = os.path.join(directory, 'table.caseless')
+        with open(pickle_path, 'wb') as file:
+            pickle.dump(caseless_dict, file, pickle.HIGHEST_PROTOCOL)
+        write_caseless_dict(mmap_path, caseless_dict)
+        del caseless_dict
+
+        start = time.perf_counter()
+        with open(pickle_path, 'rb') as file:
+            loaded = pickle.load(file)
+        pickle_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        mapped = MmapCaselessDict(mmap_path)
+        mmap_seconds = time.perf_counter() - start
+
+        print(f'{"":<18} {"startup":>12} {"file size":>12} {"lookup":>10}')
+        for name, mapping, seconds, path in (
+            ('pickle', loaded, pickle_seconds, pickle_path),
+            ('MmapCaselessDict', mapped, mmap_seconds, mmap_path),
+        ):
+            lookup = min(
+                timeit.repeat(
+                    "d['device-0123456.example.net']",
+                    number=NUMBER,
+                    repeat=7,
+                    globals={'d': mapping},
+                )
+            )
+            print(
+                f'{name:<18} {seconds * 1e3:>9.2f} ms'
+                f' {os.path.getsize(path) / 1e6:>9.1f} MB'
+                f' {lookup / NUMBER * 1e9:>7.1f} ns'
+            )
+        mapped.close()
+
+
+if __name__ == '__main__':
+    main()
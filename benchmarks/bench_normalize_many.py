@@ -0,0 +1,54 @@
+"""
+Benchmark batch key normalization with `normalize_many`.
+
+Compares normalizing a batch of keys one call at a time with
+`snake_case.normalize_many` and `SnakeCaselessDict.normalize_many` for batch
+sizes from 10 to 500,000 keys.
+
+Usage:
+    python -m benchmarks.bench_normalize_many
+"""
+import random
+import timeit
+
+from caseless_dictionary import SnakeCaselessDict
+from caseless_dictionary.cases import snake_case
+
+BATCH_SIZES = (10, 1_000, 100_000, 500_000)
+WORDS = ('Content', 'TYPE', 'header', 'Name', 'user', 'ID', 'Account')
+
+
+def make_keys(size: int) -> list:
+    """Create *size* keys of one to four mixed case words."""
+    _random = random.Random(size)
+    return [
+        ' '.join(_random.choice(WORDS) for _ in range(_random.randint(1, 4)))
+        + ' ' * (index % 3)
+        for index in range(size)
+    ]
+
+
+def main() -> None:
+    """Print the time per key in nanoseconds of every approach."""
+    approaches = (
+        (
+            '[snake_case(key) for key in keys]',
+            lambda k: [snake_case(x) for x in k],
+        ),
+        ('snake_case.normalize_many(keys)', snake_case.normalize_many),
+        ('SnakeCaselessDict.normalize_many', SnakeCaselessDict.normalize_many),
+    )
+    for size in BATCH_SIZES:
+        keys = make_keys(size)
+        number = max(1, 200_000 // size)
+        print(f'\nbatch size {size}')
+        for label, function in approaches:
+            seconds = min(
+                timeit.repeat(lambda: function(keys), number=number, repeat=5)
+            )
+            nanoseconds = seconds / number / size * 1e9
+            print(f'  {label:<36} {nanoseconds:8.1f} ns/key')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark looking up dotted paths of nested caseless dictionaries.
+
+Prints the time to resolve ``"Database.Primary Server.Host Name"`` in nested
+`SnakeCaselessAttrDict` instances by splitting the path and looking up every
+key, and with `get_path`, which parses the path once and walks the
+dictionaries with the cached normalized keys. Also prints the time per path
+of resolving 100 paths with `get_paths`.
+
+Usage:
+    python -m benchmarks.bench_paths
+"""
+import timeit
+
+from caseless_dictionary import SnakeCaselessAttrDict
+
+NUMBER = 100_000
+PATH = 'Database.Primary Server.Host Name'
+
+
+def _split_and_look_up(config: SnakeCaselessAttrDict, path: str) -> str:
+    node = config
+    for key in path.split('.'):
+        node = node[key]
+    return node
+
+
+def main() -> None:
+    """Print the time of a path lookup with and without `get_path`."""
+    config = SnakeCaselessAttrDict(
+        {
+            'Database': SnakeCaselessAttrDict(
+                {
+                    'Primary Server': SnakeCaselessAttrDict(
+                        {'Host Name': 'db1'}
+                    ),
+                    'Replica Server': SnakeCaselessAttrDict(
+                        {'Host Name': 'db2'}
+                    ),
+                }
+            ),
+        }
+    )
+    paths = [PATH, 'Database.Replica Server.Host Name'] * 50
+    namespace = {
+        'config': config,
+        'path': PATH,
+        'paths': paths,
+        'split_and_look_up': _split_and_look_up,
+    }
+    for name, statement, per_call in (
+        ('split and look up', 'split_and_look_up(config, path)', 1),
+        ('get_path', 'config.get_path(path)', 1),
+        ('get_paths (per path)', 'config.get_paths(paths)', len(paths)),
+    ):
+        number = NUMBER // per_call
+        seconds = min(
+            timeit.repeat(
+                statement, number=number, repeat=7, globals=namespace
+            )
+        )
+        print(f'{name:<22} {seconds / number / per_call * 1e9:>8.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
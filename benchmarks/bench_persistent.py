@@ -0,0 +1,96 @@
+"""
+Benchmark loading and looking up a caseless dictionary stored in SQLite.
+
+Bulk-loads 1,000,000 identifiers into a `PersistentCaselessDict` with one
+`update` and with item assignments written in batches, and prints their
+throughput. Then reopens the database and prints the latency of a cold
+lookup, which queries the database, and of a warm lookup, which is served
+by the in-memory cache, next to a lookup of a `CaselessDict`.
+
+Usage:
+    python -m benchmarks.bench_persistent
+"""
+import os
+import random
+import tempfile
+import time
+import timeit
+from typing import Mapping
+
+from caseless_dictionary import CaselessDict
+from caseless_dictionary.persistent_caseless_dict import (
+    PersistentCaselessDict,
+)
+
+COUNT = 1_000_000
+LOOKUPS = 10_000
+NUMBER = 100_000
+
+
+def _key(index: int) -> str:
+    return f'Device-{index:07d}.Example.NET'
+
+
+def _load_with_update(table: PersistentCaselessDict) -> None:
+    table.update((_key(index), index) for index in range(COUNT))
+
+
+def _load_with_setitem(table: PersistentCaselessDict) -> None:
+    for index in range(COUNT):
+        table[_key(index)] = index
+
+
+def _lookup_seconds(mapping: Mapping, key: str) -> float:
+    """Return the best time of one lookup of the *key*."""
+    seconds = timeit.repeat(
+        'd[key]', number=NUMBER, repeat=7, globals={'d': mapping, 'key': key}
+    )
+    return min(seconds) / NUMBER
+
+
+def _bulk_load(path: str) -> None:
+    """Print the throughput of loading the items with `update` and with
+    item assignments written in batches."""
+    for name, load in (
+        ('update', _load_with_update),
+        ('__setitem__', _load_with_setitem),
+    ):
+        if os.path.exists(path):
+            os.remove(path)
+        with PersistentCaselessDict(path) as table:
+            start = time.perf_counter()
+            load(table)
+            table.flush()
+            seconds = time.perf_counter() - start
+        print(f'bulk load {name:<12} {COUNT / seconds / 1e3:>9.0f}k items/s')
+
+
+def main() -> None:
+    """Print the bulk-load throughput and the cold and warm lookup latency."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'table.sqlite')
+        _bulk_load(path)
+
+        keys = [
+            _key(index).upper() for index in range(0, COUNT, COUNT // LOOKUPS)
+        ]
+        random.shuffle(keys)
+        with PersistentCaselessDict(path, cache_size=LOOKUPS) as table:
+            start = time.perf_counter()
+            for key in keys:
+                table[key]
+            cold = (time.perf_counter() - start) / LOOKUPS
+            warm = _lookup_seconds(table, keys[0])
+        in_memory = _lookup_seconds(CaselessDict({keys[0]: 0}), keys[0])
+
+        print(f'{"lookup":<22} {"latency":>12}')
+        for name, seconds in (
+            ('cold (SQLite)', cold),
+            ('warm (LRU cache)', warm),
+            ('CaselessDict', in_memory),
+        ):
+            print(f'{name:<22} {seconds * 1e6:>9.2f} µs')
+
+
+if __name__ == '__main__':
+    main()
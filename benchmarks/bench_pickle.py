@@ -0,0 +1,55 @@
+"""
+Benchmark the pickle round trip of caseless dictionaries.
+
+`multiprocessing` sends arguments and results to and from workers with
+`pickle`. Compares `pickle.loads(pickle.dumps(d))` of a plain `dict`, of a
+caseless dictionary pickled the way it was before, by inserting every item
+again with `__setitem__`, and of `CaselessDict` and `CaselessAttrDict`.
+
+Usage:
+    python -m benchmarks.bench_pickle
+"""
+import pickle
+import timeit
+
+from caseless_dictionary import CaselessAttrDict, CaselessDict
+
+SIZES = (10, 100, 10_000)
+
+
+class PreviousCaselessDict(CaselessDict):
+    """Caseless dictionary pickled as before, which restores its items by
+    inserting them again with `__setitem__`."""
+
+    __slots__ = ()
+    __reduce__ = object.__reduce__
+
+
+def main() -> None:
+    """Print the round trips per second and the time per key of every
+    approach."""
+    for size in SIZES:
+        items = {f'Header Name {index}': index for index in range(size)}
+        number = max(1, 200_000 // size)
+        print(f'\n{size} keys')
+        for label, obj in (
+            ('dict', dict(CaselessDict(items))),
+            ('CaselessDict, before', PreviousCaselessDict(items)),
+            ('CaselessDict', CaselessDict(items)),
+            ('CaselessAttrDict', CaselessAttrDict(items)),
+        ):
+            seconds = min(
+                timeit.repeat(
+                    lambda obj=obj: pickle.loads(pickle.dumps(obj, -1)),
+                    number=number,
+                    repeat=5,
+                )
+            )
+            print(
+                f'  {label:<22} {number / seconds:12,.0f} round trips/s '
+                f'{seconds / number / size * 1e9:8.1f} ns/key'
+            )
+
+
+if __name__ == '__main__':
+    main()
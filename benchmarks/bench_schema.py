@@ -0,0 +1,59 @@
+"""
+Benchmark records of a `CaselessSchema` against caseless dictionaries.
+
+Builds rows of 20 columns as `CaselessDict` objects, with
+`CaselessDict.from_items` and as records of a `CaselessSchema`, and prints
+the construction time and the memory per row measured with `tracemalloc`.
+
+Usage:
+    python -m benchmarks.bench_schema
+"""
+import timeit
+import tracemalloc
+from typing import Callable, List
+
+from caseless_dictionary import CaselessDict
+from caseless_dictionary.caseless_schema import CaselessSchema
+
+ROWS = 20_000
+HEADER = [f'Column Name {index}' for index in range(20)]
+
+
+def measure_memory(build: Callable[[List[list]], list]) -> float:
+    """Return the bytes per row of the objects created by *build*."""
+    rows = [list(range(row, row + len(HEADER))) for row in range(ROWS)]
+    tracemalloc.start()
+    objects = build(rows)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / ROWS
+
+
+def main() -> None:
+    """Print the construction time and memory per row of every approach."""
+    schema = CaselessSchema(HEADER)
+    approaches = (
+        (
+            'CaselessDict(zip(header, row))',
+            lambda rows: [CaselessDict(zip(HEADER, row)) for row in rows],
+        ),
+        (
+            'CaselessDict.from_items',
+            lambda rows: [
+                CaselessDict.from_items(zip(HEADER, row)) for row in rows
+            ],
+        ),
+        ('schema(row)', lambda rows: list(schema.records(rows))),
+    )
+    rows = [list(range(row, row + len(HEADER))) for row in range(ROWS)]
+    for label, build in approaches:
+        seconds = min(timeit.repeat(lambda: build(rows), number=1, repeat=3))
+        print(
+            f'{label:<32} {seconds / ROWS * 1e6:8.2f} us/row '
+            f'{measure_memory(build):8.1f} bytes/row'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark the latency of inserting keys into a sharded caseless mapping.
+
+Inserts 1,000,000 hostnames one by one into a `CaselessDict` and into a
+`ShardedCaselessDict`, timing every insert, and prints the percentiles of
+the latencies and the total time. The inserts which resize the single
+`dict` of `CaselessDict` copy all its items, while a shard only copies its
+own.
+
+Usage:
+    python -m benchmarks.bench_sharded
+"""
+import gc
+import time
+from typing import Callable, List, MutableMapping
+
+from caseless_dictionary import CaselessDict
+from caseless_dictionary.sharded_caseless_dict import ShardedCaselessDict
+
+COUNT = 1_000_000
+PERCENTILES = (50.0, 99.0, 99.9, 99.99, 100.0)
+
+
+def _insert_latencies(
+    create: Callable[[], MutableMapping], hosts: List[str]
+) -> List[int]:
+    mapping = create()
+    clock = time.perf_counter_ns
+    latencies = []
+    append = latencies.append
+    for host in hosts:
+        start = clock()
+        mapping[host] = None
+        append(clock() - start)
+    return latencies
+
+
+def _percentile(latencies: List[int], percentile: float) -> int:
+    """Return the *percentile* of the sorted *latencies*."""
+    index = int(len(latencies) * percentile / 100)
+    return latencies[min(index, len(latencies) - 1)]
+
+
+def main() -> None:
+    """Print the percentiles of the insert latencies of both mappings."""
+    hosts = [f'Host-{index}.Example.COM' for index in range(COUNT)]
+    print(f'{"":<22}' + ''.join(f'{f"p{p:g}":>11}' for p in PERCENTILES))
+    for name, create in (
+        ('CaselessDict', CaselessDict),
+        ('ShardedCaselessDict', ShardedCaselessDict),
+    ):
+        gc.disable()
+        try:
+            latencies = sorted(_insert_latencies(create, hosts))
+        finally:
+            gc.enable()
+        columns = ''.join(
+            f'{_percentile(latencies, p) / 1e3:>8.1f} us' for p in PERCENTILES
+        )
+        print(f'{name:<22}{columns}  total {sum(latencies) / 1e9:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark a few lookups in a large mapping with `CaselessView`.
+
+Compares wrapping a plain `dict` in `CaselessDict`, with
+`CaselessDict.from_items` and in a `CaselessView`, followed by five
+case-insensitive lookups of recently inserted keys and of keys from the
+middle of the mapping, for mappings of 1,000 to 1,000,000 keys.
+
+Usage:
+    python -m benchmarks.bench_view
+"""
+import timeit
+
+from caseless_dictionary import CaselessDict
+from caseless_dictionary.caseless_view import CaselessView
+
+SIZES = (1_000, 100_000, 1_000_000)
+
+
+def main() -> None:
+    """Print the time of wrapping a mapping and looking up five keys."""
+    approaches = (
+        ('CaselessDict(mapping)', CaselessDict),
+        ('CaselessDict.from_items(mapping)', CaselessDict.from_items),
+        ('CaselessView(mapping)', CaselessView),
+    )
+    for size in SIZES:
+        mapping = {f'Header Name {index}': index for index in range(size)}
+        for position, lookups in (
+            ('recent', [f'HEADER NAME {size - n}' for n in range(1, 6)]),
+            ('middle', [f'HEADER NAME {size // 2 + n}' for n in range(5)]),
+        ):
+            print(f'\n{size} keys, {position} keys')
+            for label, wrap in approaches:
+
+                def wrap_and_lookup(wrap=wrap, lookups=lookups):
+                    wrapped = wrap(mapping)
+                    return [wrapped[key] for key in lookups]
+
+                number = max(1, 100_000 // size)
+                seconds = min(
+                    timeit.repeat(wrap_and_lookup, number=number, repeat=3)
+                )
+                print(f'  {label:<34} {seconds / number * 1e3:10.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
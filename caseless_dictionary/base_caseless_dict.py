@@ -0,0 +1,1066 @@
+"""
+Base class shared by the caseless dictionaries.
+
+Objects provided by this module:
+   `BaseCaselessDict` - Compiles the key modifiers of every subclass.
+"""
+# pylint: disable=too-many-lines
+import copy
+import copyreg
+import sys
+from itertools import repeat
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from modifiable_items_dictionary.modifiable_items_dictionary import (
+    NO_DEFAULT,
+    ModifiableItemsDict,
+    Key,
+    Value,
+)
+
+from caseless_dictionary.caseless_key import CaselessKey, caseless_key_type
+from caseless_dictionary.exceptions import CaselessKeyError
+from caseless_dictionary.key_compiler import (
+    MIN_LOOKUP_BATCH_SIZE,
+    KeyModifier,
+    as_modifier_list,
+    compile_key_modifiers,
+    compile_normalize_many,
+    preserves_normalized_keys,
+)
+from caseless_dictionary.lazy_list import NESTED_TYPES, wrap_nested
+from caseless_dictionary.path_compiler import (
+    DEFAULT_SEPARATOR,
+    ParsedPath,
+    Path,
+    compile_path_parser,
+)
+from caseless_dictionary.method_compiler import (
+    compile_methods,
+    is_specializable,
+    specializable,
+)
+
+CaselessDictT = TypeVar('CaselessDictT', bound='BaseCaselessDict')
+
+# Default of `dict.get` which marks a missing key.
+_MISSING: Any = object()
+
+ON_COLLISION_LAST = 'last'
+ON_COLLISION_FIRST = 'first'
+ON_COLLISION_RAISE = 'raise'
+ON_COLLISION_POLICIES = (
+    ON_COLLISION_LAST,
+    ON_COLLISION_FIRST,
+    ON_COLLISION_RAISE,
+)
+
+
+class BaseCaselessDict(ModifiableItemsDict):
+    """
+    Base class of `CaselessDict` and `CaselessAttrDict`.
+
+    When a subclass is created its `_key_modifiers` are compiled into a
+    single `_normalize_key` function (see `caseless_dictionary.key_compiler`)
+    which replaces the generic modifier loop of `ModifiableItemsDict`, and a
+    `_normalize_many` function for batches of keys. The compiled functions
+    use the `normalized_key` of the class's `CaselessKey` subclass directly.
+    The key methods, such as `__getitem__` and `__setitem__`, are generated
+    for every subclass with the key modifiers inlined for *str* keys (see
+    `caseless_dictionary.method_compiler`), unless the subclass defines them
+    itself. A subclass which overrides the `_modify_key` or `_modify_value`
+    hook keeps the generic methods of this class instead, which call the
+    hooks for every key and value. Because they are compiled, the key
+    modifiers must be set in the class body; assigning `_key_modifiers` on
+    an existing class has no effect.
+
+    If `intern_keys` is set to True, the normalized *str* keys stored by the
+    dictionary are interned with `sys.intern`, so dictionaries with the same
+    keys share one key object instead of each holding its own copy. Lookups
+    are not affected.
+
+    If `deep` is set to True, a value which is a plain *dict* or *list* is
+    wrapped the first time it is read by key, with `__getitem__`, `get`,
+    `try_get`, `get_many` or attribute access: a *dict* in a dictionary of
+    the same class and a *list* in a `LazyCaselessList`, which wraps its
+    items the same way (see `caseless_dictionary.lazy_list`). The wrapper
+    replaces the value, so it is built once, and only the branches of a
+    nested document which are read are normalized. Like the key modifiers,
+    `deep` must be set in the class body. Iterating `values` or `items`
+    returns the values as they are stored.
+
+    Paths of nested dictionaries, such as ``"Database.Primary.Host"``, are
+    split on `path_separator` and normalized once, and kept in a cache of
+    the class (see `caseless_dictionary.path_compiler`), so `get_path`,
+    `set_path` and `has_path` only walk the nested dictionaries when a path
+    is used again. Like the key modifiers, `path_separator` must be set in
+    the class body.
+
+    Copies, and dictionaries created from a caseless dictionary whose keys
+    the key modifiers leave unchanged, such as one of the same class, take
+    the keys as they are with a C level `dict.update` instead of normalizing
+    them again. Pickled dictionaries are restored the same way, so sending
+    them to `multiprocessing` workers does not normalize the keys again.
+    """
+
+    __slots__ = ()
+    key_is_str_only = False
+    intern_keys = False
+    deep = False
+    path_separator = DEFAULT_SEPARATOR
+    _key_type: Type[CaselessKey] = CaselessKey
+    _key_chain: Tuple[KeyModifier, ...] = ()
+    _normalize_key: Callable[[Any], Hashable] = staticmethod(
+        compile_key_modifiers(None)
+    )
+    _normalize_many: Callable[[Iterable[Any]], List[Hashable]] = staticmethod(
+        compile_normalize_many(None)
+    )
+    _parse_path: Callable[[Path], ParsedPath] = staticmethod(
+        compile_path_parser(compile_key_modifiers(None))
+    )
+    # If the class overrides `_modify_key` or `_modify_value`, so its key
+    # methods are not generated.
+    _has_item_hooks = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the `_key_modifiers` of the new subclass."""
+        super().__init_subclass__(**kwargs)
+        modifiers = as_modifier_list(cls._key_modifiers)
+        cls._key_chain = tuple(modifiers)
+        cls._key_type = caseless_key_type(modifiers, f'{cls.__name__}Key')
+        cls._normalize_key = staticmethod(
+            compile_key_modifiers(modifiers, cls._key_type)
+        )
+        cls._normalize_many = staticmethod(
+            compile_normalize_many(modifiers, cls._key_type)
+        )
+        cls._parse_path = staticmethod(
+            compile_path_parser(cls._normalize_key, cls.path_separator)
+        )
+        cls._has_item_hooks = (
+            cls._modify_key is not BaseCaselessDict._modify_key
+            or cls._modify_value is not ModifiableItemsDict._modify_value
+        )
+        for name, method in compile_methods(cls, modifiers).items():
+            inherited = getattr(cls, name)
+            if not is_specializable(inherited):
+                continue
+            if cls._has_item_hooks:
+                setattr(cls, name, vars(BaseCaselessDict)[name])
+            else:
+                method.__doc__ = inherited.__doc__
+                setattr(cls, name, method)
+
+    def __init__(self, iterable: Any = None, **kwargs: Value) -> None:
+        if isinstance(iterable, BaseCaselessDict) and self._keeps_keys_of(
+            iterable
+        ):
+            self._update_normalized(iterable)
+            if kwargs:
+                self.update(kwargs)
+        else:
+            super().__init__(iterable, **kwargs)
+
+    def _keeps_keys_of(self, caseless_dict: 'BaseCaselessDict') -> bool:
+        """Return if the key modifiers leave the keys of the *caseless_dict*
+        unchanged. A class which overrides `_modify_key` or `_modify_value`
+        modifies every item again."""
+        if self._has_item_hooks:
+            return False
+        # pylint: disable=protected-access
+        return caseless_dict._key_type is self._key_type or (
+            preserves_normalized_keys(
+                self._key_chain, caseless_dict._key_chain
+            )
+        )
+
+    def _update_normalized(
+        self, caseless_dict: 'BaseCaselessDict', modify_values: bool = True
+    ) -> None:
+        """Update the dictionary with the items of the *caseless_dict*,
+        whose keys are already normalized for this dictionary.
+
+        Args:
+            caseless_dict: The caseless dictionary whose items are added.
+            modify_values: If the value modifiers of the dictionary are
+                applied to the values.
+
+        Raises:
+            TypeError: If `key_is_str_only` is True and a key is not a str.
+        """
+        if self.key_is_str_only:
+            for key in dict.keys(caseless_dict):
+                self._validate_key(key)
+        modify_values = modify_values and bool(self._value_modifiers)
+        if not modify_values and not self.intern_keys:
+            dict.update(self, caseless_dict)
+            return
+
+        items: Iterable[Tuple[Key, Value]] = dict.items(caseless_dict)
+        if self.intern_keys:
+            items = ((_intern(key), value) for key, value in items)
+        if modify_values:
+            items = ((key, self._modify_value(value)) for key, value in items)
+        dict.update(self, items)
+
+    def update(self, __m: Any = None, **kwargs: Value) -> None:
+        """Update the dictionary with the items of a mapping or an iterable
+        of (key, value) pairs and the *kwargs*, normalizing their keys.
+
+        The keys of a caseless dictionary whose key modifiers already give
+        the same keys are added as they are, without normalizing them again.
+
+        Example:
+            >>> from caseless_dictionary import SnakeCaselessDict
+            >>> caseless_dict = SnakeCaselessDict({"User ID": 1})
+            >>> caseless_dict.update({"USER ID": 2}, First_Name="Ada")
+            >>> caseless_dict
+            {'user_id': 2, 'first_name': 'Ada'}
+        """
+        if isinstance(__m, BaseCaselessDict) and self._keeps_keys_of(__m):
+            self._update_normalized(__m)
+            if kwargs:
+                super().update(kwargs)
+        else:
+            super().update(__m, **kwargs)
+
+    def __or__(self: CaselessDictT, other: Any) -> CaselessDictT:
+        """Return a copy of the dictionary updated with the *other* mapping.
+
+        Example:
+            >>> from caseless_dictionary import CaselessDict
+            >>> CaselessDict({"A": 1}) | {"a": 2, "B": 3}
+            {'a': 2, 'b': 3}
+        """
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        caseless_dict = self.copy()
+        caseless_dict.update(other)
+        return caseless_dict
+
+    def __ror__(self: CaselessDictT, other: Any) -> CaselessDictT:
+        """Return a dictionary of the same class with the items of the
+        *other* mapping updated with the items of the dictionary."""
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        caseless_dict = self.__class__.__new__(self.__class__)
+        _copy_instance_state(self, caseless_dict)
+        caseless_dict.update(other)
+        caseless_dict._update_normalized(self, modify_values=False)
+        return caseless_dict
+
+    def __ior__(self: CaselessDictT, other: Any) -> CaselessDictT:
+        """Update the dictionary with the *other* mapping or iterable of
+        (key, value) pairs."""
+        self.update(other)
+        return self
+
+    def copy(self: CaselessDictT) -> CaselessDictT:
+        """Return a shallow copy of the dictionary of the same class.
+
+        Example:
+            >>> from caseless_dictionary import CaselessDict
+            >>> caseless_dict = CaselessDict({"Some Key": 1})
+            >>> caseless_dict.copy()["SOME KEY"]
+            1
+
+        Returns:
+            New dictionary with the same items, which are not modified again.
+        """
+        caseless_dict = self.__class__.__new__(self.__class__)
+        dict.update(caseless_dict, self)
+        _copy_instance_state(self, caseless_dict)
+        return caseless_dict
+
+    __copy__ = copy
+
+    def __deepcopy__(
+        self: CaselessDictT, memo: Optional[Dict[int, Any]] = None
+    ) -> CaselessDictT:
+        """Return a deep copy of the dictionary of the same class, without
+        modifying the copied items again."""
+        if memo is None:
+            memo = {}
+        caseless_dict = self.__class__.__new__(self.__class__)
+        memo[id(self)] = caseless_dict
+        dict.update(
+            caseless_dict,
+            (
+                (copy.deepcopy(key, memo), copy.deepcopy(value, memo))
+                for key, value in dict.items(self)
+            ),
+        )
+        _copy_instance_state(self, caseless_dict, memo)
+        return caseless_dict
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the class of the dictionary and its items as a plain
+        `dict`, which `__setstate__` restores without modifying them again.
+        """
+        instance_state = None
+        if type(self).__dictoffset__:
+            instance_state = vars(self) or None
+        # Pickled with the NEWOBJ opcode, which calls `cls.__new__(cls)`.
+        new_object = copyreg.__newobj__  # type: ignore[attr-defined]
+        return new_object, (type(self),), (dict(self), instance_state)
+
+    def __setstate__(
+        self, state: Tuple[Dict[Key, Value], Optional[Dict[str, Any]]]
+    ) -> None:
+        """Restore the items, and the instance `__dict__` of subclasses
+        without `__slots__`, of a pickled dictionary.
+
+        The keys were normalized by the dictionary which was pickled. They
+        are only interned again if `intern_keys` is True.
+        """
+        items, instance_state = state
+        if self.intern_keys:
+            items = {_intern(key): value for key, value in items.items()}
+        dict.update(self, items)
+        if instance_state:
+            vars(self).update(instance_state)
+
+    def convert_to(self, caseless_class: Type[CaselessDictT]) -> CaselessDictT:
+        """Convert the dictionary to a dictionary of the *caseless_class*.
+
+        When the key modifiers of the *caseless_class* leave the keys of the
+        dictionary unchanged, for example converting a `SnakeCaselessDict` to
+        a `CaselessDict` or a `KebabCaselessDict`, the keys are copied as
+        they are. Otherwise they are normalized in one batch like
+        `from_items` does.
+
+        Example:
+            >>> from caseless_dictionary import (
+            ...     CaselessDict,
+            ...     ConstantCaselessDict,
+            ...     SnakeCaselessDict,
+            ... )
+            >>> snake_dict = SnakeCaselessDict({"Some Key": 1})
+            >>> snake_dict.convert_to(CaselessDict)
+            {'some_key': 1}
+            >>> snake_dict.convert_to(ConstantCaselessDict)
+            {'SOME_KEY': 1}
+
+        Args:
+            caseless_class: The caseless dictionary class of the new
+                dictionary.
+
+        Returns:
+            New dictionary of the *caseless_class* with the items of the
+            dictionary.
+        """
+        caseless_dict = caseless_class.__new__(caseless_class)
+        # pylint: disable=protected-access
+        if not caseless_dict._keeps_keys_of(self):
+            return caseless_class.from_items(self)
+        caseless_dict._update_normalized(self)
+        return caseless_dict
+
+    @classmethod
+    def caseless_key(cls, key: Key) -> Union[CaselessKey, Key]:
+        """Normalize the *key* once into a `CaselessKey` which dictionaries
+        of this class look up without normalizing it again.
+
+        Example:
+            >>> from caseless_dictionary import SnakeCaselessDict
+            >>> USER_NAME = SnakeCaselessDict.caseless_key("  User Name ")
+            >>> USER_NAME
+            CaselessKey('user_name')
+            >>> SnakeCaselessDict({"USER NAME": "alice"})[USER_NAME]
+            'alice'
+            >>> SnakeCaselessDict.caseless_key(2)  # Not a *str*
+            2
+
+        Args:
+            key: The key which will be normalized.
+
+        Returns:
+            A `CaselessKey` of the normalized key. If the normalized key is
+            not a *str* it is returned unchanged.
+        """
+        normalized_key = cls._normalize_key(key)
+        if isinstance(normalized_key, str):
+            return cls._key_type(normalized_key)
+        return normalized_key
+
+    @classmethod
+    def normalize_many(cls, keys: Iterable[Key]) -> List[Key]:
+        """Normalize a batch of *keys* with the key modifiers of the class,
+        or one key at a time with `_modify_key` if the class overrides it.
+
+        Example:
+            >>> from caseless_dictionary import SnakeCaselessDict
+            >>> SnakeCaselessDict.normalize_many(["  Some Word ", "A B", 1])
+            ['some_word', 'a_b', 1]
+
+        Args:
+            keys: Iterable of the keys which will be normalized.
+
+        Returns:
+            List of the normalized keys in the same order as *keys*.
+        """
+        if cls._has_item_hooks:
+            return list(map(cls._item_hooks()._modify_key, keys))
+        return cls._normalize_many(keys)
+
+    @classmethod
+    def from_items(
+        cls: Type[CaselessDictT],
+        iterable: Union[Mapping[Key, Value], Iterable[Tuple[Key, Value]]],
+        on_collision: str = ON_COLLISION_LAST,
+    ) -> CaselessDictT:
+        """Create a new caseless dictionary from a mapping or an iterable of
+        (key, value) pairs.
+
+        Unlike the constructor, which modifies the items one at a time, all
+        keys are normalized in one batch with `normalize_many` and the
+        normalized items are inserted with a single C level `dict.update`.
+        A class which overrides `_modify_key` or `_modify_value` modifies
+        the items with these hooks instead.
+
+        Example:
+            >>> from caseless_dictionary import CaselessDict
+            >>> items = [("  Some Key ", 1), ("SOME KEY", 2), ("Other", 3)]
+            >>> CaselessDict.from_items(items)
+            {'some key': 2, 'other': 3}
+            >>> CaselessDict.from_items(items, on_collision="first")
+            {'some key': 1, 'other': 3}
+
+        Args:
+            iterable: Mapping or iterable of (key, value) pairs.
+            on_collision: How to resolve keys which are equal after they are
+                normalized. 'last' keeps the last value like the
+                constructor, 'first' keeps the first value and 'raise'
+                raises a *ValueError*.
+
+        Returns:
+            New caseless dictionary of the class.
+
+        Raises:
+            ValueError: If *on_collision* is not a valid policy, an item is
+                not a (key, value) pair, or *on_collision* is 'raise' and
+                two keys collide.
+            TypeError: If `key_is_str_only` is True and a key is not a str.
+        """
+        _validate_on_collision(on_collision)
+
+        keys, values = cls._modify_items(iterable)
+        if on_collision == ON_COLLISION_FIRST:
+            normalized = dict.fromkeys(keys)
+            normalized.update(zip(reversed(keys), reversed(values)))
+        else:
+            normalized = dict(zip(keys, values))
+            has_collision = len(normalized) != len(keys)
+            if has_collision and on_collision == ON_COLLISION_RAISE:
+                raise ValueError(
+                    'Keys collide after normalization: ',
+                    _first_duplicate(keys),
+                )
+
+        caseless_dict = cls()
+        dict.update(caseless_dict, normalized)
+        return caseless_dict
+
+    @classmethod
+    def _modify_items(
+        cls,
+        iterable: Union[Mapping[Key, Value], Iterable[Tuple[Key, Value]]],
+    ) -> Tuple[List[Key], List[Value]]:
+        """Modify the items of a mapping or an iterable of (key, value) pairs
+        in one batch, or one item at a time with the `_modify_key` and
+        `_modify_value` hooks if the class overrides them.
+
+        Returns:
+            Tuple of the list of stored keys, normalized and interned if
+            `intern_keys` is True, and the list of modified values.
+
+        Raises:
+            ValueError: If an item is not a (key, value) pair.
+            TypeError: If `key_is_str_only` is True and a key is not a str.
+        """
+        if isinstance(iterable, Mapping):
+            keys = list(iterable)
+            values = list(iterable.values())
+        else:
+            items = list(iterable)
+            keys = [key for key, _ in items]
+            values = [value for _, value in items]
+
+        if cls._has_item_hooks:
+            hooks = cls._item_hooks()
+            keys = list(map(hooks._modify_stored_key, keys))
+            values = list(map(hooks._modify_value, values))
+            return keys, values
+
+        if cls.key_is_str_only:
+            for key in keys:
+                cls._validate_key(key)
+        if cls._value_modifiers:
+            values = list(map(cls._stored_value, values))
+
+        keys = cls._normalize_many(keys)
+        if cls.intern_keys:
+            keys = [_intern(key) for key in keys]
+        return keys, values
+
+    @classmethod
+    def _item_hooks(cls: Type[CaselessDictT]) -> CaselessDictT:
+        """Return an empty dictionary of the class whose `_modify_key` and
+        `_modify_value` hooks modify the items of class level batches."""
+        return cls.__new__(cls)
+
+    def get_many(
+        self, keys: Iterable[Key], default: Value = None
+    ) -> List[Value]:
+        """Return the values of a batch of *keys*, normalized in one batch.
+        Batches of fewer than `MIN_LOOKUP_BATCH_SIZE` keys are normalized
+        one key at a time in the loop which looks them up.
+
+        Example:
+            >>> from caseless_dictionary import CaselessDict
+            >>> headers = CaselessDict({"Host": "a.com", "Accept": "*/*"})
+            >>> headers.get_many(["HOST", "accept", "Cookie"])
+            ['a.com', '*/*', None]
+
+        Args:
+            keys: The keys which will be looked up.
+            default: The value of the keys which are not in the dictionary.
+
+        Returns:
+            List of the values in the same order as the *keys*.
+        """
+        if not isinstance(keys, (list, tuple)):
+            keys = list(keys)
+        if len(keys) < MIN_LOOKUP_BATCH_SIZE and not self.deep:
+            return self._get_few(keys, default)
+        keys = self._modify_keys(keys)
+        get = dict.get
+        if not self.deep:
+            return [get(self, key, default) for key in keys]
+        values = []
+        for key in keys:
+            value = get(self, key, _MISSING)
+            if value is _MISSING:
+                value = default
+            elif value.__class__ in NESTED_TYPES:
+                value = self._wrap_nested(key, value)
+            values.append(value)
+        return values
+
+    def contains_many(self, keys: Iterable[Key]) -> List[bool]:
+        """Return if each of a batch of *keys* is in the dictionary.
+
+        Example:
+            >>> from caseless_dictionary import CaselessDict
+            >>> CaselessDict({"Host": "a.com"}).contains_many(["HOST", "Path"])
+            [True, False]
+
+        Returns:
+            List of booleans in the same order as the *keys*.
+        """
+        if not isinstance(keys, (list, tuple)):
+            keys = list(keys)
+        if len(keys) < MIN_LOOKUP_BATCH_SIZE:
+            return self._contains_few(keys)
+        contains = dict.__contains__
+        return [contains(self, key) for key in self._modify_keys(keys)]
+
+    def pop_many(
+        self, keys: Iterable[Key], default: Value = NO_DEFAULT
+    ) -> List[Value]:
+        """Remove a batch of *keys* and return their values.
+
+        Example:
+            >>> from caseless_dictionary import CaselessDict
+            >>> caseless_dict = CaselessDict({"A": 1, "B": 2, "C": 3})
+            >>> caseless_dict.pop_many(["a", "C"])
+            [1, 3]
+            >>> caseless_dict
+            {'b': 2}
+
+        Args:
+            keys: The keys which will be removed.
+            default: The value of the keys which are not in the dictionary.
+                If it is not given, a missing key raises a *KeyError*.
+
+        Returns:
+            List of the values in the same order as the *keys*.
+
+        Raises:
+            CaselessKeyError: If a key is missing, or given twice, and there
+                is no *default*. No key is removed in this case.
+        """
+        normalized_keys = self._modify_keys(keys)
+        pop = dict.pop.__get__(self)
+        if default is not NO_DEFAULT:
+            return list(map(pop, normalized_keys, repeat(default)))
+        contains = dict.__contains__.__get__(self)
+        for key in normalized_keys:
+            if not contains(key):
+                raise CaselessKeyError(key)
+        if len(set(normalized_keys)) != len(normalized_keys):
+            # Popping the keys one by one would not find it the second time.
+            raise CaselessKeyError(_first_duplicate(normalized_keys))
+        return list(map(pop, normalized_keys))
+
+    def set_many(
+        self,
+        iterable: Union[Mapping[Key, Value], Iterable[Tuple[Key, Value]]],
+    ) -> None:
+        """Set a batch of items whose keys are normalized in one batch, or
+        one key at a time if there are fewer than `MIN_LOOKUP_BATCH_SIZE`.
+
+        Example:
+            >>> from caseless_dictionary import CaselessDict
+            >>> caseless_dict = CaselessDict({"A": 1})
+            >>> caseless_dict.set_many([("a", 2), ("B", 3)])
+            >>> caseless_dict
+            {'a': 2, 'b': 3}
+
+        Args:
+            iterable: Mapping or iterable of (key, value) pairs.
+
+        Raises:
+            ValueError: If an item is not a (key, value) pair.
+            TypeError: If `key_is_str_only` is True and a key is not a str.
+        """
+        if isinstance(iterable, Mapping):
+            iterable = iterable.items()
+        elif not isinstance(iterable, (list, tuple)):
+            iterable = list(iterable)
+        if self._has_item_hooks or len(iterable) < MIN_LOOKUP_BATCH_SIZE:
+            self._set_few(iterable)
+            return
+        keys, values = self._modify_items(iterable)
+        dict.update(self, zip(keys, values))
+
+    def _modify_keys(self, keys: Iterable[Key]) -> List[Key]:
+        """Modify a batch of *keys* which will be looked up, in one batch
+        unless the class overrides `_modify_key`."""
+        if self._has_item_hooks:
+            return list(map(self._modify_key, keys))
+        return self._normalize_many(keys)
+
+    @classmethod
+    def _validate_key(cls, key: Key) -> None:
+        """Check that a *key* which will be stored is a *str* if
+        `key_is_str_only` is True.
+
+        Raises:
+            TypeError: If `key_is_str_only` is True and *key* is not a str.
+        """
+        if cls.key_is_str_only and not isinstance(key, (str, CaselessKey)):
+            raise TypeError('Key must be a str, not ', type(key).__name__)
+
+    @classmethod
+    def _stored_key(
+        cls, key: Key, modify_key: Optional[Callable[[Key], Key]] = None
+    ) -> Key:
+        """Validate, normalize and intern a *key* which will be stored by a
+        dictionary of the class, or by a mapping which uses the key
+        modifiers of the class.
+
+        Args:
+            key: The key which will be stored.
+            modify_key: Modifies the *key* instead of the compiled key
+                modifiers, such as the `_modify_key` hook of a dictionary.
+
+        Returns:
+            The normalized *key*, interned if `intern_keys` is True.
+
+        Raises:
+            TypeError: If `key_is_str_only` is True and *key* is not a str.
+        """
+        cls._validate_key(key)
+        if modify_key is None:
+            key = cls._normalize_key(key)
+        else:
+            key = modify_key(key)
+        if cls.intern_keys:
+            return _intern(key)
+        return key
+
+    @classmethod
+    def _stored_value(cls, value: Value) -> Value:
+        """Modify a *value* which will be stored by a dictionary of the
+        class, or by a mapping which uses its value modifiers."""
+        if cls._value_modifiers:
+            return cls._modify_item(value, cls._value_modifiers)
+        return value
+
+    def _modify_stored_key(self, key: Key) -> Key:
+        """Modify a *key* which will be stored in the dictionary with
+        `_stored_key` and the `_modify_key` hook.
+
+        Raises:
+            TypeError: If `key_is_str_only` is True and *key* is not a str.
+        """
+        return self._stored_key(key, self._modify_key)
+
+    def _modify_key_and_item(
+        self, key_and_value: Tuple[Key, Value]
+    ) -> Tuple[Key, Value]:
+        _key, _value = key_and_value
+        return self._modify_stored_key(_key), self._modify_value(_value)
+
+    @specializable
+    def _get_few(self, keys: Iterable[Key], default: Value) -> List[Value]:
+        """Return the values of a small batch of *keys*."""
+        get = dict.get
+        return [get(self, self._modify_key(key), default) for key in keys]
+
+    @specializable
+    def _contains_few(self, keys: Iterable[Key]) -> List[bool]:
+        """Return if each of a small batch of *keys* is in the dictionary."""
+        contains = dict.__contains__
+        return [contains(self, self._modify_key(key)) for key in keys]
+
+    @specializable
+    def _set_few(self, items: Iterable[Tuple[Key, Value]]) -> None:
+        """Set a small batch of items, modified one item at a time."""
+        dict.update(self, list(map(self._modify_key_and_item, items)))
+
+    @specializable
+    def __setitem__(self, key: Key, value: Value) -> None:
+        """Set the value of the modified *key* to the modified *value*.
+
+        Raises:
+            TypeError: If `key_is_str_only` is True and *key* is not a str.
+        """
+        dict.__setitem__(
+            self, self._modify_stored_key(key), self._modify_value(value)
+        )
+
+    @specializable
+    def setdefault(self, key: Key, default: Value = None) -> Value:
+        """Insert the modified *key* with the modified *default* if the key
+        is not in the dictionary.
+
+        Returns:
+            The value of the *key*.
+        """
+        return dict.setdefault(
+            self, self._modify_stored_key(key), self._modify_value(default)
+        )
+
+    def _modify_key(self, key: Key) -> Key:
+        """Modify the *key* with the compiled key modifiers.
+
+        Args:
+            key: Which will be modified by *self._key_modifiers*
+
+        Returns:
+            The modified *key*.
+        """
+        return self._normalize_key(key)
+
+    def __missing__(self, key: Key) -> None:
+        """Handle a missing *key*.
+
+        Args:
+            key: The modified key which is missing.
+
+        Raises:
+            CaselessKeyError: A *KeyError* which formats its message only
+                when it is converted to a *str*.
+        """
+        raise CaselessKeyError(key)
+
+    def _wrap_nested(self, key: Key, value: Value) -> Value:
+        """Wrap the nested *dict* or *list* value of the normalized *key*
+        with `wrap_nested` and keep the wrapper in place of the value.
+
+        Returns:
+            The wrapper.
+        """
+        value = wrap_nested(value, type(self))
+        dict.__setitem__(self, key, value)
+        return value
+
+    @specializable
+    def __getitem__(self, key: Key) -> Value:
+        key = self._modify_key(key)
+        value = dict.__getitem__(self, key)
+        if self.deep and value.__class__ in NESTED_TYPES:
+            return self._wrap_nested(key, value)
+        return value
+
+    @specializable
+    def __delitem__(self, key: Key) -> None:
+        dict.__delitem__(self, self._modify_key(key))
+
+    @specializable
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, self._modify_key(key))
+
+    @specializable
+    def pop(self, key: Key, default: Value = NO_DEFAULT) -> Value:
+        """Remove the *key* and return its value, or the *default* if the
+        key is not in the dictionary.
+
+        Raises:
+            KeyError: If the *key* is missing and there is no *default*.
+        """
+        if default is NO_DEFAULT:
+            return dict.pop(self, self._modify_key(key))
+        return dict.pop(self, self._modify_key(key), default)
+
+    @specializable
+    def get(self, key: Key, default: Value = None) -> Value:
+        """Return the value of the *key* if it is in the dictionary,
+        otherwise the *default*, without raising a *KeyError*."""
+        key = self._modify_key(key)
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        if self.deep and value.__class__ in NESTED_TYPES:
+            return self._wrap_nested(key, value)
+        return value
+
+    def try_get(self, key: Key) -> Tuple[bool, Value]:
+        """Look up the *key* without raising a *KeyError*.
+
+        Unlike `get`, a missing key can be told apart from a key whose value
+        is the default.
+
+        Example:
+            >>> from caseless_dictionary import CaselessDict
+            >>> caseless_dict = CaselessDict({"Some Key": None})
+            >>> caseless_dict.try_get("SOME KEY")
+            (True, None)
+            >>> caseless_dict.try_get("Other Key")
+            (False, None)
+
+        Args:
+            key: The key which will be looked up.
+
+        Returns:
+            Tuple of if the *key* was found and its value, which is None if
+            it was not found.
+        """
+        key = self._modify_key(key)
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            return False, None
+        if self.deep and value.__class__ in NESTED_TYPES:
+            return True, self._wrap_nested(key, value)
+        return True, value
+
+    def _parsed_path(self, path: Path) -> ParsedPath:
+        """Parse the *path* with the parser cached by the class, and
+        normalize its keys with `_modify_key` if the class overrides it."""
+        parsed_path = self._parse_path(path)
+        if self._has_item_hooks:
+            modify_key = self._modify_key
+            return tuple((key, modify_key(key)) for key, _ in parsed_path)
+        return parsed_path
+
+    def _path_step(self, node: Any, key: Any, normalized_key: Key) -> Any:
+        """Return the value of a *key* of a path in the *node*, or
+        `_MISSING`.
+
+        A dictionary of the same class is looked up with the
+        *normalized_key*, any other mapping with the *key*, and a list or a
+        tuple with the *key* converted to an int index.
+        """
+        if node.__class__ is self.__class__:
+            value = dict.get(node, normalized_key, _MISSING)
+            if self.deep and value.__class__ in NESTED_TYPES:
+                # pylint: disable-next=protected-access
+                return node._wrap_nested(normalized_key, value)
+            return value
+        if isinstance(node, Mapping):
+            return node.get(key, _MISSING)
+        if isinstance(node, (list, tuple)):
+            try:
+                return node[int(key)]
+            except (IndexError, TypeError, ValueError):
+                return _MISSING
+        return _MISSING
+
+    def _resolve_path(self, path: Path) -> Value:
+        """Return the value at the *path*, or `_MISSING`."""
+        # The attributes of the attribute dictionaries are slow to look up,
+        # so the class and its options are looked up once.
+        cls = type(self)
+        deep = cls.deep
+        get = dict.get
+        node: Any = self
+        for key, normalized_key in self._parsed_path(path):
+            # pylint: disable-next=unidiomatic-typecheck
+            if type(node) is cls:
+                # Inlined `_path_step` of the common case.
+                value = get(node, normalized_key, _MISSING)
+                if deep and value.__class__ in NESTED_TYPES:
+                    # pylint: disable-next=protected-access
+                    value = node._wrap_nested(normalized_key, value)
+                node = value
+            else:
+                node = self._path_step(node, key, normalized_key)
+            if node is _MISSING:
+                break
+        return node
+
+    def get_path(self, path: Path, default: Value = None) -> Value:
+        """Return the value at a *path* of nested dictionaries and lists if
+        there is one, otherwise the *default*.
+
+        The keys of the path are normalized once and the parsed path is
+        cached by the class. Nested dictionaries of the same class are
+        looked up with the normalized keys, other mappings with the keys of
+        the path, and lists with the keys converted to an int index.
+
+        Example:
+            >>> from caseless_dictionary import SnakeCaselessDict
+            >>> config = SnakeCaselessDict(
+            ...     {"Database": SnakeCaselessDict({"Primary Host": "db1"})}
+            ... )
+            >>> config.get_path("DATABASE.primary host")
+            'db1'
+            >>> config.get_path("Database.Replica Host", "none")
+            'none'
+
+        Args:
+            path: The keys, separated by `path_separator`, or a tuple of
+                keys.
+            default: The value if there is no value at the *path*.
+
+        Returns:
+            The value at the *path* or the *default*.
+
+        Raises:
+            ValueError: If the *path* has no keys.
+        """
+        value = self._resolve_path(path)
+        if value is _MISSING:
+            return default
+        return value
+
+    def has_path(self, path: Path) -> bool:
+        """Return if there is a value at a *path* of nested dictionaries and
+        lists, as found by `get_path`."""
+        return self._resolve_path(path) is not _MISSING
+
+    def get_paths(
+        self, paths: Iterable[Path], default: Value = None
+    ) -> List[Value]:
+        """Return the values at a batch of *paths*, as found by `get_path`.
+
+        Example:
+            >>> from caseless_dictionary import CaselessDict
+            >>> config = CaselessDict({"Servers": [CaselessDict({"Host": "a"})]})
+            >>> config.get_paths(["servers.0.HOST", "Servers.1.Host"])
+            ['a', None]
+
+        Returns:
+            List of the values in the same order as the *paths*.
+        """
+        resolve = self._resolve_path
+        values = []
+        for path in paths:
+            value = resolve(path)
+            values.append(default if value is _MISSING else value)
+        return values
+
+    def set_path(self, path: Path, value: Value) -> None:
+        """Set the value at a *path* of nested dictionaries and lists.
+
+        Missing dictionaries along the path are created as dictionaries of
+        the same class. The last key is set like an item of the dictionary
+        which holds it, so it is modified by its key and value modifiers.
+
+        Example:
+            >>> from caseless_dictionary import SnakeCaselessDict
+            >>> config = SnakeCaselessDict()
+            >>> config.set_path("Database.Primary Host", "db1")
+            >>> config
+            {'database': {'primary_host': 'db1'}}
+
+        Raises:
+            ValueError: If the *path* has no keys.
+            TypeError: If a key of the path, other than the last, holds a
+                value which is neither a mutable mapping nor a list.
+            IndexError: If an index of a list is out of range.
+        """
+        parsed_path = self._parsed_path(path)
+        key: Any = parsed_path[-1][0]
+        node: Any = self
+        for parent_key, normalized_key in parsed_path[:-1]:
+            child = self._path_step(node, parent_key, normalized_key)
+            if child is _MISSING:
+                if isinstance(node, list):
+                    raise IndexError('Path index out of range: ', parent_key)
+                if not isinstance(node, MutableMapping):
+                    raise TypeError('Path does not lead to a mapping: ', path)
+                node[parent_key] = self.__class__()
+                child = self._path_step(node, parent_key, normalized_key)
+            node = child
+        if isinstance(node, list):
+            node[int(key)] = value
+        elif isinstance(node, MutableMapping):
+            node[key] = value
+        else:
+            raise TypeError('Path does not lead to a mapping: ', path)
+
+
+def _first_duplicate(keys: Iterable[Key]) -> Key:
+    """Return the first key of *keys* which was already seen."""
+    seen = set()
+    for key in keys:
+        if key in seen:
+            return key
+        seen.add(key)
+    return None
+
+
+def _validate_on_collision(on_collision: str) -> None:
+    """Check that *on_collision* is one of `ON_COLLISION_POLICIES`.
+
+    Raises:
+        ValueError: If *on_collision* is not a valid policy.
+    """
+    if on_collision not in ON_COLLISION_POLICIES:
+        raise ValueError(
+            'on_collision must be one of ',
+            ON_COLLISION_POLICIES,
+            'not ',
+            on_collision,
+        )
+
+
+def _copy_instance_state(
+    source: BaseCaselessDict,
+    target: BaseCaselessDict,
+    memo: Optional[Dict[int, Any]] = None,
+) -> None:
+    """Copy the instance `__dict__` of subclasses without `__slots__` from
+    the *source* to the *target*, deep copied if a *memo* is given."""
+    if not type(source).__dictoffset__:
+        return
+    state = vars(source)
+    if state:
+        if memo is not None:
+            state = copy.deepcopy(state, memo)
+        vars(target).update(state)
+
+
+def _intern(key: Key) -> Key:
+    """Intern the *key* if it is a *str*."""
+    if key.__class__ is str:
+        return sys.intern(key)
+    return key
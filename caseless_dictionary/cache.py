@@ -0,0 +1,102 @@
+"""
+Bounded memoization of key modifiers.
+
+Every lookup on a caseless dictionary runs its key modifiers, which allocate
+new strings on each call. When the same keys are looked up over and over
+(e.g. HTTP header or config names) the result of the modifier can be cached.
+
+Objects provided by this module:
+   `CachedKeyModifier` - Wraps a key modifier with a size-bounded LRU cache.
+"""
+import functools
+from typing import Any, Callable, Hashable
+
+DEFAULT_MAXSIZE = 1024
+
+
+class CachedKeyModifier:
+    """
+    Key modifier that memoizes the modified *str* keys in a size-bounded
+    least recently used (LRU) cache. Keys which are not a *str* are passed
+    to the wrapped modifier without being cached.
+
+    The cache is opt-in and configured per dictionary class by wrapping the
+    modifiers in `_key_modifiers`:
+
+    >>> from caseless_dictionary import CaselessDict
+    >>> from caseless_dictionary.cases import case_fold
+    >>> class HeaderDict(CaselessDict):
+    ...     _key_modifiers = [CachedKeyModifier(case_fold, maxsize=256)]
+    >>> headers = HeaderDict({"Content-Type": "text/html"})
+    >>> headers["CONTENT-TYPE"]
+    'text/html'
+    >>> HeaderDict._key_modifiers[0].cache_info()
+    CacheInfo(hits=0, misses=2, maxsize=256, currsize=2)
+    >>> headers["CONTENT-TYPE"]
+    'text/html'
+    >>> HeaderDict._key_modifiers[0].hits
+    1
+    """
+
+    __slots__ = ('__wrapped__', '_cached_modifier')
+
+    def __init__(
+        self,
+        modifier: Callable[[Any], Hashable],
+        maxsize: int = DEFAULT_MAXSIZE,
+    ) -> None:
+        """Wrap the *modifier* with an LRU cache of *maxsize* entries.
+
+        Args:
+            modifier: The key modifier whose results will be cached.
+            maxsize: The maximum number of keys kept in the cache.
+
+        Raises:
+            TypeError: If *modifier* is not callable.
+            ValueError: If *maxsize* is not a positive int.
+        """
+        if not callable(modifier):
+            raise TypeError('Modifier must be callable, not ', modifier)
+        if (
+            isinstance(maxsize, bool)
+            or not isinstance(maxsize, int)
+            or maxsize < 1
+        ):
+            raise ValueError('maxsize must be a positive int, not ', maxsize)
+
+        self.__wrapped__ = modifier
+        # typed=True keeps str subclasses from sharing entries with str.
+        self._cached_modifier = functools.lru_cache(
+            maxsize=maxsize, typed=True
+        )(modifier)
+
+    def __call__(self, value: Any) -> Hashable:
+        """Return the modified *value*, using the cache for *str* values."""
+        if isinstance(value, str):
+            return self._cached_modifier(value)
+        return self.__wrapped__(value)
+
+    def __repr__(self) -> str:
+        info = self.cache_info()
+        return (
+            f'{self.__class__.__name__}({self.__wrapped__!r}, '
+            f'maxsize={info.maxsize})'
+        )
+
+    @property
+    def hits(self) -> int:
+        """Number of calls answered from the cache."""
+        return self.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        """Number of calls that had to run the wrapped modifier."""
+        return self.cache_info().misses
+
+    def cache_info(self):
+        """Return the hits, misses, maxsize and currsize of the cache."""
+        return self._cached_modifier.cache_info()
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset the hit and miss counters."""
+        self._cached_modifier.cache_clear()
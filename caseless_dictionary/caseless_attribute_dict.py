@@ -11,21 +11,33 @@ Classes:
     - ConstantCaselessAttrDict: A case-insensitive AttrDict where keys that
         are strings are in constant case.
 
-Each class inherits from ModifiableItemsAttrDict and overrides the
-_key_modifiers attribute to provide different case handling.
+Each class inherits from ModifiableItemsAttrDict and BaseCaselessDict and
+overrides the _key_modifiers attribute to provide different case handling.
 """
+from typing import Any, Dict, Optional
+
 from modifiable_items_dictionary.modifiable_items_attribute_dictionary import (
     ModifiableItemsAttrDict,
 )
-from modifiable_items_dictionary.modifiable_items_dictionary import Key, Value
+from modifiable_items_dictionary.modifiable_items_dictionary import Key
 
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
 from caseless_dictionary.cases import (
     snake_case,
     constant_case,
 )
+from caseless_dictionary.lazy_list import NESTED_TYPES
+from caseless_dictionary.method_compiler import is_specializable
+
+# Maximum number of attribute names whose stored key a class keeps. When the
+# cache is full, the name which was cached first is dropped.
+ATTRIBUTE_CACHE_SIZE = 1024
+
+# Default of `dict.get` which marks a missing key.
+_MISSING: Any = object()
 
 
-class CaselessAttrDict(ModifiableItemsAttrDict):
+class CaselessAttrDict(ModifiableItemsAttrDict, BaseCaselessDict):
     """
     Case-insensitive AttrDict where keys that are strings are in snake case.
     If key_is_str_only is set to True, keys must be of type str.
@@ -51,36 +63,88 @@ class CaselessAttrDict(ModifiableItemsAttrDict):
     1
     >>> caseless_attr_dict.sOme_worD
     1
+
+    Attribute access looks the item up directly instead of through
+    `__getitem__`. Every class keeps the stored key of up to
+    `ATTRIBUTE_CACHE_SIZE` attribute names which were set or found, so an
+    attribute which is used again is not normalized again. A subclass which defines
+    its own `__getitem__` or `__setitem__`, or overrides `_modify_key` or
+    `_modify_value`, goes through its item methods instead.
     """
 
     __slots__ = ()
     _key_modifiers = [snake_case]
     key_is_str_only = False
-
-    def __missing__(self, key: Key) -> None:
-        """Handle missing __key.
-        Args:
-            key: The Hashable __key that is missing.
-
-        Raises:
-            *KeyError* with a more descriptive error for caseless keys.
-        """
-        error = KeyError('Missing key of some case variant of ', key)
-
-        raise error
-
-    def __setitem__(self, key: Key, value: Value) -> None:
-        """Set the value of the key in the dictionary.
-        Args:
-            key: The Hashable key that will be set.
-            value: The value that will be set for the key.
+    # Attribute name to stored key, or None if attribute access must go
+    # through the item methods of the class.
+    _attribute_keys: Optional[Dict[str, Key]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give the new subclass its own cache of attribute keys."""
+        super().__init_subclass__(**kwargs)
+        if (
+            not cls._has_item_hooks
+            and is_specializable(cls.__getitem__)
+            and is_specializable(cls.__setitem__)
+        ):
+            cls._attribute_keys = {}
+        else:
+            cls._attribute_keys = None
+
+    def _cache_attribute_key(self, name: str, key: Key) -> None:
+        """Keep the stored *key* of the attribute *name* in the cache of the
+        class. A full cache drops the name which was cached first."""
+        keys = type(self)._attribute_keys
+        if keys is None or ATTRIBUTE_CACHE_SIZE < 1:
+            return
+        if len(keys) >= ATTRIBUTE_CACHE_SIZE:
+            first_name = next(iter(keys), None)
+            if first_name is not None:
+                keys.pop(first_name, None)
+        keys[name] = key
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the value of the item of the attribute *name*.
+
+        Called only when the attribute is not found on the instance or its
+        class. A missing item falls back to `__getitem__`, so `__missing__`
+        is honored.
 
         Raises:
-            TypeError: If key_is_str_only is True and key is not a str.
+            AttributeError: If the item is not in the dictionary.
         """
-        if self.key_is_str_only and not isinstance(key, str):
-            raise TypeError('Key must be a str, not ', type(key).__name__)
-        ModifiableItemsAttrDict.__setitem__(self, key, value)
+        cls = type(self)
+        keys = cls._attribute_keys
+        if keys is not None:
+            cached_key = keys.get(name, _MISSING)
+            if cached_key is _MISSING:
+                key = self._modify_stored_key(name)
+            else:
+                key = cached_key
+            value = dict.get(self, key, _MISSING)
+            if value is not _MISSING:
+                if cached_key is _MISSING:
+                    self._cache_attribute_key(name, key)
+                if cls.deep and value.__class__ in NESTED_TYPES:
+                    return self._wrap_nested(key, value)
+                return value
+        return ModifiableItemsAttrDict.__getattr__(self, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the value of the item of the attribute *name* to the modified
+        *value*."""
+        cls = type(self)
+        keys = cls._attribute_keys
+        if keys is None:
+            ModifiableItemsAttrDict.__setattr__(self, name, value)
+            return
+        key = keys.get(name, _MISSING)
+        if key is _MISSING:
+            key = self._modify_stored_key(name)
+            self._cache_attribute_key(name, key)
+        if cls._value_modifiers:
+            value = self._modify_value(value)
+        dict.__setitem__(self, key, value)
 
 
 class SnakeCaselessAttrDict(CaselessAttrDict):
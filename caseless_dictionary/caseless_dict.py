@@ -9,12 +9,7 @@ Objects provided by this module:
    `KebabCaselessDict` - Keys are in kebab case.
    `ConstantCaselessDict` - Keys are in constant case.
 """
-from modifiable_items_dictionary.modifiable_items_dictionary import (
-    ModifiableItemsDict,
-    Key,
-    Value,
-)
-
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
 from caseless_dictionary.cases import (
     case_fold,
     upper,
@@ -26,7 +21,7 @@ from caseless_dictionary.cases import (
 )
 
 
-class CaselessDict(ModifiableItemsDict):
+class CaselessDict(BaseCaselessDict):
     """
     Case-insensitive Dictionary class where the keys that are strings are
     casefolded. If key_is_str_only is set to True, keys must be of type str.
@@ -56,32 +51,6 @@ class CaselessDict(ModifiableItemsDict):
     _key_modifiers = [case_fold]
     key_is_str_only = False
 
-    def __missing__(self, key: Key) -> None:
-        """Handle missing key.
-        Args:
-            key: The Hashable key that is missing.
-
-        Raises:
-            KeyError: with a more descriptive error for caseless keys.
-        """
-        error = KeyError('Missing key of some case variant of ', key)
-
-        raise error
-
-    def __setitem__(self, key: Key, value: Value) -> None:
-        """Set the value of the key in the dictionary.
-        Args:
-            key: The Hashable key that will be set.
-            value: The value that will be set for the key.
-
-        Raises:
-            TypeError: If `key_is_str_only` is True and key is not a str.
-        """
-        if self.key_is_str_only and not isinstance(key, str):
-            raise TypeError('Key must be a str, not ', type(key).__name__)
-
-        ModifiableItemsDict.__setitem__(self, key, value)
-
 
 class CaseFoldCaselessDict(CaselessDict):
     """
@@ -0,0 +1,92 @@
+"""
+Pre-normalized keys for repeated lookups.
+
+A `CaselessKey` holds a key which was already normalized by the key
+modifiers of a caseless dictionary class. The generated key methods of
+the caseless dictionaries recognise their own keys and look up the
+normalized *str* directly, before calling any key modifier, and the *str*
+keeps its cached hash. A lookup still goes through the `__getitem__` of the
+class, which is written in Python, so it costs about 1.5 times a `dict`
+subclass with a one-line `__getitem__`, and 4 to 5 times a `dict` lookup.
+
+Objects provided by this module:
+   `CaselessKey` - Base class of the pre-normalized keys.
+   `caseless_key_type` - Returns the `CaselessKey` subclass of a chain of key
+       modifiers.
+"""
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type
+
+
+class CaselessKey:
+    """
+    Key which was normalized by the key modifiers of a caseless dictionary.
+
+    Create instances with the `caseless_key` classmethod of a caseless
+    dictionary class. Every chain of key modifiers has its own subclass, so
+    a key is only used directly by dictionaries with the same modifiers;
+    other dictionaries normalize its `normalized_key` with their own.
+
+    Example:
+    >>> from caseless_dictionary import CaselessDict
+    >>> CONTENT_TYPE = CaselessDict.caseless_key("  Content-Type ")
+    >>> CONTENT_TYPE
+    CaselessKey('content-type')
+    >>> headers = CaselessDict({"CONTENT-TYPE": "text/html"})
+    >>> headers[CONTENT_TYPE]
+    'text/html'
+    >>> CONTENT_TYPE in headers
+    True
+    """
+
+    __slots__ = ('normalized_key',)
+
+    def __init__(self, normalized_key: str) -> None:
+        """Wrap the already normalized *normalized_key*."""
+        self.normalized_key = normalized_key
+
+    def __repr__(self) -> str:
+        return f'CaselessKey({self.normalized_key!r})'
+
+    def __str__(self) -> str:
+        return self.normalized_key
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CaselessKey):
+            return self.normalized_key == other.normalized_key
+        return self.normalized_key == other
+
+    def __hash__(self) -> int:
+        return hash(self.normalized_key)
+
+    def __reduce__(self) -> Tuple[Callable, Tuple[str]]:
+        """Pickle as the normalized *str*, which every dictionary accepts."""
+        return str, (self.normalized_key,)
+
+
+_KEY_TYPES: Dict[Tuple[Callable, ...], Type[CaselessKey]] = {}
+
+
+def caseless_key_type(
+    modifiers: Optional[Iterable[Callable]], name: str = 'CaselessKey'
+) -> Type[CaselessKey]:
+    """Return the `CaselessKey` subclass for the chain of key *modifiers*.
+
+    Classes with the same key modifiers share the same subclass, so their
+    keys can be used with each other.
+
+    Args:
+        modifiers: The key modifiers of the caseless dictionary class.
+        name: The name of the subclass if it has to be created.
+
+    Returns:
+        The `CaselessKey` subclass of the *modifiers*.
+    """
+    chain = tuple(modifiers or ())
+    try:
+        return _KEY_TYPES[chain]
+    except KeyError:
+        key_type = type(name, (CaselessKey,), {'__slots__': ()})
+        _KEY_TYPES[chain] = key_type
+        return key_type
+    except TypeError:  # The chain has unhashable modifiers.
+        return type(name, (CaselessKey,), {'__slots__': ()})
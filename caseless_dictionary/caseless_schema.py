@@ -0,0 +1,427 @@
+"""
+Compact records of rows which share the same keys.
+
+Tables, CSV files and JSON APIs produce many rows with the same columns. As
+caseless dictionaries every row has its own hash table and normalizes the
+same header again. A `CaselessSchema` normalizes the header once and creates
+records which only hold a list of their values; the keys and the index from
+key to position are shared by every record of the schema, similar to the
+key-sharing dictionaries CPython uses for instance attributes.
+
+Records are mutable mappings with the same caseless lookups as the
+`caseless_class` of their schema. Keys which are not in the header are kept
+in a small dictionary created only when such a key is set. If the
+`caseless_class` is an attribute dictionary, such as `CaselessAttrDict`, the
+items of the records can also be accessed as attributes.
+
+Objects provided by this module:
+   `CaselessSchema` - Normalized header which creates records.
+   `CaselessRecord` - Base class of the records of a schema.
+   `CaselessAttrRecord` - Base class of the records with attribute access.
+"""
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from modifiable_items_dictionary.modifiable_items_attribute_dictionary import (
+    ModifiableItemsAttrDict,
+)
+from modifiable_items_dictionary.modifiable_items_dictionary import Key, Value
+
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
+from caseless_dictionary.caseless_dict import CaselessDict
+from caseless_dictionary.exceptions import CaselessKeyError
+
+# Marks the position of a key of the header which was deleted from a record.
+_MISSING: Any = object()
+
+
+class CaselessRecord(MutableMapping):
+    """
+    Mutable mapping of one row of a `CaselessSchema`.
+
+    Create records with the schema, which sets the class attributes of its
+    own subclass. A record holds a list of the values of the header keys and
+    a dictionary of any other keys, which is None until such a key is set.
+    """
+
+    __slots__ = ('_values', '_extra')
+    _values: List[Value]
+    _extra: Optional[Dict[Key, Value]]
+    _schema: 'CaselessSchema'
+    _index: Dict[Key, int]
+    _keys: Tuple[Key, ...]
+    _caseless_class: Type[BaseCaselessDict]
+
+    def __init__(self, *args: Any, **kwargs: Value) -> None:
+        """Initialize the record like a `dict`, every key is normalized."""
+        _set_values(self, [_MISSING] * len(self._keys))
+        _set_extra(self, None)
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, key: Key) -> Value:
+        normalized_key = self._caseless_class._normalize_key(key)
+        position = self._index.get(normalized_key)
+        if position is not None:
+            value = self._values[position]
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and normalized_key in self._extra:
+            return self._extra[normalized_key]
+        raise CaselessKeyError(normalized_key)
+
+    def __setitem__(self, key: Key, value: Value) -> None:
+        normalized_key = self._caseless_class._stored_key(key)
+        value = self._schema._modify_value(value)
+        position = self._index.get(normalized_key)
+        if position is not None:
+            self._values[position] = value
+        elif self._extra is None:
+            _set_extra(self, {normalized_key: value})
+        else:
+            self._extra[normalized_key] = value
+
+    def __delitem__(self, key: Key) -> None:
+        normalized_key = self._caseless_class._normalize_key(key)
+        position = self._index.get(normalized_key)
+        if position is not None:
+            if self._values[position] is not _MISSING:
+                self._values[position] = _MISSING
+                return
+        elif self._extra is not None and normalized_key in self._extra:
+            del self._extra[normalized_key]
+            return
+        raise CaselessKeyError(normalized_key)
+
+    def __contains__(self, key: Any) -> bool:
+        normalized_key = self._caseless_class._normalize_key(key)
+        position = self._index.get(normalized_key)
+        if position is not None:
+            return self._values[position] is not _MISSING
+        return self._extra is not None and normalized_key in self._extra
+
+    def __iter__(self) -> Iterator[Key]:
+        for key, value in zip(self._keys, self._values):
+            if value is not _MISSING:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        length = len(self._values) - self._values.count(_MISSING)
+        if self._extra is not None:
+            length += len(self._extra)
+        return length
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def get(self, key: Key, default: Value = None) -> Value:
+        """Return the value of the *key* if it is in the record, otherwise
+        the *default*."""
+        found, value = self.try_get(key)
+        return value if found else default
+
+    def try_get(self, key: Key) -> Tuple[bool, Value]:
+        """Look up the *key* without raising a *KeyError*.
+
+        Returns:
+            Tuple of if the *key* was found and its value, which is None if
+            it was not found.
+        """
+        # pylint: disable-next=protected-access
+        normalized_key = self._caseless_class._normalize_key(key)
+        position = self._index.get(normalized_key)
+        if position is not None:
+            value = self._values[position]
+            if value is not _MISSING:
+                return True, value
+        elif self._extra is not None and normalized_key in self._extra:
+            return True, self._extra[normalized_key]
+        return False, None
+
+    def clear(self) -> None:
+        """Remove every item of the record."""
+        self._values[:] = [_MISSING] * len(self._keys)
+        _set_extra(self, None)
+
+    def copy(self) -> 'CaselessRecord':
+        """Return a shallow copy of the record."""
+        record = _new_record(self.__class__, self._values.copy())
+        if self._extra is not None:
+            _set_extra(record, self._extra.copy())
+        return record
+
+    __copy__ = copy
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the schema, which pickles its header and caseless class,
+        with the values and the extra keys of the record. The class of the
+        record is created by the schema, so it cannot be pickled itself."""
+        values = self._values
+        missing = [
+            position
+            for position, value in enumerate(values)
+            if value is _MISSING
+        ]
+        if missing:
+            values = [None if value is _MISSING else value for value in values]
+        return _rebuild_record, (self._schema, values, missing, self._extra)
+
+    def to_caseless_dict(self) -> BaseCaselessDict:
+        """Return a new dictionary of the `caseless_class` of the schema
+        with the items of the record."""
+        caseless_dict = self._caseless_class()
+        dict.update(caseless_dict, self.items())
+        return caseless_dict
+
+
+class CaselessAttrRecord(CaselessRecord):
+    """
+    `CaselessRecord` whose items can also be accessed as attributes.
+
+    Schemas of attribute dictionaries, such as `CaselessAttrDict`, create
+    subclasses of this class.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError as error:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute "
+                f"'{name}'."
+            ) from error
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        try:
+            del self[name]
+        except KeyError as error:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute "
+                f"'{name}'."
+            ) from error
+
+
+# The slots are set through their descriptors, which bypasses the
+# `__setattr__` of `CaselessAttrRecord`.
+_set_values = vars(CaselessRecord)['_values'].__set__
+_set_extra = vars(CaselessRecord)['_extra'].__set__
+
+
+def _rebuild_record(
+    schema: 'CaselessSchema',
+    values: List[Value],
+    missing: List[int],
+    extra: Optional[Dict[Key, Value]],
+) -> CaselessRecord:
+    """Create a record of the *schema* which was pickled with the *values*
+    of its header keys, the positions of the keys which were *missing*, and
+    its *extra* keys."""
+    for position in missing:
+        values[position] = _MISSING
+    record = _new_record(schema.record_class, values)
+    _set_extra(record, extra)
+    return record
+
+
+def _new_record(
+    record_class: Type[CaselessRecord], values: List[Value]
+) -> CaselessRecord:
+    """Create a record of *record_class* which holds the list of *values*
+    without calling `__init__`."""
+    record = record_class.__new__(record_class)
+    _set_values(record, values)
+    _set_extra(record, None)
+    return record
+
+
+class CaselessSchema:
+    """
+    Header of keys, normalized once, shared by many compact records.
+
+    Example:
+    >>> from caseless_dictionary import SnakeCaselessAttrDict
+    >>> header = ["User ID", "First Name"]
+    >>> schema = CaselessSchema(header, SnakeCaselessAttrDict)
+    >>> schema.keys
+    ('user_id', 'first_name')
+    >>> record = schema([1, "Ada"])
+    >>> record
+    {'user_id': 1, 'first_name': 'Ada'}
+    >>> record["USER ID"], record.first_name
+    (1, 'Ada')
+    >>> record["Last Name"] = "Lovelace"
+    >>> len(record)
+    3
+    >>> schema.from_mapping({"First Name": "Grace", "User ID": 2})
+    {'user_id': 2, 'first_name': 'Grace'}
+
+    Args:
+        header: The keys shared by the records.
+        caseless_class: The caseless dictionary class whose key modifiers,
+            value modifiers and `key_is_str_only` the records use.
+
+    Raises:
+        ValueError: If two keys of the *header* are equal after they are
+            normalized.
+        TypeError: If `key_is_str_only` of the *caseless_class* is True and
+            a key of the *header* is not a str.
+    """
+
+    __slots__ = (
+        'caseless_class',
+        'keys',
+        'record_class',
+        '_header',
+        '_index',
+        '_header_index',
+        '_modify_value',
+    )
+
+    def __init__(
+        self,
+        header: Iterable[Key],
+        caseless_class: Type[BaseCaselessDict] = CaselessDict,
+    ) -> None:
+        header = list(header)
+        if caseless_class.key_is_str_only:
+            for key in header:
+                # pylint: disable-next=protected-access
+                caseless_class._validate_key(key)
+        keys = tuple(caseless_class.normalize_many(header))
+        index = {key: position for position, key in enumerate(keys)}
+        if len(index) != len(keys):
+            raise ValueError(
+                'Keys collide after normalization: ',
+                [key for key in keys if keys.count(key) > 1][0],
+            )
+
+        self.caseless_class = caseless_class
+        self.keys = keys
+        self._header = tuple(header)
+        self._index = index
+        # The original spelling of the header skips normalizing the keys of
+        # mappings which use it, as most rows of a table do.
+        self._header_index = {
+            key: position
+            for position, key in enumerate(header)
+            if key.__class__ is str
+        }
+        self._modify_value = _value_modifier(caseless_class)
+
+        if issubclass(caseless_class, ModifiableItemsAttrDict):
+            base: Type[CaselessRecord] = CaselessAttrRecord
+        else:
+            base = CaselessRecord
+        self.record_class: Type[CaselessRecord] = type(
+            f'{caseless_class.__name__}Record',
+            (base,),
+            {
+                '__slots__': (),
+                '__module__': base.__module__,
+                '_schema': self,
+                '_index': index,
+                '_keys': keys,
+                '_caseless_class': caseless_class,
+            },
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}({list(self.keys)!r}, '
+            f'{self.caseless_class.__name__})'
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the original header, so its keys are normalized once."""
+        return self.__class__, (self._header, self.caseless_class)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self.keys)
+
+    def __call__(self, values: Iterable[Value]) -> CaselessRecord:
+        """Create a record from the *values* of the header keys in order.
+
+        Raises:
+            ValueError: If there is not one value for every key.
+        """
+        if self._modify_value is _identity:
+            _values = list(values)
+        else:
+            _values = list(map(self._modify_value, values))
+        if len(_values) != len(self.keys):
+            raise ValueError(
+                'Expected ',
+                len(self.keys),
+                'values, not ',
+                len(_values),
+            )
+        return _new_record(self.record_class, _values)
+
+    def records(
+        self, rows: Iterable[Iterable[Value]]
+    ) -> Iterator[CaselessRecord]:
+        """Create a record from every row of values in header order.
+
+        Example:
+            >>> schema = CaselessSchema(["Name", "Age"])
+            >>> list(schema.records([("Ada", 36), ("Grace", 85)]))
+            [{'name': 'Ada', 'age': 36}, {'name': 'Grace', 'age': 85}]
+
+        Returns:
+            Iterator of the records, created as the *rows* are consumed.
+        """
+        return map(self, rows)
+
+    def from_mapping(self, mapping: Mapping[Key, Value]) -> CaselessRecord:
+        """Create a record from the items of the *mapping*.
+
+        Keys spelled exactly like the header are not normalized again. Keys
+        which are not in the header are kept in the record's extra keys.
+        """
+        values: List[Value] = [_MISSING] * len(self.keys)
+        record = _new_record(self.record_class, values)
+        header_index = self._header_index
+        modify_value = self._modify_value
+        for key, value in mapping.items():
+            position = header_index.get(key) if key.__class__ is str else None
+            if position is None:
+                record[key] = value
+            else:
+                values[position] = modify_value(value)
+        return record
+
+
+def _value_modifier(
+    caseless_class: Type[BaseCaselessDict],
+) -> Callable[[Value], Value]:
+    """Return a function which applies the value modifiers of the
+    *caseless_class*."""
+    # pylint: disable=protected-access
+    if not caseless_class._value_modifiers:
+        return _identity
+    return caseless_class._stored_value
+
+
+def _identity(value: Value) -> Value:
+    """Return the *value* unchanged."""
+    return value
@@ -0,0 +1,171 @@
+"""
+Read-only caseless view of an existing mapping.
+
+Wrapping a mapping in a caseless dictionary copies it and normalizes every
+key up front, which is wasted work when only a few keys are looked up. A
+`CaselessView` keeps a reference to the mapping and builds its index of
+normalized keys lazily: a lookup which is not in the index yet normalizes
+the keys of the mapping, starting from the most recently inserted one, only
+until it finds the key.
+
+Objects provided by this module:
+   `CaselessView` - Lazily indexed read-only caseless view of a mapping.
+"""
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from modifiable_items_dictionary.modifiable_items_dictionary import Key, Value
+
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
+from caseless_dictionary.caseless_dict import CaselessDict
+from caseless_dictionary.exceptions import CaselessKeyError
+
+# Returned by `CaselessView._find_key` when the key is not in the mapping.
+_MISSING: Any = object()
+# The unindexed keys of a view whose keys are all indexed in order.
+_INDEXED: Iterable[Key] = ()
+
+
+class CaselessView(Mapping):
+    """
+    Read-only mapping which looks up the keys of a *mapping* with the key
+    modifiers of a caseless dictionary class, without copying it.
+
+    The view has the same items as the *caseless_class* created from the
+    *mapping*: when several keys are equal after they are normalized, the
+    most recently inserted one wins. Mappings which can not be reversed,
+    unlike `dict`, are indexed completely by the first lookup which misses
+    the index. Iterating the view or taking its length also indexes every
+    key.
+
+    Like iterating a `dict`, the *mapping* must not be changed while the view
+    is used.
+
+    Example:
+    >>> headers = {"Content-Type": "text/html", "X-Request-ID": "42"}
+    >>> view = CaselessView(headers)
+    >>> view["CONTENT-TYPE"]
+    'text/html'
+    >>> "x-request-id" in view
+    True
+    >>> view
+    CaselessView({'content-type': 'text/html', 'x-request-id': '42'})
+
+    Args:
+        mapping: The mapping which will be viewed.
+        caseless_class: The caseless dictionary class whose key modifiers
+            normalize the keys.
+    """
+
+    __slots__ = (
+        'mapping',
+        'caseless_class',
+        '_normalize_key',
+        '_index',
+        '_unindexed_keys',
+    )
+
+    def __init__(
+        self,
+        mapping: Mapping[Key, Value],
+        caseless_class: Type[BaseCaselessDict] = CaselessDict,
+    ) -> None:
+        self.mapping = mapping
+        self.caseless_class = caseless_class
+        # pylint: disable-next=protected-access
+        self._normalize_key = caseless_class._normalize_key
+        # Normalized key to the key of the mapping.
+        self._index: Dict[Key, Key] = {}
+        # None if the mapping can not be reversed.
+        self._unindexed_keys: Optional[Iterable[Key]] = None
+        if getattr(type(mapping), '__reversed__', None) is not None:
+            self._unindexed_keys = reversed(mapping)
+
+    def _find_key(self, normalized_key: Key) -> Key:
+        """Return the key of the mapping whose normalized key is the
+        *normalized_key*, indexing keys until it is found.
+
+        Returns:
+            The key of the mapping or `_MISSING`.
+        """
+        index = self._index
+        key = index.get(normalized_key, _MISSING)
+        if key is not _MISSING:
+            return key
+        if self._unindexed_keys is None:
+            self._index_all()
+            return self._index.get(normalized_key, _MISSING)
+
+        normalize_key = self._normalize_key
+        for key in self._unindexed_keys:
+            _normalized_key = normalize_key(key)
+            # Keys are indexed from the last inserted one, which wins.
+            if _normalized_key not in index:
+                index[_normalized_key] = key
+                if _normalized_key == normalized_key:
+                    return key
+        return _MISSING
+
+    def _index_all(self) -> None:
+        """Index every key of the mapping in the order of the mapping."""
+        if self._unindexed_keys is not _INDEXED:
+            keys = list(self.mapping)
+            self._index = dict(
+                zip(self.caseless_class.normalize_many(keys), keys)
+            )
+            self._unindexed_keys = _INDEXED
+
+    def __getitem__(self, key: Key) -> Value:
+        normalized_key = self._normalize_key(key)
+        mapping_key = self._find_key(normalized_key)
+        if mapping_key is _MISSING:
+            raise CaselessKeyError(normalized_key)
+        return self.mapping[mapping_key]
+
+    def __contains__(self, key: Any) -> bool:
+        normalized_key = self._normalize_key(key)
+        return self._find_key(normalized_key) is not _MISSING
+
+    def __iter__(self) -> Iterator[Key]:
+        self._index_all()
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        self._index_all()
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self.items())!r})'
+
+    def get(self, key: Key, default: Value = None) -> Value:
+        """Return the value of the *key* if it is in the view, otherwise the
+        *default*."""
+        mapping_key = self._find_key(self._normalize_key(key))
+        if mapping_key is _MISSING:
+            return default
+        return self.mapping[mapping_key]
+
+    def try_get(self, key: Key) -> Tuple[bool, Value]:
+        """Look up the *key* without raising a *KeyError*.
+
+        Returns:
+            Tuple of if the *key* was found and its value, which is None if
+            it was not found.
+        """
+        mapping_key = self._find_key(self._normalize_key(key))
+        if mapping_key is _MISSING:
+            return False, None
+        return True, self.mapping[mapping_key]
+
+    def to_caseless_dict(self) -> BaseCaselessDict:
+        """Return a new dictionary of the `caseless_class` with the items of
+        the mapping."""
+        return self.caseless_class.from_items(self.mapping)
@@ -0,0 +1,234 @@
+"""
+Caseless dictionary which can be shared by threads.
+
+Every single key operation of a caseless dictionary normalizes the key and
+then makes one call to a `dict` method, which is atomic. Operations which
+look a key up and then change the dictionary depending on the result are
+not: two threads may both compute the value of a missing key, and a batch
+of keys may be changed by another thread while it is checked. On
+free-threaded builds of Python nothing serializes them.
+
+`ConcurrentCaselessDict` guards changes with striped locks: the normalized
+key's hash picks one of `lock_stripes` locks, so threads which change
+different keys rarely wait for each other. Lookups take no lock, and no
+lock is held while code outside of the dictionary runs, so a factory of
+`get_or_compute` which waits for another thread cannot deadlock with it.
+
+Objects provided by this module:
+   `ConcurrentCaselessDict` - Caseless dictionary with striped locks.
+"""
+import threading
+from concurrent.futures import Future
+from contextlib import ExitStack
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+)
+
+from modifiable_items_dictionary.modifiable_items_dictionary import (
+    NO_DEFAULT,
+    Key,
+    Value,
+)
+
+from caseless_dictionary.caseless_dict import CaselessDict
+
+# Returned by `dict.get` when the key is not in the dictionary.
+_MISSING: Any = object()
+
+
+class ConcurrentCaselessDict(CaselessDict):
+    """
+    Case-insensitive Dictionary class whose keys are case-folded and whose
+    changes are serialized by striped locks.
+
+    Setting, inserting and removing a key holds the lock of its stripe.
+    Operations on a batch of keys, like `update`, `pop_many` and `clear`,
+    hold the locks of every stripe, so they are atomic with respect to the
+    changes of single keys. Lookups take no lock.
+
+    `get_or_compute` calls its *factory* at most once for a missing key,
+    without holding any lock: the other threads which ask for the key wait
+    for its result instead. The *factory* may use the dictionary, except
+    to compute the same key again.
+
+    Example:
+    >>> counters = ConcurrentCaselessDict({"Requests": 0})
+    >>> counters.get_or_compute("ERRORS", lambda key: 0)
+    0
+    >>> counters
+    {'requests': 0, 'errors': 0}
+    """
+
+    __slots__ = ('_locks', '_computing')
+    # Number of locks of every dictionary.
+    lock_stripes = 16
+    _locks: Tuple[Any, ...]
+    # The thread computing each key of `get_or_compute`, and the future of
+    # its value.
+    _computing: Dict[Key, Tuple[int, Future]]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> 'ConcurrentCaselessDict':
+        caseless_dict = super().__new__(cls, *args, **kwargs)
+        caseless_dict._locks = tuple(
+            threading.RLock() for _ in range(cls.lock_stripes)
+        )
+        caseless_dict._computing = {}
+        return caseless_dict
+
+    def _lock_for(self, key: Key) -> Any:
+        """Return the lock of the stripe of the normalized *key*."""
+        return self._locks[hash(key) % len(self._locks)]
+
+    def _lock_all(self) -> ExitStack:
+        """Return a context manager which holds the locks of every stripe."""
+        stack = ExitStack()
+        with stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            return stack.pop_all()
+
+    def __setitem__(self, key: Key, value: Value) -> None:
+        """Set the value of the modified *key* to the modified *value*."""
+        key = self._modify_stored_key(key)
+        value = self._modify_value(value)
+        with self._lock_for(key):
+            dict.__setitem__(self, key, value)
+
+    def setdefault(self, key: Key, default: Value = None) -> Value:
+        """Insert the modified *key* with the modified *default* if the key
+        is not in the dictionary.
+
+        Returns:
+            The value of the *key*, which is the same for every thread which
+            inserts it.
+        """
+        key = self._modify_stored_key(key)
+        default = self._modify_value(default)
+        with self._lock_for(key):
+            return dict.setdefault(self, key, default)
+
+    def get_or_compute(
+        self, key: Key, factory: Callable[[Key], Value]
+    ) -> Value:
+        """Return the value of the *key*, inserting the modified result of
+        the *factory* first if the key is not in the dictionary.
+
+        The *factory* runs without holding any lock. Other threads which ask
+        for the key meanwhile wait for its result, or for its exception. If
+        the key is set while the *factory* runs, that value is kept and
+        returned instead.
+
+        Example:
+            >>> lengths = ConcurrentCaselessDict()
+            >>> lengths.get_or_compute("Some Key", len)
+            8
+            >>> lengths.get_or_compute("SOME KEY", len)
+            8
+
+        Args:
+            key: The key which will be looked up.
+            factory: Called with the normalized *key* to compute its value,
+                at most once while the key is missing.
+
+        Returns:
+            The value of the *key*.
+
+        Raises:
+            RuntimeError: If the *factory* asks for the key it computes.
+        """
+        key = self._modify_stored_key(key)
+        value = dict.get(self, key, _MISSING)
+        if value is not _MISSING:
+            return value
+        thread_id = threading.get_ident()
+        with self._lock_for(key):
+            value = dict.get(self, key, _MISSING)
+            if value is not _MISSING:
+                return value
+            computing_thread_id, future = self._computing.setdefault(
+                key, (thread_id, Future())
+            )
+        if computing_thread_id != thread_id:
+            return future.result()
+        if future.running():
+            raise RuntimeError(f'Key is already being computed: {key!r}')
+        future.set_running_or_notify_cancel()
+        try:
+            value = self._modify_value(factory(key))
+        except BaseException as error:
+            with self._lock_for(key):
+                del self._computing[key]
+            future.set_exception(error)
+            raise
+        with self._lock_for(key):
+            value = dict.setdefault(self, key, value)
+            del self._computing[key]
+        future.set_result(value)
+        return value
+
+    def __delitem__(self, key: Key) -> None:
+        key = self._modify_key(key)
+        with self._lock_for(key):
+            dict.__delitem__(self, key)
+
+    def pop(self, key: Key, default: Value = NO_DEFAULT) -> Value:
+        """Remove the *key* and return its value, or the *default* if the
+        key is not in the dictionary.
+
+        Raises:
+            KeyError: If the *key* is missing and there is no *default*.
+        """
+        key = self._modify_key(key)
+        with self._lock_for(key):
+            if default is NO_DEFAULT:
+                return dict.pop(self, key)
+            return dict.pop(self, key, default)
+
+    def popitem(self) -> Tuple[Key, Value]:
+        """Remove and return the last inserted (key, value) pair."""
+        with self._lock_all():
+            return dict.popitem(self)
+
+    def clear(self) -> None:
+        """Remove every item of the dictionary."""
+        with self._lock_all():
+            dict.clear(self)
+
+    def update(self, __m: Any = None, **kwargs: Value) -> None:
+        """Update the dictionary with the items of a mapping or an iterable
+        of (key, value) pairs and the *kwargs*, holding every lock."""
+        with self._lock_all():
+            super().update(__m, **kwargs)
+
+    def set_many(
+        self,
+        iterable: Union[Mapping[Key, Value], Iterable[Tuple[Key, Value]]],
+    ) -> None:
+        """Set a batch of items whose keys are normalized in one batch, or
+        one item at a time if the class overrides `_modify_key` or
+        `_modify_value`, holding every lock."""
+        items: Iterable[Tuple[Key, Value]]
+        if self._has_item_hooks:
+            if isinstance(iterable, Mapping):
+                iterable = iterable.items()
+            items = list(map(self._modify_key_and_item, iterable))
+        else:
+            items = zip(*self._modify_items(iterable))
+        with self._lock_all():
+            dict.update(self, items)
+
+    def pop_many(
+        self, keys: Iterable[Key], default: Value = NO_DEFAULT
+    ) -> List[Value]:
+        """Remove a batch of *keys* and return their values, holding every
+        lock, so no key is removed by another thread while they are checked.
+        """
+        with self._lock_all():
+            return super().pop_many(keys, default)
@@ -0,0 +1,37 @@
+"""
+Exceptions raised by the caseless dictionaries.
+
+Objects provided by this module:
+   `CaselessKeyError` - *KeyError* of a key missing from a caseless mapping.
+"""
+from typing import Any
+
+
+class CaselessKeyError(KeyError):
+    """
+    *KeyError* raised when no case variant of a key is in a caseless
+    dictionary, view or record.
+
+    Like the *KeyError* of a `dict`, the only argument is the missing key,
+    as normalized by the dictionary. The message is only formatted when the
+    error is converted to a *str*, so raising and catching the error costs
+    no more than a plain *KeyError*.
+
+    Example:
+    >>> from caseless_dictionary import CaselessDict
+    >>> try:
+    ...     CaselessDict()["Some Key"]
+    ... except KeyError as error:
+    ...     print(error.key, "|", error)
+    some key | Missing key of some case variant of 'some key'
+    """
+
+    __slots__ = ()
+
+    @property
+    def key(self) -> Any:
+        """The missing key."""
+        return self.args[0] if self.args else None
+
+    def __str__(self) -> str:
+        return f'Missing key of some case variant of {self.key!r}'
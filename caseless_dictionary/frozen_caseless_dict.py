@@ -0,0 +1,297 @@
+"""
+Read-only caseless mapping with a compact representation.
+
+A `dict` stores a hash, a key and a value for every entry, in a table
+which is kept at most two thirds full, plus an index of the entries. A
+lookup table which is never changed after it is built does not need the
+spare room. A `FrozenCaselessDict` keeps its normalized keys and their
+values in two tuples, and finds the position of a key with an
+open-addressing index: an `array` of positions whose item size is the
+smallest which can hold the number of keys, so a table of fewer than 256
+keys uses one byte per slot. The index is probed in Python, so a lookup
+takes about twice as long as a lookup of a caseless dictionary.
+
+Objects provided by this module:
+   `FrozenCaselessDict` - Immutable, hashable and compact caseless mapping.
+"""
+import copyreg
+from array import array
+from typing import (
+    Any,
+    Callable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    ValuesView,
+)
+
+from modifiable_items_dictionary.modifiable_items_dictionary import Key, Value
+
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
+from caseless_dictionary.caseless_dict import CaselessDict
+from caseless_dictionary.exceptions import CaselessKeyError
+
+# Hashes are probed as unsigned 64-bit integers, like `dict` does.
+_HASH_MASK = (1 << 64) - 1
+# Slots of the index which are empty; positions are stored one higher.
+_EMPTY = 0
+# Item types of the index, from the smallest.
+_INDEX_TYPECODES = 'BHIQ'
+
+
+def _index_size(length: int) -> int:
+    """Return the number of slots of the index of *length* keys: the
+    smallest power of two which keeps the index at most two thirds full."""
+    size = 1
+    while size * 2 < length * 3:
+        size *= 2
+    return size
+
+
+def _index_typecode(length: int) -> str:
+    """Return the smallest item type of the index which can hold the
+    positions of *length* keys."""
+    for typecode in _INDEX_TYPECODES[:-1]:
+        if length < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    return _INDEX_TYPECODES[-1]
+
+
+def _build_index(keys: Tuple[Key, ...]) -> array:
+    """Return the open-addressing index of the *keys*, which must not have
+    duplicates."""
+    size = _index_size(len(keys))
+    typecode = _index_typecode(len(keys))
+    index = array(typecode, bytes(size * array(typecode).itemsize))
+    mask = size - 1
+    for position, key in enumerate(keys, 1):
+        perturb = hash(key) & _HASH_MASK
+        slot = perturb & mask
+        while index[slot] != _EMPTY:
+            perturb >>= 5
+            slot = (slot * 5 + perturb + 1) & mask
+        index[slot] = position
+    return index
+
+
+class FrozenCaselessDict(Mapping):
+    """
+    Immutable mapping which normalizes its keys with the key modifiers of a
+    caseless dictionary class and stores them compactly.
+
+    The mapping has the same items, in the same order, as the
+    *caseless_class* created from the same items. Like a `frozenset`, it is
+    hashable if its values are, so it can be used as a key of a cache. Its
+    hash is computed the first time it is needed and kept.
+
+    Example:
+    >>> from caseless_dictionary import UpperCaselessDict
+    >>> countries = FrozenCaselessDict(
+    ...     {"de": "Germany", "fr": "France"}, UpperCaselessDict
+    ... )
+    >>> countries["De"]
+    'Germany'
+    >>> countries
+    FrozenCaselessDict({'DE': 'Germany', 'FR': 'France'})
+    >>> cache = {countries: "cached"}
+    >>> cache[FrozenCaselessDict(countries, UpperCaselessDict)]
+    'cached'
+
+    Args:
+        iterable: Mapping or iterable of (key, value) pairs.
+        caseless_class: The caseless dictionary class whose key modifiers
+            normalize the keys.
+    """
+
+    __slots__ = (
+        'caseless_class',
+        '_normalize_key',
+        '_keys',
+        '_values',
+        '_index',
+        '_hash',
+    )
+    caseless_class: Type[BaseCaselessDict]
+    _normalize_key: Callable[[Any], Key]
+    _keys: Tuple[Key, ...]
+    _values: Tuple[Value, ...]
+    _index: array
+    _hash: Optional[int]
+
+    def __init__(
+        self,
+        iterable: Optional[
+            Union[Mapping[Key, Value], Iterable[Tuple[Key, Value]]]
+        ] = None,
+        caseless_class: Type[BaseCaselessDict] = CaselessDict,
+    ) -> None:
+        items = {}
+        if iterable is not None:
+            # pylint: disable-next=protected-access
+            items = dict(zip(*caseless_class._modify_items(iterable)))
+        self.__setstate__(
+            (caseless_class, tuple(items), tuple(items.values()))
+        )
+
+    def __setstate__(
+        self,
+        state: Tuple[
+            Type[BaseCaselessDict], Tuple[Key, ...], Tuple[Value, ...]
+        ],
+    ) -> None:
+        """Set the caseless class, the normalized keys and their values, and
+        build the index of the keys.
+
+        Raises:
+            TypeError: If the mapping is already initialized.
+        """
+        if hasattr(self, '_hash'):
+            raise TypeError('Cannot change a frozen mapping: ', self)
+        caseless_class, keys, values = state
+        set_attribute = object.__setattr__
+        set_attribute(self, 'caseless_class', caseless_class)
+        # pylint: disable-next=protected-access
+        set_attribute(self, '_normalize_key', caseless_class._normalize_key)
+        set_attribute(self, '_keys', keys)
+        set_attribute(self, '_values', values)
+        set_attribute(self, '_index', _build_index(keys))
+        set_attribute(self, '_hash', None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError(
+            'Cannot change the attribute of a frozen mapping: ', name
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise TypeError(
+            'Cannot delete the attribute of a frozen mapping: ', name
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the caseless class, the normalized keys and their values.
+        The index is built again when they are unpickled, because the
+        hashes of *str* keys differ between processes."""
+        new_object = copyreg.__newobj__  # type: ignore[attr-defined]
+        return (
+            new_object,
+            (self.__class__,),
+            (self.caseless_class, self._keys, self._values),
+        )
+
+    def _position(self, key: Key) -> int:
+        """Return the position of the normalized *key*, or -1 if it is not
+        in the mapping."""
+        keys = self._keys
+        index = self._index
+        mask = len(index) - 1
+        perturb = hash(key) & _HASH_MASK
+        slot = perturb & mask
+        while True:
+            position = index[slot]
+            if position == _EMPTY:
+                return -1
+            stored_key = keys[position - 1]
+            if stored_key is key or stored_key == key:
+                return position - 1
+            perturb >>= 5
+            slot = (slot * 5 + perturb + 1) & mask
+
+    def __getitem__(self, key: Key) -> Value:
+        key = self._normalize_key(key)
+        position = self._position(key)
+        if position < 0:
+            raise CaselessKeyError(key)
+        return self._values[position]
+
+    def __contains__(self, key: Any) -> bool:
+        return self._position(self._normalize_key(key)) >= 0
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self.items())!r})'
+
+    def __hash__(self) -> int:
+        hash_value = self._hash
+        if hash_value is None:
+            hash_value = hash(frozenset(zip(self._keys, self._values)))
+            object.__setattr__(self, '_hash', hash_value)
+        return hash_value
+
+    def __eq__(self, other: Any) -> bool:
+        if (
+            isinstance(other, FrozenCaselessDict)
+            and self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+        return super().__eq__(other)
+
+    def get(self, key: Key, default: Value = None) -> Value:
+        """Return the value of the *key* if it is in the mapping, otherwise
+        the *default*."""
+        position = self._position(self._normalize_key(key))
+        if position < 0:
+            return default
+        return self._values[position]
+
+    def try_get(self, key: Key) -> Tuple[bool, Value]:
+        """Look up the *key* without raising a *KeyError*.
+
+        Returns:
+            Tuple of if the *key* was found and its value, which is None if
+            it was not found.
+        """
+        position = self._position(self._normalize_key(key))
+        if position < 0:
+            return False, None
+        return True, self._values[position]
+
+    def items(self) -> ItemsView[Key, Value]:
+        return _FrozenItemsView(self)
+
+    def values(self) -> ValuesView[Value]:
+        return _FrozenValuesView(self)
+
+    def to_caseless_dict(self) -> BaseCaselessDict:
+        """Return a new dictionary of the `caseless_class` with the items of
+        the mapping, without normalizing the keys again."""
+        caseless_dict = self.caseless_class.__new__(self.caseless_class)
+        dict.update(caseless_dict, zip(self._keys, self._values))
+        return caseless_dict
+
+
+# pylint: disable-next=too-few-public-methods
+class _FrozenItemsView(ItemsView):
+    """Items of a `FrozenCaselessDict`, iterated without looking every key
+    up again."""
+
+    __slots__ = ()
+    _mapping: FrozenCaselessDict
+
+    def __iter__(self) -> Iterator[Tuple[Key, Value]]:
+        # pylint: disable-next=protected-access
+        return zip(self._mapping._keys, self._mapping._values)
+
+
+# pylint: disable-next=too-few-public-methods
+class _FrozenValuesView(ValuesView):
+    """Values of a `FrozenCaselessDict`, iterated without looking every key
+    up again."""
+
+    __slots__ = ()
+    _mapping: FrozenCaselessDict
+
+    def __iter__(self) -> Iterator[Value]:
+        # pylint: disable-next=protected-access
+        return iter(self._mapping._values)
@@ -0,0 +1,179 @@
+"""
+Load JSON documents into caseless dictionaries.
+
+Loading a document with `json.load` and wrapping every object in a caseless
+dictionary afterwards builds each object twice: once as a `dict` and once
+as a caseless dictionary. The functions of this module give the decoder an
+`object_pairs_hook` which builds every JSON object directly as a caseless
+dictionary, with `from_items`, so its keys are normalized in one batch and
+inserted with one `dict.update`.
+
+Objects provided by this module:
+   `loads` - Load a JSON document from a string.
+   `load` - Load a JSON document from a file.
+   `iterload` - Load the records of a newline-delimited JSON file one by one.
+"""
+import functools
+import json
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    Union,
+)
+
+from caseless_dictionary.base_caseless_dict import (
+    ON_COLLISION_LAST,
+    BaseCaselessDict,
+    _validate_on_collision,
+)
+from caseless_dictionary.caseless_dict import CaselessDict
+
+
+def _object_pairs_hook(
+    caseless_class: Type[BaseCaselessDict], on_collision: str
+) -> Callable[[List[Tuple[str, Any]]], BaseCaselessDict]:
+    """Return the hook which builds a JSON object as a dictionary of the
+    *caseless_class*.
+
+    Raises:
+        ValueError: If *on_collision* is not a valid policy.
+    """
+    _validate_on_collision(on_collision)
+    return functools.partial(
+        caseless_class.from_items, on_collision=on_collision
+    )
+
+
+def loads(
+    document: Union[str, bytes],
+    caseless_class: Type[BaseCaselessDict] = CaselessDict,
+    on_collision: str = ON_COLLISION_LAST,
+    **kwargs: Any,
+) -> Any:
+    """Load a JSON document whose objects are built as dictionaries of the
+    *caseless_class*.
+
+    Example:
+        >>> from caseless_dictionary import SnakeCaselessAttrDict
+        >>> config = loads(
+        ...     '{"Server Name": "web", "Ports": [{"Port Number": 80}]}',
+        ...     SnakeCaselessAttrDict,
+        ... )
+        >>> config.server_name
+        'web'
+        >>> config.ports[0]["PORT NUMBER"]
+        80
+
+    Args:
+        document: The JSON document.
+        caseless_class: The caseless dictionary class of the JSON objects.
+        on_collision: How to resolve keys of an object which are equal
+            after they are normalized, as by `from_items`.
+        **kwargs: Other arguments of `json.loads`, like *parse_float*.
+
+    Returns:
+        The decoded document.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+        ValueError: If *on_collision* is not a valid policy, or it is
+            'raise' and two keys of an object collide.
+    """
+    return json.loads(
+        document,
+        object_pairs_hook=_object_pairs_hook(caseless_class, on_collision),
+        **kwargs,
+    )
+
+
+def load(
+    file: IO[Any],
+    caseless_class: Type[BaseCaselessDict] = CaselessDict,
+    on_collision: str = ON_COLLISION_LAST,
+    **kwargs: Any,
+) -> Any:
+    """Load the JSON document of a file whose objects are built as
+    dictionaries of the *caseless_class*.
+
+    Args:
+        file: Text or binary file with a `read` method.
+        caseless_class: The caseless dictionary class of the JSON objects.
+        on_collision: How to resolve keys of an object which are equal
+            after they are normalized, as by `from_items`.
+        **kwargs: Other arguments of `json.loads`, like *parse_float*.
+
+    Returns:
+        The decoded document.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+        ValueError: If *on_collision* is not a valid policy, or it is
+            'raise' and two keys of an object collide.
+    """
+    return loads(file.read(), caseless_class, on_collision, **kwargs)
+
+
+def iterload(
+    lines: Iterable[Union[str, bytes]],
+    caseless_class: Type[BaseCaselessDict] = CaselessDict,
+    on_collision: str = ON_COLLISION_LAST,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Load the records of newline-delimited JSON one by one, without
+    reading the whole file.
+
+    Every line which is not blank is one JSON document whose objects are
+    built as dictionaries of the *caseless_class*. One decoder decodes
+    every line.
+
+    Example:
+        >>> records = ['{"User ID": 1}', "", '{"USER id": 2}']
+        >>> [record["user id"] for record in iterload(records)]
+        [1, 2]
+
+    Args:
+        lines: Text or binary file, or other iterable of lines. Binary lines
+            must be UTF-8.
+        caseless_class: The caseless dictionary class of the JSON objects.
+        on_collision: How to resolve keys of an object which are equal
+            after they are normalized, as by `from_items`.
+        **kwargs: Other arguments of `json.JSONDecoder`, like *parse_float*.
+
+    Returns:
+        Iterator of the decoded record of every line which is not blank.
+
+    Raises:
+        json.JSONDecodeError: If a line is not valid JSON. Its message
+            names the line, counted from one.
+        ValueError: If *on_collision* is not a valid policy, or it is
+            'raise' and two keys of an object collide.
+    """
+    decode = json.JSONDecoder(
+        object_pairs_hook=_object_pairs_hook(caseless_class, on_collision),
+        **kwargs,
+    ).decode
+    return _decode_lines(lines, decode)
+
+
+def _decode_lines(
+    lines: Iterable[Union[str, bytes]], decode: Callable[[str], Any]
+) -> Iterator[Any]:
+    """Decode every line of the *lines* which is not blank."""
+    for line_number, line in enumerate(lines, 1):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        if not line.strip():
+            continue
+        try:
+            record = decode(line)
+        except json.JSONDecodeError as error:
+            raise json.JSONDecodeError(
+                f'{error.msg} on line {line_number}', error.doc, error.pos
+            ) from error
+        yield record
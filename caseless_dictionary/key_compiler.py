@@ -0,0 +1,384 @@
+"""
+Compile a chain of key modifiers into one specialized function.
+
+`ModifiableItemsDict` applies its `_key_modifiers` one by one through a
+generic loop which checks the type of the modifiers on every key operation.
+The caseless dictionaries instead compile the chain once, when the class is
+created, into a single function.
+
+Case functions from `caseless_dictionary.cases` are inlined as *str* method
+calls, so a chain such as `[snake_case]` becomes::
+
+    def normalize_key(key):
+        if isinstance(key, str):
+            return key.strip().replace(' ', '_').casefold()
+        return key
+
+Consecutive case functions are fused into one expression. `str.strip` and
+`str.replace` return the key itself when there is nothing to change, so a
+key only allocates a new string for the steps that change it. Any other
+modifier is called as is.
+
+Functions:
+    as_modifier_list(modifiers) -> List[Callable[[Any], Hashable]]:
+        Convert the key modifiers of a class to a list.
+
+    compile_key_modifiers(modifiers, key_type) -> Callable[[Any], Hashable]:
+        Compile the key modifiers into a single function.
+
+    compile_normalize_many(modifiers, key_type) -> Callable[[Iterable], List]:
+        Compile the key modifiers into a function for a batch of keys.
+
+    str_key_expression(modifiers) -> Tuple[str, Dict[str, Any]]:
+        Return an expression which applies the key modifiers to a str key.
+
+    preserves_normalized_keys(modifiers, normalized_by) -> bool:
+        Return if the key modifiers leave already normalized keys unchanged.
+"""
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from caseless_dictionary.caseless_key import CaselessKey
+from caseless_dictionary.cases import (
+    case_fold,
+    upper,
+    lower,
+    title,
+    snake_case,
+    kebab_case,
+    constant_case,
+    normalize_many,
+)
+
+KeyModifier = Callable[[Any], Hashable]
+
+# Expressions equivalent to the case functions for a *str* key.
+STR_EXPRESSIONS: Dict[Callable, str] = {
+    case_fold: '{}.strip().casefold()',
+    upper: '{}.strip().upper()',
+    lower: '{}.strip().lower()',
+    snake_case: "{}.strip().replace(' ', '_').casefold()",
+    kebab_case: "{}.strip().replace(' ', '-').casefold()",
+    constant_case: "{}.strip().replace(' ', '_').upper()",
+}
+
+# Case functions which can normalize a whole batch with `normalize_many`.
+BATCH_CASE_FUNCTIONS = frozenset((*STR_EXPRESSIONS, title))
+# Smallest batch of keys normalized by `normalize_many`.
+MIN_BATCH_SIZE = 16
+# Smallest batch of keys which the batch lookups of the caseless
+# dictionaries normalize before looking them up. Smaller batches normalize
+# every key in the loop which looks it up, which saves building the list of
+# normalized keys and is faster than `normalize_many` up to a few dozen keys.
+MIN_LOOKUP_BATCH_SIZE = 64
+
+# Case functions mapped to the case functions whose keys they leave
+# unchanged, verified for every Unicode code point. `title` is missing as
+# it does not even leave its own keys unchanged: "ǰa" becomes "J̌a" and then
+# "J̌A".
+PRESERVED_CASES: Dict[Callable, FrozenSet[Callable]] = {
+    case_fold: frozenset((case_fold, snake_case, kebab_case)),
+    upper: frozenset((upper, constant_case)),
+    lower: frozenset((lower,)),
+    snake_case: frozenset((snake_case, kebab_case)),
+    kebab_case: frozenset((snake_case, kebab_case)),
+    constant_case: frozenset((constant_case,)),
+}
+
+
+def _identity(key: Any) -> Any:
+    """Return the *key* unchanged."""
+    return key
+
+
+def as_modifier_list(
+    modifiers: Optional[Union[KeyModifier, Iterable[KeyModifier]]]
+) -> List[KeyModifier]:
+    """Convert the *modifiers* to a list the same way `ModifiableItemsDict`
+    interprets them.
+
+    Raises:
+        TypeError: If the *modifiers* are a *str*, or neither callable nor
+            iterable.
+    """
+    if not modifiers:
+        return []
+    if isinstance(modifiers, str):
+        raise TypeError(
+            'Invalid Modifiers:', modifiers, 'Can not be of types', (str,)
+        )
+    if isinstance(modifiers, Iterable):
+        return list(modifiers)
+    if callable(modifiers):
+        return [modifiers]
+    raise TypeError(
+        'Invalid Modifiers:',
+        modifiers,
+        'must be of types:',
+        (Iterable, Callable),
+    )
+
+
+def _group_modifiers(modifiers: List[KeyModifier]) -> List[Any]:
+    """Group consecutive inlinable modifiers into one *str* expression.
+
+    Returns:
+        List where every item is either a *str* expression of the variable
+        `key` or a modifier which has to be called.
+    """
+    groups: List[Any] = []
+    for modifier in modifiers:
+        expression = STR_EXPRESSIONS.get(modifier)
+        if expression is None:
+            groups.append(modifier)
+        elif groups and isinstance(groups[-1], str):
+            groups[-1] = expression.format(groups[-1])
+        else:
+            groups.append(expression.format('key'))
+    return groups
+
+
+def _generate_source(groups: List[Any], has_key_type: bool) -> List[str]:
+    """Generate the body of the normalize function for the *groups*."""
+    lines = []
+    if has_key_type:
+        lines.append('    if key.__class__ is _key_type:')
+        lines.append('        return key.normalized_key')
+
+    if len(groups) == 1 and isinstance(groups[0], str):
+        lines.append('    if isinstance(key, str):')
+        lines.append(f'        return {groups[0]}')
+        if has_key_type:
+            # Keys of other modifiers are normalized again from their str.
+            lines.append('    if isinstance(key, _caseless_key):')
+            lines.append('        return normalize_key(key.normalized_key)')
+        lines.append('    return key')
+        return lines
+
+    if has_key_type:
+        lines.append('    if isinstance(key, _caseless_key):')
+        lines.append('        key = key.normalized_key')
+    for index, group in enumerate(groups):
+        if isinstance(group, str):
+            lines.append('    if isinstance(key, str):')
+            lines.append(f'        key = {group}')
+        else:
+            lines.append(f'    key = _modifier_{index}(key)')
+    lines.append('    return key')
+    return lines
+
+
+def compile_key_modifiers(
+    modifiers: Optional[Union[KeyModifier, Iterable[KeyModifier]]],
+    key_type: Optional[type] = None,
+) -> KeyModifier:
+    """Compile the key *modifiers* into a single function.
+
+    When a *key_type* is given, keys of exactly that type are pre-normalized
+    keys (see `caseless_dictionary.caseless_key`) and their
+    `normalized_key` is returned without running the modifiers. Any other
+    `CaselessKey` is normalized from its `normalized_key`.
+
+    Example:
+        >>> normalize_key = compile_key_modifiers([snake_case])
+        >>> normalize_key("  Some Word ")
+        'some_word'
+        >>> normalize_key(2)
+        2
+        >>> compile_key_modifiers(None)("  Not Modified ")
+        '  Not Modified '
+
+    Args:
+        modifiers: A key modifier, an iterable of key modifiers or None.
+        key_type: The `CaselessKey` subclass of the *modifiers* or None.
+
+    Returns:
+        A function which applies every modifier in order to a key.
+    """
+    _modifiers = as_modifier_list(modifiers)
+    if not _modifiers:
+        return _identity
+
+    groups = _group_modifiers(_modifiers)
+    has_key_type = key_type is not None
+    if (
+        len(groups) == 1
+        and not isinstance(groups[0], str)
+        and not has_key_type
+    ):
+        return groups[0]
+
+    namespace: Dict[str, Any] = {
+        f'_modifier_{index}': group
+        for index, group in enumerate(groups)
+        if not isinstance(group, str)
+    }
+    namespace['_key_type'] = key_type
+    namespace['_caseless_key'] = CaselessKey
+    source = '\n'.join(
+        [
+            'def normalize_key(key):',
+            *_generate_source(groups, has_key_type),
+        ]
+    )
+    # pylint: disable-next=exec-used
+    exec(source, namespace)  # nosec - the source is built from literals
+    normalize_key: KeyModifier = namespace['normalize_key']
+    normalize_key.__qualname__ = normalize_key.__name__
+    return normalize_key
+
+
+def compile_normalize_many(
+    modifiers: Optional[Union[KeyModifier, Iterable[KeyModifier]]],
+    key_type: Optional[type] = None,
+) -> Callable[[Iterable[Any]], List[Hashable]]:
+    """Compile the key *modifiers* into a function which normalizes a batch
+    of keys.
+
+    Chains made only of case functions from `caseless_dictionary.cases` use
+    `caseless_dictionary.cases.normalize_many` for batches of at least
+    `MIN_BATCH_SIZE` keys, below which joining and splitting the batch costs
+    more than it saves. Smaller batches are normalized in a list
+    comprehension with the modifiers inlined for *str* keys, and other
+    chains map the compiled key modifiers over the keys.
+
+    Example:
+        >>> normalize_keys = compile_normalize_many([snake_case])
+        >>> normalize_keys(["  Some Word ", 2])
+        ['some_word', 2]
+
+    Args:
+        modifiers: A key modifier, an iterable of key modifiers or None.
+        key_type: The `CaselessKey` subclass of the *modifiers* or None.
+
+    Returns:
+        A function which returns a list of the normalized keys.
+    """
+    _modifiers = as_modifier_list(modifiers)
+    normalize_key = compile_key_modifiers(_modifiers, key_type)
+    if _modifiers and BATCH_CASE_FUNCTIONS.issuperset(_modifiers):
+        case_functions = tuple(_modifiers)
+        normalize_few = _compile_normalize_few(_modifiers, normalize_key)
+
+        def normalize_keys(keys: Iterable[Any]) -> List[Hashable]:
+            _keys = list(keys)
+            if len(_keys) < MIN_BATCH_SIZE:
+                return normalize_few(_keys)
+            return normalize_many(
+                _keys, *case_functions, normalize_key=normalize_key
+            )
+
+        return normalize_keys
+
+    def map_normalize_key(keys: Iterable[Any]) -> List[Hashable]:
+        return list(map(normalize_key, keys))
+
+    return map_normalize_key
+
+
+def _compile_normalize_few(
+    modifiers: List[KeyModifier], normalize_key: KeyModifier
+) -> Callable[[List[Any]], List[Hashable]]:
+    """Compile a function which normalizes a small batch of keys with the
+    key *modifiers* inlined for *str* keys, like the generated key methods,
+    and *normalize_key* for any other key::
+
+        def normalize_few(keys):
+            return [
+                key.strip().casefold() if key.__class__ is str
+                else _normalize_other(key)
+                for key in keys
+            ]
+    """
+    expression, namespace = str_key_expression(modifiers)
+    namespace['_normalize_other'] = normalize_key
+    source = '\n'.join(
+        [
+            'def normalize_few(keys):',
+            f'    return [{expression} if key.__class__ is str',
+            '            else _normalize_other(key) for key in keys]',
+        ]
+    )
+    # pylint: disable-next=exec-used
+    exec(source, namespace)  # nosec - the source is built from literals
+    normalize_few: Callable[[List[Any]], List[Hashable]] = namespace[
+        'normalize_few'
+    ]
+    normalize_few.__qualname__ = normalize_few.__name__
+    return normalize_few
+
+
+def str_key_expression(
+    modifiers: Optional[Union[KeyModifier, Iterable[KeyModifier]]]
+) -> Tuple[str, Dict[str, Any]]:
+    """Return a Python expression which applies the key *modifiers* to the
+    variable `key`, whose value is known to be a *str*.
+
+    Inlined case functions skip their type check and other modifiers are
+    called by name. A case function which follows another modifier needs
+    the type check again, so such chains call the compiled key modifiers
+    instead.
+
+    Example:
+        >>> str_key_expression([snake_case])[0]
+        "key.strip().replace(' ', '_').casefold()"
+        >>> str_key_expression([title])[0]
+        '_modifier_0(key)'
+
+    Returns:
+        Tuple of the expression and the namespace of the names it uses.
+    """
+    _modifiers = as_modifier_list(modifiers)
+    expression = 'key'
+    namespace: Dict[str, Any] = {}
+    for index, group in enumerate(_group_modifiers(_modifiers)):
+        if not isinstance(group, str):
+            namespace[f'_modifier_{index}'] = group
+            expression = f'_modifier_{index}({expression})'
+        elif index:
+            namespace = {'_normalize_key': compile_key_modifiers(_modifiers)}
+            return '_normalize_key(key)', namespace
+        else:
+            expression = group
+    return expression, namespace
+
+
+def preserves_normalized_keys(
+    modifiers: Sequence[KeyModifier], normalized_by: Sequence[KeyModifier]
+) -> bool:
+    """Return if the key *modifiers* leave keys which were normalized by the
+    key modifiers *normalized_by* unchanged.
+
+    This is the case when both chains are equal, or every modifier is a case
+    function which preserves the keys of the single case function of
+    *normalized_by*.
+
+    Example:
+        >>> preserves_normalized_keys([case_fold], [snake_case])
+        True
+        >>> preserves_normalized_keys([snake_case], [case_fold])
+        False
+
+    Args:
+        modifiers: The key modifiers which would be applied to the keys.
+        normalized_by: The key modifiers which normalized the keys.
+    """
+    if tuple(modifiers) == tuple(normalized_by):
+        return True
+    if len(normalized_by) != 1:
+        return False
+    source = normalized_by[0]
+    return all(
+        source in PRESERVED_CASES.get(modifier, ()) for modifier in modifiers
+    )
@@ -0,0 +1,103 @@
+"""
+List which wraps its nested dictionaries in a caseless dictionary class
+when they are read.
+
+A caseless dictionary whose `deep` option is True wraps a nested *dict* or
+*list* value the first time it is read, and keeps the wrapper in place of
+the value. A nested *list* is wrapped in a `LazyCaselessList`, which wraps
+its own items the same way, so only the branches of a large document which
+are read are normalized.
+
+Objects provided by this module:
+   `LazyCaselessList` - List which wraps its nested items when they are read.
+   `wrap_nested` - Wrap a plain *dict* or *list* for a caseless class.
+"""
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Tuple, Type, Union
+
+if TYPE_CHECKING:
+    from caseless_dictionary.base_caseless_dict import BaseCaselessDict
+
+# Classes of the values which are wrapped; subclasses, such as caseless
+# dictionaries, are kept as they are.
+NESTED_TYPES = (dict, list)
+
+
+def wrap_nested(value: Any, caseless_class: 'Type[BaseCaselessDict]') -> Any:
+    """Wrap a plain *dict* in the *caseless_class* and a plain *list* in a
+    `LazyCaselessList`, and return any other *value* as it is.
+
+    Example:
+        >>> from caseless_dictionary import CaselessDict
+        >>> wrap_nested({"Some Key": [{"A": 1}]}, CaselessDict)
+        {'some key': [{'A': 1}]}
+        >>> wrap_nested([{"A": 1}], CaselessDict)[0]
+        {'a': 1}
+    """
+    if value.__class__ is dict:
+        return caseless_class.from_items(value)
+    if value.__class__ is list:
+        return LazyCaselessList(value, caseless_class)
+    return value
+
+
+class LazyCaselessList(list):
+    """
+    List which wraps a plain *dict* or *list* item with `wrap_nested` the
+    first time it is read by index, slice or iteration, and keeps the
+    wrapper in place of the item.
+
+    Other list methods, such as `pop`, return the items as they are stored.
+
+    Example:
+    >>> from caseless_dictionary import CaselessDict
+    >>> items = LazyCaselessList([{"Name": "a"}, [{"Name": "b"}]], CaselessDict)
+    >>> items[0]["NAME"]
+    'a'
+    >>> items[1][0]["NAME"]
+    'b'
+    >>> items
+    [{'name': 'a'}, [{'name': 'b'}]]
+
+    Args:
+        iterable: The items of the list.
+        caseless_class: The caseless dictionary class of the nested
+            dictionaries.
+    """
+
+    __slots__ = ('caseless_class',)
+
+    def __init__(
+        self,
+        iterable: Iterable[Any],
+        caseless_class: 'Type[BaseCaselessDict]',
+    ) -> None:
+        super().__init__(iterable)
+        self.caseless_class = caseless_class
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the items as they are stored, without wrapping them."""
+        return (
+            self.__class__,
+            (list(list.__iter__(self)), self.caseless_class),
+        )
+
+    def _wrap(self, index: int, value: Any) -> Any:
+        """Wrap the item at the *index* and keep the wrapper in its
+        place."""
+        value = wrap_nested(value, self.caseless_class)
+        list.__setitem__(self, index, value)
+        return value
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[item] for item in range(*index.indices(len(self)))]
+        value = list.__getitem__(self, index)
+        if value.__class__ in NESTED_TYPES:
+            value = self._wrap(index, value)
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        for index, value in enumerate(list.__iter__(self)):
+            if value.__class__ in NESTED_TYPES:
+                value = self._wrap(index, value)
+            yield value
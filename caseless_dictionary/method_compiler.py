@@ -0,0 +1,283 @@
+"""
+Generate the key methods of a caseless dictionary class.
+
+The key methods of `BaseCaselessDict`, such as `__getitem__`, normalize the
+key by calling the `_modify_key` hook of the class. When a subclass
+is created, `compile_methods` generates its own version of every method,
+with the key modifiers inlined for *str* keys, so a subclass which only
+sets `_key_modifiers` runs the same code a hand-written class would::
+
+    def __getitem__(self, key):
+        if type(self) is _owner:
+            if key.__class__ is str:
+                return _getitem(self, key.strip().casefold())
+            if key.__class__ is _key_type:
+                return _getitem(self, key.normalized_key)
+        return _getitem(self, self._modify_key(key))
+
+A `CaselessKey` of the key modifiers of the class, `_key_type`, is looked up
+by its normalized key without calling any key modifier. Any other key,
+including a subclass of *str*, takes the last branch. So does an instance
+of a subclass of `_owner`, the class the method was generated for, which
+reaches the method through `super()` from a method the subclass defines
+itself and may have other key modifiers. Only
+methods marked with `specializable` are replaced, so a method a subclass
+defines itself is kept. A subclass which overrides `_modify_key` or
+`_modify_value` keeps the methods of `BaseCaselessDict`, which call them
+for every key and value. If the `deep` option of the class is True, the
+generated `__getitem__` and `get` also wrap the nested values they return.
+
+`_get_few`, `_contains_few` and `_set_few` handle the batches of
+`get_many`, `contains_many` and `set_many` with fewer than
+`MIN_LOOKUP_BATCH_SIZE` keys, in one list comprehension with the key
+modifiers inlined.
+
+Functions:
+    specializable(method) -> Callable:
+        Mark a method which the generated methods may replace.
+
+    is_specializable(method) -> bool:
+        Return if the generated methods may replace a method.
+
+    compile_methods(owner, modifiers) -> Dict[str, Callable]:
+        Generate the key methods of a class for its key modifiers.
+"""
+import sys
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar, Union
+
+from modifiable_items_dictionary.modifiable_items_dictionary import (
+    NO_DEFAULT,
+)
+
+from caseless_dictionary.key_compiler import KeyModifier, str_key_expression
+from caseless_dictionary.lazy_list import NESTED_TYPES
+
+FunctionT = TypeVar('FunctionT', bound=Callable)
+
+# Names of the methods which `compile_methods` generates.
+SPECIALIZED_METHODS = (
+    '__getitem__',
+    '__setitem__',
+    '__delitem__',
+    '__contains__',
+    'get',
+    'pop',
+    'setdefault',
+    '_get_few',
+    '_contains_few',
+    '_set_few',
+)
+
+# `{key}` is replaced by the expression which normalizes a str `key`.
+_METHODS_SOURCE = """
+def __getitem__(self, key):
+    if type(self) is _owner:
+        if key.__class__ is str:
+            return _getitem(self, {key})
+        if key.__class__ is _key_type:
+            return _getitem(self, key.normalized_key)
+    return _getitem(self, self._modify_key(key))
+
+def __contains__(self, key):
+    if type(self) is _owner:
+        if key.__class__ is str:
+            return _contains(self, {key})
+        if key.__class__ is _key_type:
+            return _contains(self, key.normalized_key)
+    return _contains(self, self._modify_key(key))
+
+def get(self, key, default=None):
+    if type(self) is _owner:
+        if key.__class__ is str:
+            return _get(self, {key}, default)
+        if key.__class__ is _key_type:
+            return _get(self, key.normalized_key, default)
+    return _get(self, self._modify_key(key), default)
+
+def __delitem__(self, key):
+    if type(self) is not _owner:
+        _delitem(self, self._modify_key(key))
+    elif key.__class__ is str:
+        _delitem(self, {key})
+    elif key.__class__ is _key_type:
+        _delitem(self, key.normalized_key)
+    else:
+        _delitem(self, self._modify_key(key))
+
+def pop(self, key, default=_NO_DEFAULT):
+    if type(self) is not _owner:
+        key = self._modify_key(key)
+    elif key.__class__ is str:
+        key = {key}
+    elif key.__class__ is _key_type:
+        key = key.normalized_key
+    else:
+        key = self._modify_key(key)
+    if default is _NO_DEFAULT:
+        return _pop(self, key)
+    return _pop(self, key, default)
+
+def __setitem__(self, key, value):
+    if type(self) is not _owner:
+        _setitem(self, self._modify_stored_key(key), self._modify_value(value))
+        return
+    if key.__class__ is str:
+        key = {key}
+        if self.intern_keys:
+            key = _intern(key)
+    else:
+        key = self._modify_stored_key(key)
+    if self._value_modifiers:
+        value = self._modify_value(value)
+    _setitem(self, key, value)
+
+def setdefault(self, key, default=None):
+    if type(self) is not _owner:
+        return _setdefault(
+            self, self._modify_stored_key(key), self._modify_value(default)
+        )
+    if key.__class__ is str:
+        key = {key}
+        if self.intern_keys:
+            key = _intern(key)
+    else:
+        key = self._modify_stored_key(key)
+    if self._value_modifiers:
+        default = self._modify_value(default)
+    return _setdefault(self, key, default)
+
+def _get_few(self, keys, default):
+    if type(self) is not _owner:
+        return [_get(self, self._modify_key(key), default) for key in keys]
+    return [
+        _get(
+            self,
+            {key} if key.__class__ is str else self._modify_key(key),
+            default,
+        )
+        for key in keys
+    ]
+
+def _contains_few(self, keys):
+    if type(self) is not _owner:
+        return [_contains(self, self._modify_key(key)) for key in keys]
+    return [
+        _contains(self, {key} if key.__class__ is str else self._modify_key(key))
+        for key in keys
+    ]
+
+def _set_few(self, items):
+    if type(self) is not _owner or self.intern_keys or self._value_modifiers:
+        _update(self, list(map(self._modify_key_and_item, items)))
+        return
+    _update(
+        self,
+        [
+            (
+                {key} if key.__class__ is str
+                else self._modify_stored_key(key),
+                value,
+            )
+            for key, value in items
+        ],
+    )
+"""
+
+
+# Replaces `__getitem__` and `get` of a class whose `deep` option is True.
+_DEEP_METHODS_SOURCE = """
+def __getitem__(self, key):
+    if type(self) is not _owner:
+        key = self._modify_key(key)
+    elif key.__class__ is str:
+        key = {key}
+    elif key.__class__ is _key_type:
+        key = key.normalized_key
+    else:
+        key = self._modify_key(key)
+    value = _getitem(self, key)
+    if value.__class__ in _nested_types:
+        return self._wrap_nested(key, value)
+    return value
+
+def get(self, key, default=None):
+    if type(self) is not _owner:
+        key = self._modify_key(key)
+    elif key.__class__ is str:
+        key = {key}
+    elif key.__class__ is _key_type:
+        key = key.normalized_key
+    else:
+        key = self._modify_key(key)
+    value = _get(self, key, _MISSING)
+    if value is _MISSING:
+        return default
+    if value.__class__ in _nested_types:
+        return self._wrap_nested(key, value)
+    return value
+"""
+
+
+def specializable(method: FunctionT) -> FunctionT:
+    """Mark the *method* as one which the generated methods may replace."""
+    method.__caseless_specializable__ = True  # type: ignore[attr-defined]
+    return method
+
+
+def is_specializable(method: Any) -> bool:
+    """Return if the *method* was marked with `specializable` or was
+    generated by `compile_methods`."""
+    return getattr(method, '__caseless_specializable__', False)
+
+
+def compile_methods(
+    owner: type,
+    modifiers: Optional[Union[KeyModifier, Iterable[KeyModifier]]],
+) -> Dict[str, Callable]:
+    """Generate the key methods of the caseless dictionary class *owner*
+    whose key modifiers are *modifiers*.
+
+    The generated methods are marked with `specializable`, so the methods of
+    a subclass with other key modifiers replace them in turn.
+
+    Example:
+        >>> from caseless_dictionary import SnakeCaselessDict
+        >>> from caseless_dictionary.cases import snake_case
+        >>> methods = compile_methods(SnakeCaselessDict, [snake_case])
+        >>> sorted(methods) == sorted(SPECIALIZED_METHODS)
+        True
+
+    Returns:
+        Dictionary of the name of every method in `SPECIALIZED_METHODS` to
+        the generated function.
+    """
+    expression, namespace = str_key_expression(modifiers)
+    namespace.update(
+        {
+            '_getitem': dict.__getitem__,
+            '_setitem': dict.__setitem__,
+            '_delitem': dict.__delitem__,
+            '_contains': dict.__contains__,
+            '_get': dict.get,
+            '_pop': dict.pop,
+            '_setdefault': dict.setdefault,
+            '_update': dict.update,
+            '_intern': sys.intern,
+            '_NO_DEFAULT': NO_DEFAULT,
+            '_MISSING': object(),
+            '_nested_types': NESTED_TYPES,
+            '_owner': owner,
+            '_key_type': getattr(owner, '_key_type', None),
+        }
+    )
+    source = _METHODS_SOURCE
+    if getattr(owner, 'deep', False):
+        source += _DEEP_METHODS_SOURCE
+    # pylint: disable-next=exec-used
+    exec(source.replace('{key}', expression), namespace)  # nosec - literals
+    methods = {}
+    for name in SPECIALIZED_METHODS:
+        method = specializable(namespace[name])
+        method.__qualname__ = f'{owner.__qualname__}.{name}'
+        methods[name] = method
+    return methods
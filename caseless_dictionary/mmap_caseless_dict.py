@@ -0,0 +1,407 @@
+"""
+Read-only caseless mapping of a memory-mapped file.
+
+Every process which unpickles or builds the same large caseless dictionary
+pays for it at startup, and keeps its own copy of it in memory.
+`write_caseless_dict` writes a caseless dictionary to a file with a hash
+index of its normalized keys, and a `MmapCaselessDict` opens the file with
+`mmap`: opening it reads nothing but the header, a lookup normalizes the key
+with the key modifiers of the dictionary's class and probes the index in
+the mapped file, and the pages of the file are shared by every process
+which maps it.
+
+The keys are hashed with `zlib.crc32` of their UTF-8 encoding, which is the
+same in every process, so the normalized keys must be *str*. The values are
+pickled one by one and unpickled when they are looked up. Like a pickle,
+the file imports the caseless dictionary class it names, so only files
+from a trusted source must be opened.
+
+File format, in little-endian byte order:
+    Header: the magic bytes `CASELESS`, the format version (u16), the length
+        of the class path (u16), the number of slots of the index (u64) and
+        the number of entries (u64).
+    Class path: `module:qualified.name` of the caseless dictionary class,
+        encoded in UTF-8.
+    Index: the offset of the entry of every slot (u64), or 0 if the slot is
+        empty. Slots are probed like the index of `FrozenCaselessDict`.
+    Entries: the length of the key (u32), the length of the value (u32), the
+        UTF-8 encoded key and the pickled value, in the order of the
+        dictionary.
+
+Objects provided by this module:
+   `write_caseless_dict` - Write a caseless dictionary to a file.
+   `MmapCaselessDict` - Caseless mapping of a memory-mapped file.
+"""
+import importlib
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from typing import (
+    Any,
+    ItemsView,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    Type,
+    Union,
+    ValuesView,
+)
+from zlib import crc32
+
+from modifiable_items_dictionary.modifiable_items_dictionary import Key, Value
+
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
+from caseless_dictionary.exceptions import CaselessKeyError
+from caseless_dictionary.frozen_caseless_dict import _index_size
+
+MAGIC = b'CASELESS'
+VERSION = 1
+_HEADER = struct.Struct('<8sHHQQ')
+_SLOT = struct.Struct('<Q')
+_ENTRY = struct.Struct('<II')
+
+PathLike = Union[str, 'os.PathLike[str]']
+
+
+def _class_path(caseless_class: Type[BaseCaselessDict]) -> str:
+    """Return the `module:qualified.name` path of the *caseless_class*.
+
+    Raises:
+        ValueError: If the class can not be imported from its path.
+    """
+    path = f'{caseless_class.__module__}:{caseless_class.__qualname__}'
+    if '<locals>' in path or _import_class(path) is not caseless_class:
+        raise ValueError('Caseless class can not be imported: ', path)
+    return path
+
+
+def _import_class(path: str) -> Any:
+    """Return the object at the `module:qualified.name` *path*."""
+    module_name, _, qualified_name = path.partition(':')
+    obj: Any = importlib.import_module(module_name)
+    for name in qualified_name.split('.'):
+        obj = getattr(obj, name)
+    return obj
+
+
+def write_caseless_dict(
+    path: PathLike, caseless_dict: BaseCaselessDict
+) -> None:
+    """Write the *caseless_dict* to the file at *path*, which
+    `MmapCaselessDict` opens.
+
+    The keys are written as they are, without normalizing them again. The
+    file is written next to the *path* first and then replaces it, so a
+    process which opens the *path* never sees a partly written file.
+
+    Example:
+        >>> import os, tempfile
+        >>> from caseless_dictionary import CaselessDict
+        >>> path = os.path.join(tempfile.mkdtemp(), "table.caseless")
+        >>> write_caseless_dict(path, CaselessDict({"Some Key": 1}))
+        >>> with MmapCaselessDict(path) as table:
+        ...     table["SOME KEY"]
+        1
+
+    Args:
+        path: The path of the file.
+        caseless_dict: The caseless dictionary which will be written.
+
+    Raises:
+        TypeError: If a key is not a *str*.
+        ValueError: If the class of the *caseless_dict* can not be imported.
+    """
+    class_path = _class_path(type(caseless_dict)).encode()
+    slot_count = _index_size(len(caseless_dict))
+    index, entries = _encode_entries(
+        caseless_dict,
+        slot_count,
+        _HEADER.size + len(class_path) + slot_count * _SLOT.size,
+    )
+
+    temporary_path = f'{os.fspath(path)}.{os.getpid()}.tmp'
+    try:
+        with open(temporary_path, 'wb') as file:
+            file.write(
+                _HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    len(class_path),
+                    slot_count,
+                    len(caseless_dict),
+                )
+            )
+            file.write(class_path)
+            file.write(index.tobytes())
+            file.writelines(entries)
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+
+def _encode_entries(
+    caseless_dict: BaseCaselessDict, slot_count: int, offset: int
+) -> Tuple[array, List[bytes]]:
+    """Encode the items of the *caseless_dict*, whose first entry starts at
+    the *offset* of the file, and index them in *slot_count* slots.
+
+    Returns:
+        Tuple of the index, in little-endian byte order, and the parts of
+        the entries.
+
+    Raises:
+        TypeError: If a key is not a *str*.
+    """
+    index = array('Q', bytes(slot_count * _SLOT.size))
+    mask = slot_count - 1
+    entries = []
+    for key, value in dict.items(caseless_dict):
+        if not isinstance(key, str):
+            raise TypeError('Key must be a str, not ', type(key).__name__)
+        key_bytes = key.encode()
+        value_bytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        perturb = crc32(key_bytes)
+        slot = perturb & mask
+        while index[slot]:
+            perturb >>= 5
+            slot = (slot * 5 + perturb + 1) & mask
+        index[slot] = offset
+        entries.append(_ENTRY.pack(len(key_bytes), len(value_bytes)))
+        entries.append(key_bytes)
+        entries.append(value_bytes)
+        offset += _ENTRY.size + len(key_bytes) + len(value_bytes)
+    if sys.byteorder == 'big':
+        index.byteswap()
+    return index, entries
+
+
+class MmapCaselessDict(Mapping):
+    """
+    Read-only mapping of a file written by `write_caseless_dict`, whose keys
+    are looked up with the key modifiers of the class of the written
+    dictionary.
+
+    The file stays open until `close` is called, or the `with` block which
+    uses the mapping ends. A pickled mapping opens the same *path* again.
+
+    Example:
+    >>> import os, tempfile
+    >>> from caseless_dictionary import SnakeCaselessDict
+    >>> path = os.path.join(tempfile.mkdtemp(), "users.caseless")
+    >>> write_caseless_dict(path, SnakeCaselessDict({"User ID": [1, 2]}))
+    >>> users = MmapCaselessDict(path)
+    >>> users["USER ID"]
+    [1, 2]
+    >>> users.caseless_class.__name__
+    'SnakeCaselessDict'
+    >>> users.close()
+
+    Args:
+        path: The path of the file.
+
+    Raises:
+        ValueError: If the file is not a caseless dictionary file.
+    """
+
+    __slots__ = (
+        'path',
+        'caseless_class',
+        '_normalize_key',
+        '_mmap',
+        '_mask',
+        '_index_offset',
+        '_length',
+    )
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header = self._read_header()
+        except Exception:
+            self._mmap.close()
+            raise
+        self.caseless_class, slot_count, self._length = header
+        # pylint: disable-next=protected-access
+        self._normalize_key = self.caseless_class._normalize_key
+        self._mask = slot_count - 1
+
+    def _read_header(self) -> Tuple[Type[BaseCaselessDict], int, int]:
+        """Read the header of the file and set the offset of the index.
+
+        Returns:
+            Tuple of the caseless dictionary class, the number of slots of
+            the index and the number of entries.
+
+        Raises:
+            ValueError: If the file is not a caseless dictionary file.
+        """
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError('Not a caseless dictionary file: ', self.path)
+        magic, version, path_length, slot_count, length = _HEADER.unpack_from(
+            self._mmap
+        )
+        if magic != MAGIC:
+            raise ValueError('Not a caseless dictionary file: ', self.path)
+        if version != VERSION:
+            raise ValueError('Unsupported file format version: ', version)
+        start = _HEADER.size
+        end = self._index_offset = start + path_length
+        class_path = bytes(self._mmap[start:end])
+        caseless_class = _import_class(class_path.decode())
+        if not (
+            isinstance(caseless_class, type)
+            and issubclass(caseless_class, BaseCaselessDict)
+        ):
+            raise ValueError('Not a caseless dictionary class: ', class_path)
+        return caseless_class, slot_count, length
+
+    def __enter__(self) -> 'MmapCaselessDict':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the memory map of the file."""
+        self._mmap.close()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the path of the file, which is opened again when it is
+        unpickled."""
+        return self.__class__, (self.path,)
+
+    def _find_entry(self, key: Key) -> int:
+        """Return the offset of the entry of the normalized *key*, or 0 if
+        it is not in the file."""
+        if not isinstance(key, str):
+            return 0
+        key_bytes = key.encode()
+        file = self._mmap
+        mask = self._mask
+        index_offset = self._index_offset
+        perturb = crc32(key_bytes)
+        slot = perturb & mask
+        while True:
+            (offset,) = _SLOT.unpack_from(file, index_offset + slot * 8)
+            if not offset:
+                return 0
+            key_length = _ENTRY.unpack_from(file, offset)[0]
+            start = offset + _ENTRY.size
+            end = start + key_length
+            if key_length == len(key_bytes) and file[start:end] == key_bytes:
+                return offset
+            perturb >>= 5
+            slot = (slot * 5 + perturb + 1) & mask
+
+    def _read_value(self, offset: int) -> Value:
+        """Return the unpickled value of the entry at the *offset*."""
+        key_length, value_length = _ENTRY.unpack_from(self._mmap, offset)
+        start = offset + _ENTRY.size + key_length
+        end = start + value_length
+        return pickle.loads(self._mmap[start:end])
+
+    def _iter_entries(self) -> Iterator[Tuple[int, int, int]]:
+        """Iterate the offsets of the key of every entry, of its value and of
+        its end, in the order of the file."""
+        file = self._mmap
+        offset = self._index_offset + (self._mask + 1) * _SLOT.size
+        for _ in range(self._length):
+            key_length, value_length = _ENTRY.unpack_from(file, offset)
+            key_start = offset + _ENTRY.size
+            value_start = key_start + key_length
+            offset = value_start + value_length
+            yield key_start, value_start, offset
+
+    def __getitem__(self, key: Key) -> Value:
+        key = self._normalize_key(key)
+        offset = self._find_entry(key)
+        if not offset:
+            raise CaselessKeyError(key)
+        return self._read_value(offset)
+
+    def __contains__(self, key: Any) -> bool:
+        return bool(self._find_entry(self._normalize_key(key)))
+
+    def __iter__(self) -> Iterator[Key]:
+        file = self._mmap
+        for key_start, value_start, _ in self._iter_entries():
+            yield file[key_start:value_start].decode()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path!r})'
+
+    def get(self, key: Key, default: Value = None) -> Value:
+        """Return the value of the *key* if it is in the file, otherwise the
+        *default*."""
+        offset = self._find_entry(self._normalize_key(key))
+        if not offset:
+            return default
+        return self._read_value(offset)
+
+    def try_get(self, key: Key) -> Tuple[bool, Value]:
+        """Look up the *key* without raising a *KeyError*.
+
+        Returns:
+            Tuple of if the *key* was found and its value, which is None if
+            it was not found.
+        """
+        offset = self._find_entry(self._normalize_key(key))
+        if not offset:
+            return False, None
+        return True, self._read_value(offset)
+
+    def items(self) -> ItemsView[Key, Value]:
+        return _MmapItemsView(self)
+
+    def values(self) -> ValuesView[Value]:
+        return _MmapValuesView(self)
+
+    def to_caseless_dict(self) -> BaseCaselessDict:
+        """Return a new dictionary of the `caseless_class` with the items of
+        the file, without normalizing the keys again."""
+        caseless_dict = self.caseless_class.__new__(self.caseless_class)
+        dict.update(caseless_dict, self.items())
+        return caseless_dict
+
+
+# pylint: disable-next=too-few-public-methods
+class _MmapItemsView(ItemsView):
+    """Items of a `MmapCaselessDict`, read in the order of the file."""
+
+    __slots__ = ()
+    _mapping: MmapCaselessDict
+
+    def __iter__(self) -> Iterator[Tuple[Key, Value]]:
+        # pylint: disable-next=protected-access
+        file = self._mapping._mmap
+        # pylint: disable-next=protected-access
+        for key_start, value_start, end in self._mapping._iter_entries():
+            yield (
+                file[key_start:value_start].decode(),
+                pickle.loads(file[value_start:end]),
+            )
+
+
+# pylint: disable-next=too-few-public-methods
+class _MmapValuesView(ValuesView):
+    """Values of a `MmapCaselessDict`, read in the order of the file."""
+
+    __slots__ = ()
+    _mapping: MmapCaselessDict
+
+    def __iter__(self) -> Iterator[Value]:
+        # pylint: disable-next=protected-access
+        file = self._mapping._mmap
+        # pylint: disable-next=protected-access
+        for _, value_start, end in self._mapping._iter_entries():
+            yield pickle.loads(file[value_start:end])
@@ -0,0 +1,74 @@
+"""
+Compile the paths of nested caseless dictionaries.
+
+`get_path`, `set_path` and `has_path` of the caseless dictionaries take a
+path such as ``"Database.Primary.Host"``, or a tuple of keys, to a value
+of nested dictionaries. Splitting a path and normalizing its keys costs
+more than walking the dictionaries, so every class compiles its paths with
+a parser from `compile_path_parser`, which keeps the parsed paths in a
+size-bounded least recently used (LRU) cache. A path which is looked up
+again skips straight to the walk.
+
+Functions:
+    compile_path_parser(normalize_key, separator, maxsize) -> Callable:
+        Return a cached parser of the paths of a caseless dictionary class.
+"""
+import functools
+from typing import Any, Callable, Hashable, Tuple, Union
+
+from caseless_dictionary.cache import DEFAULT_MAXSIZE
+
+DEFAULT_SEPARATOR = '.'
+
+# Every key of a path and the key normalized by the class which parsed it.
+ParsedPath = Tuple[Tuple[Hashable, Hashable], ...]
+Path = Union[str, Tuple[Hashable, ...]]
+
+
+def compile_path_parser(
+    normalize_key: Callable[[Any], Hashable],
+    separator: str = DEFAULT_SEPARATOR,
+    maxsize: int = DEFAULT_MAXSIZE,
+) -> Callable[[Path], ParsedPath]:
+    """Return a parser which splits a path into its keys and normalizes
+    them with *normalize_key*, keeping the *maxsize* most recently parsed
+    paths.
+
+    Example:
+        >>> from caseless_dictionary import SnakeCaselessDict
+        >>> parse_path = compile_path_parser(SnakeCaselessDict._normalize_key)
+        >>> parse_path("Database.Primary Host")
+        (('Database', 'database'), ('Primary Host', 'primary_host'))
+        >>> parse_path(("Servers", 0))
+        (('Servers', 'servers'), (0, 0))
+
+    Args:
+        normalize_key: The compiled key modifiers of the class.
+        separator: The separator of the keys of a *str* path.
+        maxsize: The maximum number of paths kept in the cache.
+
+    Returns:
+        Function which parses a *str* path, split on the *separator*, or a
+        tuple of keys, into a tuple of the (key, normalized key) pair of
+        every key.
+
+    Raises:
+        ValueError: If the *separator* is empty.
+    """
+    if not separator:
+        raise ValueError('separator must not be empty, not ', separator)
+
+    @functools.lru_cache(maxsize=maxsize)
+    def parse_path(path: Path) -> ParsedPath:
+        """Parse the *path* into the (key, normalized key) pair of every
+        key.
+
+        Raises:
+            ValueError: If the *path* has no keys.
+        """
+        keys = path.split(separator) if isinstance(path, str) else path
+        if not keys:
+            raise ValueError('Path must have at least one key, not ', path)
+        return tuple((key, normalize_key(key)) for key in keys)
+
+    return parse_path
@@ -0,0 +1,429 @@
+"""
+Caseless mutable mapping stored in an SQLite database.
+
+A table which is too large to keep in the memory of every process can be
+kept in a local SQLite file instead. A `PersistentCaselessDict` stores every
+item in a row whose primary key is the key normalized by the key modifiers
+of a caseless dictionary class, so a lookup in any case is one indexed
+query. The most recently used items are kept in a bounded least recently
+used (LRU) cache in front of the database, and changes are buffered and
+written in batches, each in one transaction. A mapping which is garbage
+collected, or still open when the interpreter exits, writes its buffered
+changes and closes the database.
+
+Objects provided by this module:
+   `PersistentCaselessDict` - Caseless mutable mapping of an SQLite table.
+"""
+import pickle
+import sqlite3
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Tuple,
+    Type,
+    Union,
+)
+
+from modifiable_items_dictionary.modifiable_items_dictionary import (
+    NO_DEFAULT,
+    Key,
+    Value,
+)
+
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
+from caseless_dictionary.caseless_dict import CaselessDict
+from caseless_dictionary.exceptions import CaselessKeyError
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_BATCH_SIZE = 1000
+# Types of normalized keys which SQLite stores, and compares, like Python.
+KEY_TYPES = (str, int, float, bytes)
+
+# Pending change of a key which was deleted.
+_DELETED: Any = object()
+# Returned by `OrderedDict.get` and `dict.get` when the key is missing.
+_MISSING: Any = object()
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS caseless_items'
+    ' (key PRIMARY KEY NOT NULL, value BLOB NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS caseless_metadata'
+    ' (name TEXT PRIMARY KEY, value TEXT NOT NULL)',
+)
+_SELECT_VALUE = 'SELECT value FROM caseless_items WHERE key = ?'
+# Keeps the rowid of an updated key, so keys are iterated in the order they
+# were first inserted, like the keys of a dict.
+_UPSERT = (
+    'INSERT INTO caseless_items (key, value) VALUES (?, ?)'
+    ' ON CONFLICT (key) DO UPDATE SET value = excluded.value'
+)
+_DELETE = 'DELETE FROM caseless_items WHERE key = ?'
+
+
+# pylint: disable-next=too-many-instance-attributes
+class PersistentCaselessDict(MutableMapping):
+    """
+    Mutable mapping which normalizes its keys with the key modifiers of a
+    caseless dictionary class and stores its items in an SQLite database.
+
+    The values are pickled. The normalized keys must be a *str*, an *int*, a
+    *float* or *bytes*. Changes are written when *batch_size* of them are
+    buffered, and by `flush`, `close` and the end of a `with` block, or when
+    the mapping is garbage collected or the interpreter exits without
+    closing it. Iterating the mapping, or taking its length, writes them
+    first. The
+    cache assumes no other connection changes the database while the
+    mapping is open.
+
+    Like a pickle, the database must come from a trusted source.
+
+    Example:
+    >>> settings = PersistentCaselessDict(":memory:")
+    >>> settings["Log Level"] = "debug"
+    >>> settings["LOG LEVEL"]
+    'debug'
+    >>> settings.update({"Max Connections": 10})
+    >>> dict(settings)
+    {'log level': 'debug', 'max connections': 10}
+    >>> settings.close()
+
+    Args:
+        path: The path of the SQLite database, or ":memory:".
+        caseless_class: The caseless dictionary class whose key modifiers
+            normalize the keys. A database must always be opened with the
+            same class.
+        cache_size: The number of recently used items kept in memory.
+        batch_size: The number of buffered changes which are written in
+            one transaction.
+
+    Raises:
+        ValueError: If the database was written with another
+            *caseless_class*, the *cache_size* is negative or the
+            *batch_size* is less than one.
+    """
+
+    __slots__ = (
+        'path',
+        'caseless_class',
+        'cache_size',
+        'batch_size',
+        '_normalize_key',
+        '_connection',
+        '_cache',
+        '_pending',
+        '_finalizer',
+        '__weakref__',
+    )
+
+    def __init__(
+        self,
+        path: str,
+        caseless_class: Type[BaseCaselessDict] = CaselessDict,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if cache_size < 0:
+            raise ValueError('cache_size must be at least 0, not ', cache_size)
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1, not ', batch_size)
+        self.path = path
+        self.caseless_class = caseless_class
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        # pylint: disable-next=protected-access
+        self._normalize_key = caseless_class._normalize_key
+        # Normalized key to value of the most recently used items, the most
+        # recent last.
+        self._cache: 'OrderedDict[Key, Value]' = OrderedDict()
+        # Normalized key to value, or `_DELETED`, of the buffered changes.
+        self._pending: Dict[Key, Value] = {}
+        self._connection = sqlite3.connect(path)
+        try:
+            self._create_schema()
+        except Exception:
+            self._connection.close()
+            raise
+        # Holds the connection and the buffered changes, but not the
+        # mapping, so the mapping can still be garbage collected.
+        self._finalizer = weakref.finalize(
+            self, _close, self._connection, self._pending
+        )
+
+    def _create_schema(self) -> None:
+        """Create the tables if the database is new, and check the caseless
+        class it was written with.
+
+        Raises:
+            ValueError: If the database was written with another class.
+        """
+        class_path = (
+            f'{self.caseless_class.__module__}:'
+            f'{self.caseless_class.__qualname__}'
+        )
+        # Readers do not block the writer, and a batch is synced to disk
+        # when the log is checkpointed rather than by every commit.
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        with self._connection as connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.execute(
+                'INSERT OR IGNORE INTO caseless_metadata VALUES (?, ?)',
+                ('caseless_class', class_path),
+            )
+            (stored_class_path,) = connection.execute(
+                'SELECT value FROM caseless_metadata'
+                " WHERE name = 'caseless_class'"
+            ).fetchone()
+        if stored_class_path != class_path:
+            raise ValueError(
+                'Database was written with another caseless class: ',
+                stored_class_path,
+            )
+
+    def __enter__(self) -> 'PersistentCaselessDict':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Write the buffered changes and close the database."""
+        self._finalizer()
+
+    def flush(self) -> None:
+        """Write the buffered changes in one transaction."""
+        _write_pending(self._connection, self._pending)
+
+    def _stored_key(self, key: Key) -> Key:
+        """Normalize a *key* which will be stored in the database.
+
+        Raises:
+            TypeError: If `key_is_str_only` is True and the key is not a str,
+                or the normalized key can not be stored in the database.
+        """
+        # pylint: disable-next=protected-access
+        key = self.caseless_class._stored_key(key)
+        if not isinstance(key, KEY_TYPES):
+            raise TypeError(
+                'Key must be a str, int, float or bytes, not ',
+                type(key).__name__,
+            )
+        return key
+
+    def _cache_value(self, key: Key, value: Value) -> None:
+        """Keep the *value* of the normalized *key* as the most recently
+        used item of the cache."""
+        cache = self._cache
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def _lookup(self, key: Key) -> Value:
+        """Return the value of the normalized *key*, or `_MISSING`."""
+        value = self._pending.get(key, _MISSING)
+        if value is not _MISSING:
+            return _MISSING if value is _DELETED else value
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self._cache.move_to_end(key)
+            return value
+        if not isinstance(key, KEY_TYPES):
+            return _MISSING
+        row = self._connection.execute(_SELECT_VALUE, (key,)).fetchone()
+        if row is None:
+            return _MISSING
+        value = pickle.loads(row[0])
+        self._cache_value(key, value)
+        return value
+
+    def _write(self, key: Key, value: Value) -> None:
+        """Buffer the change of the normalized *key* and write the buffered
+        changes if there are `batch_size` of them."""
+        self._pending[key] = value
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def __getitem__(self, key: Key) -> Value:
+        key = self._normalize_key(key)
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise CaselessKeyError(key)
+        return value
+
+    def __setitem__(self, key: Key, value: Value) -> None:
+        key = self._stored_key(key)
+        # pylint: disable-next=protected-access
+        value = self.caseless_class._stored_value(value)
+        if self.cache_size:
+            self._cache_value(key, value)
+        self._write(key, value)
+
+    def __delitem__(self, key: Key) -> None:
+        key = self._normalize_key(key)
+        if self._lookup(key) is _MISSING:
+            raise CaselessKeyError(key)
+        self._cache.pop(key, None)
+        self._write(key, _DELETED)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._lookup(self._normalize_key(key)) is not _MISSING
+
+    def __iter__(self) -> Iterator[Key]:
+        self.flush()
+        for (key,) in self._connection.execute(
+            'SELECT key FROM caseless_items ORDER BY rowid'
+        ):
+            yield key
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM caseless_items'
+        ).fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path!r})'
+
+    def get(self, key: Key, default: Value = None) -> Value:
+        """Return the value of the *key* if it is in the mapping, otherwise
+        the *default*."""
+        value = self._lookup(self._normalize_key(key))
+        if value is _MISSING:
+            return default
+        return value
+
+    def pop(self, key: Key, default: Value = NO_DEFAULT) -> Value:
+        """Remove the *key* and return its value, or the *default* if the
+        key is not in the mapping.
+
+        Raises:
+            CaselessKeyError: If the *key* is missing and there is no
+                *default*.
+        """
+        key = self._normalize_key(key)
+        value = self._lookup(key)
+        if value is _MISSING:
+            if default is NO_DEFAULT:
+                raise CaselessKeyError(key)
+            return default
+        self._cache.pop(key, None)
+        self._write(key, _DELETED)
+        return value
+
+    def clear(self) -> None:
+        """Remove every item of the mapping."""
+        self._pending.clear()
+        self._cache.clear()
+        with self._connection as connection:
+            connection.execute('DELETE FROM caseless_items')
+
+    # pylint: disable-next=arguments-differ
+    def update(self, __m: Any = None, **kwargs: Value) -> None:
+        """Update the mapping with the items of a mapping or an iterable of
+        (key, value) pairs and the *kwargs*, whose keys are normalized in
+        one batch and written in one transaction."""
+        for items in (__m, kwargs.items()):
+            if items:
+                self._write_items(items)
+
+    def _write_items(
+        self,
+        iterable: Union[Mapping[Key, Value], Iterable[Tuple[Key, Value]]],
+    ) -> None:
+        """Write a batch of items, whose keys are normalized in one batch, in
+        one transaction."""
+        # pylint: disable-next=protected-access
+        keys, values = self.caseless_class._modify_items(iterable)
+        for key in keys:
+            if not isinstance(key, KEY_TYPES):
+                raise TypeError(
+                    'Key must be a str, int, float or bytes, not ',
+                    type(key).__name__,
+                )
+        self.flush()
+        cache = self._cache
+        for key, value in zip(keys, values):
+            if key in cache:
+                cache[key] = value
+        dumps = pickle.dumps
+        protocol = pickle.HIGHEST_PROTOCOL
+        with self._connection as connection:
+            connection.executemany(
+                _UPSERT,
+                (
+                    (key, dumps(value, protocol))
+                    for key, value in zip(keys, values)
+                ),
+            )
+
+    def get_many(
+        self, keys: Iterable[Key], default: Value = None
+    ) -> List[Value]:
+        """Return the values of a batch of *keys*, normalized in one batch.
+
+        Args:
+            keys: The keys which will be looked up.
+            default: The value of the keys which are not in the mapping.
+
+        Returns:
+            List of the values in the same order as the *keys*.
+        """
+        values = []
+        for key in self.caseless_class.normalize_many(keys):
+            value = self._lookup(key)
+            values.append(default if value is _MISSING else value)
+        return values
+
+    def to_caseless_dict(self) -> BaseCaselessDict:
+        """Return a new dictionary of the `caseless_class` with the items of
+        the mapping, without normalizing the keys again."""
+        self.flush()
+        caseless_dict = self.caseless_class.__new__(self.caseless_class)
+        dict.update(
+            caseless_dict,
+            (
+                (key, pickle.loads(value))
+                for key, value in self._connection.execute(
+                    'SELECT key, value FROM caseless_items ORDER BY rowid'
+                )
+            ),
+        )
+        return caseless_dict
+
+
+def _write_pending(
+    connection: sqlite3.Connection, pending: Dict[Key, Value]
+) -> None:
+    """Write the *pending* changes of normalized keys in one transaction of
+    the *connection*, and clear them."""
+    if not pending:
+        return
+    upserts = []
+    deletes = []
+    for key, value in pending.items():
+        if value is _DELETED:
+            deletes.append((key,))
+        else:
+            upserts.append((key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)))
+    with connection:
+        connection.executemany(_DELETE, deletes)
+        connection.executemany(_UPSERT, upserts)
+    pending.clear()
+
+
+def _close(connection: sqlite3.Connection, pending: Dict[Key, Value]) -> None:
+    """Write the *pending* changes and close the *connection*. Called once,
+    by `PersistentCaselessDict.close` or when the mapping is finalized."""
+    try:
+        _write_pending(connection, pending)
+    finally:
+        connection.close()
@@ -0,0 +1,286 @@
+"""
+Caseless mapping whose items are split into shards.
+
+A `dict` grows by allocating a table twice as large and inserting every
+item again, so the insert which triggers the resize of a dictionary of
+millions of keys pauses for as long as all the other items took to insert.
+A `ShardedCaselessDict` keeps its items in `shard_count` dictionaries,
+picked by the hash of the normalized key. Every shard grows on its own, so a
+resize only copies the items of one shard.
+
+Objects provided by this module:
+   `ShardedCaselessDict` - Caseless mutable mapping of sharded dictionaries.
+"""
+from typing import (
+    Any,
+    Dict,
+    ItemsView,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    ValuesView,
+)
+
+from modifiable_items_dictionary.modifiable_items_dictionary import (
+    NO_DEFAULT,
+    Key,
+    Value,
+)
+
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
+from caseless_dictionary.caseless_dict import CaselessDict
+from caseless_dictionary.exceptions import CaselessKeyError
+
+# A prime, so keys whose hashes share their low bits, like small ints, are
+# spread over the shards, and the keys of a shard do not all share them.
+DEFAULT_SHARD_COUNT = 61
+
+# Returned by `dict.get` when the key is not in the shard.
+_MISSING: Any = object()
+
+
+class ShardedCaselessDict(MutableMapping):
+    """
+    Mutable mapping which normalizes its keys with the key modifiers of a
+    caseless dictionary class, and splits its items into *shard_count*
+    dictionaries by the hash of the normalized key.
+
+    The mapping has the same items as the *caseless_class* created from the
+    same items, and honors its `key_is_str_only`, `intern_keys` and value
+    modifiers. It iterates the keys shard by shard, in the order they were
+    inserted into their shard: the order is stable while the mapping is not
+    changed, but it is not the order the keys were inserted in.
+
+    Example:
+    >>> hosts = ShardedCaselessDict({"WWW.Example.COM": "93.184.216.34"})
+    >>> hosts["www.example.com"]
+    '93.184.216.34'
+    >>> hosts["Mail.Example.com"] = "93.184.216.35"
+    >>> len(hosts)
+    2
+    >>> sorted(hosts)
+    ['mail.example.com', 'www.example.com']
+
+    Args:
+        iterable: Mapping or iterable of (key, value) pairs.
+        caseless_class: The caseless dictionary class whose key modifiers
+            normalize the keys.
+        shard_count: The number of dictionaries which hold the items.
+
+    Raises:
+        ValueError: If the *shard_count* is less than one.
+    """
+
+    __slots__ = ('caseless_class', '_normalize_key', '_shards')
+
+    def __init__(
+        self,
+        iterable: Optional[
+            Union[Mapping[Key, Value], Iterable[Tuple[Key, Value]]]
+        ] = None,
+        caseless_class: Type[BaseCaselessDict] = CaselessDict,
+        shard_count: int = DEFAULT_SHARD_COUNT,
+    ) -> None:
+        if shard_count < 1:
+            raise ValueError(
+                'shard_count must be at least 1, not ', shard_count
+            )
+        self.caseless_class = caseless_class
+        # pylint: disable-next=protected-access
+        self._normalize_key = caseless_class._normalize_key
+        self._shards: List[Dict[Key, Value]] = [{} for _ in range(shard_count)]
+        if iterable is not None:
+            self.update(iterable)
+
+    @property
+    def shard_count(self) -> int:
+        """The number of dictionaries which hold the items."""
+        return len(self._shards)
+
+    def __getitem__(self, key: Key) -> Value:
+        key = self._normalize_key(key)
+        value = self._shards[hash(key) % len(self._shards)].get(key, _MISSING)
+        if value is _MISSING:
+            raise CaselessKeyError(key)
+        return value
+
+    def __setitem__(self, key: Key, value: Value) -> None:
+        # pylint: disable=protected-access
+        key = self.caseless_class._stored_key(key)
+        value = self.caseless_class._stored_value(value)
+        self._shards[hash(key) % len(self._shards)][key] = value
+
+    def __delitem__(self, key: Key) -> None:
+        key = self._normalize_key(key)
+        shard = self._shards[hash(key) % len(self._shards)]
+        if key not in shard:
+            raise CaselessKeyError(key)
+        del shard[key]
+
+    def __contains__(self, key: Any) -> bool:
+        key = self._normalize_key(key)
+        return key in self._shards[hash(key) % len(self._shards)]
+
+    def __iter__(self) -> Iterator[Key]:
+        for shard in self._shards:
+            yield from shard
+
+    def __len__(self) -> int:
+        return sum(map(len, self._shards))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self.items())!r})'
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the normalized items of every shard as one `dict`.
+        `__setstate__` spreads them over the shards again without
+        normalizing the keys, because the hashes of *str* keys, and so their
+        shards, differ between processes."""
+        items: Dict[Key, Value] = {}
+        for shard in self._shards:
+            items.update(shard)
+        return (
+            self.__class__,
+            (None, self.caseless_class, len(self._shards)),
+            items,
+        )
+
+    def __setstate__(self, items: Dict[Key, Value]) -> None:
+        shards = self._shards
+        shard_count = len(shards)
+        for key, value in items.items():
+            shards[hash(key) % shard_count][key] = value
+
+    def copy(self) -> 'ShardedCaselessDict':
+        """Return a shallow copy of the mapping, without normalizing the keys
+        again."""
+        sharded_dict = self.__class__(
+            None, self.caseless_class, len(self._shards)
+        )
+        # pylint: disable-next=protected-access
+        sharded_dict._shards = [shard.copy() for shard in self._shards]
+        return sharded_dict
+
+    __copy__ = copy
+
+    def get(self, key: Key, default: Value = None) -> Value:
+        """Return the value of the *key* if it is in the mapping, otherwise
+        the *default*."""
+        key = self._normalize_key(key)
+        return self._shards[hash(key) % len(self._shards)].get(key, default)
+
+    def setdefault(self, key: Key, default: Value = None) -> Value:
+        """Insert the *key* with the modified *default* if it is not in the
+        mapping.
+
+        Returns:
+            The value of the *key*.
+        """
+        # pylint: disable=protected-access
+        key = self.caseless_class._stored_key(key)
+        shard = self._shards[hash(key) % len(self._shards)]
+        value = shard.get(key, _MISSING)
+        if value is _MISSING:
+            value = shard[key] = self.caseless_class._stored_value(default)
+        return value
+
+    def pop(self, key: Key, default: Value = NO_DEFAULT) -> Value:
+        """Remove the *key* and return its value, or the *default* if the
+        key is not in the mapping.
+
+        Raises:
+            CaselessKeyError: If the *key* is missing and there is no
+                *default*.
+        """
+        key = self._normalize_key(key)
+        value = self._shards[hash(key) % len(self._shards)].pop(key, default)
+        if value is NO_DEFAULT:
+            raise CaselessKeyError(key)
+        return value
+
+    def popitem(self) -> Tuple[Key, Value]:
+        """Remove and return the last inserted (key, value) pair of the last
+        shard which is not empty.
+
+        Raises:
+            KeyError: If the mapping is empty.
+        """
+        for shard in reversed(self._shards):
+            if shard:
+                return shard.popitem()
+        raise KeyError('popitem(): mapping is empty')
+
+    def clear(self) -> None:
+        """Remove every item of the mapping."""
+        for shard in self._shards:
+            shard.clear()
+
+    # pylint: disable-next=arguments-differ
+    def update(self, __m: Any = None, **kwargs: Value) -> None:
+        """Update the mapping with the items of a mapping or an iterable of
+        (key, value) pairs and the *kwargs*, whose keys are normalized in
+        one batch."""
+        if __m:
+            self._update_items(__m)
+        if kwargs:
+            self._update_items(kwargs.items())
+
+    def _update_items(
+        self,
+        iterable: Union[Mapping[Key, Value], Iterable[Tuple[Key, Value]]],
+    ) -> None:
+        """Set a batch of items whose keys are normalized in one batch."""
+        # pylint: disable-next=protected-access
+        keys, values = self.caseless_class._modify_items(iterable)
+        shards = self._shards
+        shard_count = len(shards)
+        for key, value in zip(keys, values):
+            shards[hash(key) % shard_count][key] = value
+
+    def items(self) -> ItemsView[Key, Value]:
+        return _ShardedItemsView(self)
+
+    def values(self) -> ValuesView[Value]:
+        return _ShardedValuesView(self)
+
+    def to_caseless_dict(self) -> BaseCaselessDict:
+        """Return a new dictionary of the `caseless_class` with the items of
+        the mapping, without normalizing the keys again."""
+        caseless_dict = self.caseless_class.__new__(self.caseless_class)
+        for shard in self._shards:
+            dict.update(caseless_dict, shard)
+        return caseless_dict
+
+
+# pylint: disable-next=too-few-public-methods
+class _ShardedItemsView(ItemsView):
+    """Items of a `ShardedCaselessDict`, iterated from its shards without
+    looking every key up again."""
+
+    __slots__ = ()
+    _mapping: ShardedCaselessDict
+
+    def __iter__(self) -> Iterator[Tuple[Key, Value]]:
+        # pylint: disable-next=protected-access
+        for shard in self._mapping._shards:
+            yield from shard.items()
+
+
+# pylint: disable-next=too-few-public-methods
+class _ShardedValuesView(ValuesView):
+    """Values of a `ShardedCaselessDict`, iterated from its shards without
+    looking every key up again."""
+
+    __slots__ = ()
+    _mapping: ShardedCaselessDict
+
+    def __iter__(self) -> Iterator[Value]:
+        # pylint: disable-next=protected-access
+        for shard in self._mapping._shards:
+            yield from shard.values()
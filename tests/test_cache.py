@@ -0,0 +1,85 @@
+"""Test cases for the cache module.
+
+Classes:
+    TestCachedKeyModifier: Test case for the CachedKeyModifier class.
+"""
+import pytest
+
+from caseless_dictionary import CaselessDict, SnakeCaselessAttrDict
+from caseless_dictionary.cache import CachedKeyModifier
+from caseless_dictionary.cases import case_fold, snake_case
+
+
+class TestCachedKeyModifier:
+    def test_call_matches_modifier(self, caseless_class):
+        _, _key_operation = caseless_class
+        cached_modifier = CachedKeyModifier(_key_operation)
+
+        for key in ('  CamelCase ', 'lower', 'UPPER  ', 1, 5.56, ('a', 'B')):
+            assert cached_modifier(key) == _key_operation(key)
+
+    def test_hits_and_misses(self):
+        cached_modifier = CachedKeyModifier(case_fold, maxsize=8)
+
+        cached_modifier('Some Key')
+        cached_modifier('Some Key')
+        cached_modifier('Other Key')
+
+        assert cached_modifier.hits == 1
+        assert cached_modifier.misses == 2
+        assert cached_modifier.cache_info().currsize == 2
+
+    def test_non_str_keys_are_not_cached(self):
+        cached_modifier = CachedKeyModifier(case_fold, maxsize=8)
+
+        assert cached_modifier(1) == 1
+        assert cached_modifier(True) is True
+        assert cached_modifier.cache_info().currsize == 0
+
+    def test_cache_is_bounded(self):
+        cached_modifier = CachedKeyModifier(case_fold, maxsize=2)
+
+        for key in ('A', 'B', 'C', 'A'):
+            cached_modifier(key)
+
+        assert cached_modifier.cache_info().currsize == 2
+        assert cached_modifier.hits == 0
+
+    def test_cache_clear(self):
+        cached_modifier = CachedKeyModifier(case_fold)
+        cached_modifier('Some Key')
+        cached_modifier.cache_clear()
+
+        assert cached_modifier.cache_info() == (0, 0, 1024, 0)
+
+    @pytest.mark.parametrize('maxsize', (0, -1, None, True, 1.5))
+    def test_invalid_maxsize(self, maxsize):
+        with pytest.raises(ValueError):
+            CachedKeyModifier(case_fold, maxsize=maxsize)
+
+    def test_invalid_modifier(self):
+        with pytest.raises(TypeError):
+            CachedKeyModifier('not callable')
+
+    def test_caseless_dict_with_cached_modifier(self):
+        class _CachedCaselessDict(CaselessDict):
+            _key_modifiers = [CachedKeyModifier(case_fold, maxsize=16)]
+
+        caseless_dict = _CachedCaselessDict({'  HeLLo ': 1, 2: 'two'})
+        assert caseless_dict == {'hello': 1, 2: 'two'}
+        assert caseless_dict['HELLO'] == 1
+        assert caseless_dict[2] == 'two'
+        assert 'HELLO' in caseless_dict
+        assert _CachedCaselessDict._key_modifiers[0].hits == 1
+
+    def test_caseless_attr_dict_with_cached_modifier(self):
+        class _CachedAttrDict(SnakeCaselessAttrDict):
+            _key_modifiers = [CachedKeyModifier(snake_case, maxsize=16)]
+
+        caseless_attr_dict = _CachedAttrDict({'Some Word': 1})
+        assert caseless_attr_dict.SOME_WORD == 1
+        assert caseless_attr_dict['SOME_WORD'] == 1
+        assert _CachedAttrDict._key_modifiers[0].hits == 1
+        # The class keeps the key of the attribute name itself.
+        assert caseless_attr_dict.SOME_WORD == 1
+        assert _CachedAttrDict._key_modifiers[0].hits == 1
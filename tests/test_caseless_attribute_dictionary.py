@@ -7,11 +7,47 @@ Classes:
     CaselessAttributeDictionary class.
 """
 import contextlib
+import copy
+import pickle
 from copy import deepcopy
 from typing import Mapping
 
 import pytest
 
+from caseless_dictionary import caseless_attribute_dict
+from caseless_dictionary.caseless_attribute_dict import (
+    CaselessAttrDict,
+    ConstantCaselessAttrDict,
+    SnakeCaselessAttrDict,
+)
+from caseless_dictionary.exceptions import CaselessKeyError
+
+
+class _AttrDict(SnakeCaselessAttrDict):
+    pass
+
+
+class _ConstantAttrDict(_AttrDict):
+    _key_modifiers = ConstantCaselessAttrDict._key_modifiers
+
+
+class _IncrementAttrDict(SnakeCaselessAttrDict):
+    _value_modifiers = [lambda value: value + 1]
+
+
+class _DeepAttrDict(SnakeCaselessAttrDict):
+    deep = True
+
+
+class _OwnGetItemAttrDict(SnakeCaselessAttrDict):
+    def __getitem__(self, key):
+        return f'item {super().__getitem__(key)}'
+
+
+class _DefaultAttrDict(SnakeCaselessAttrDict):
+    def __missing__(self, key):
+        return f'default {key}'
+
 
 class TestCaselessAttributeDictionary:
     """Test case for the CaselessAttributeDictionary class.
@@ -49,6 +85,12 @@ class TestCaselessAttributeDictionary:
             unhashable type.
         test_update_using_mapping: Test the update method using a mapping.
         test_update_using_sequence: Test the update method using a sequence.
+        test_intern_keys: Test interning the keys with intern_keys.
+        test_copy: Test copying with copy, copy.copy and copy.deepcopy.
+        test_pickle: Test pickling and unpickling.
+        test_many: Test the get_many, contains_many, pop_many and set_many
+            methods.
+        test_merge: Test update, | and |= with the same class and a dict.
 
 
     """
@@ -306,7 +348,7 @@ class TestCaselessAttributeDictionary:
 
         expected.update(
             {_key_operation(key): value for key, value in args.items()},
-            **{_key_operation(key): value for key, value in kwargs.items()}
+            **{_key_operation(key): value for key, value in kwargs.items()},
         )
 
         caseless_attr_dict.update(args, **kwargs)
@@ -338,7 +380,7 @@ class TestCaselessAttributeDictionary:
 
         expected.update(
             {_key_operation(key): value for key, value in args},
-            **{_key_operation(key): value for key, value in kwargs.items()}
+            **{_key_operation(key): value for key, value in kwargs.items()},
         )
 
         caseless_attr_dict.update(args, **kwargs)
@@ -371,7 +413,78 @@ class TestCaselessAttributeDictionary:
         with pytest.raises(KeyError):
             _ = caseless_attr_dict[_key_operation('new_attr')]
 
-    def test_str_only(self, caseless_attr_class):
+    def test_intern_keys(self, caseless_attr_class):
+        _class, _key_operation = caseless_attr_class
+
+        class _InternedAttrDict(_class):
+            intern_keys = True
+
+        key = ''.join(['  Interned ', 'Key '])
+        first, second = _InternedAttrDict(), _InternedAttrDict({key: 1})
+        setattr(first, key, 1)
+
+        assert first == second == {_key_operation(key): 1}
+        assert next(iter(first)) is next(iter(second))
+
+    @pytest.mark.parametrize(
+        'copy_function', (lambda d: d.copy(), copy.copy, copy.deepcopy)
+    )
+    def test_copy(self, valid_mapping, caseless_attr_class, copy_function):
+        _class, _ = caseless_attr_class
+        caseless_attr_dict = _class(valid_mapping)
+        caseless_attr_dict.Extra_Key = 1
+
+        caseless_attr_dict_copy = copy_function(caseless_attr_dict)
+        assert type(caseless_attr_dict_copy) is _class
+        assert caseless_attr_dict_copy == caseless_attr_dict
+        assert caseless_attr_dict_copy.extra_key == 1
+
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, valid_mapping, caseless_attr_class, protocol):
+        _class, _ = caseless_attr_class
+        caseless_attr_dict = _class(valid_mapping)
+        caseless_attr_dict.Extra_Key = 1
+
+        unpickled = pickle.loads(pickle.dumps(caseless_attr_dict, protocol))
+        assert type(unpickled) is _class
+        assert unpickled == caseless_attr_dict
+        assert unpickled.EXTRA_KEY == 1
+
+    def test_many(self, caseless_attr_class):
+        _class, _key_operation = caseless_attr_class
+        caseless_attr_dict = _class()
+
+        caseless_attr_dict.set_many([('User ID', 1), ('First Name', 'Ada')])
+        assert caseless_attr_dict.get_many(['USER ID', 'First_Name']) == [
+            1,
+            'Ada',
+        ]
+        assert caseless_attr_dict.contains_many(['user id', 'x']) == [
+            True,
+            False,
+        ]
+        assert caseless_attr_dict.pop_many(['User ID']) == [1]
+        assert caseless_attr_dict == {_key_operation('First Name'): 'Ada'}
+
+    def test_merge(self, caseless_attr_class):
+        _class, _key_operation = caseless_attr_class
+        caseless_attr_dict = _class({'User ID': 1})
+        other = _class({'First Name': 'Ada'})
+        expected = {
+            _key_operation('User ID'): 1,
+            _key_operation('First Name'): 'Ada',
+        }
+
+        merged = caseless_attr_dict | other
+        assert type(merged) is _class
+        assert merged == expected
+        assert {'User ID': 1} | other == expected
+        caseless_attr_dict |= {'First Name': 'Ada'}
+        assert caseless_attr_dict == expected
+        caseless_attr_dict.update(_class({'User ID': 2}))
+        assert caseless_attr_dict[_key_operation('user id')] == 2
+
+    def test_str_only(self, caseless_attr_class, monkeypatch):
         _class, _key_operation = caseless_attr_class
         caseless_attr_dict: _class = _class()
 
@@ -381,7 +494,7 @@ class TestCaselessAttributeDictionary:
         assert caseless_attr_dict[1] == 'one'
 
         # Set str_only to True
-        _class.key_is_str_only = True
+        monkeypatch.setattr(_class, 'key_is_str_only', True)
         caseless_attr_dict: _class = _class()
 
         assert caseless_attr_dict.key_is_str_only == True
@@ -393,3 +506,114 @@ class TestCaselessAttributeDictionary:
         # But we should still be able to add string keys
         caseless_attr_dict['two'] = 2
         assert caseless_attr_dict['two'] == 2
+
+    def test_attribute_key_cache(self):
+        caseless_attr_dict = _AttrDict({'Cached Name': 1})
+
+        assert caseless_attr_dict.Cached_Name == 1
+        assert caseless_attr_dict.cached_name == 1
+        assert _AttrDict._attribute_keys['Cached_Name'] == 'cached_name'
+        assert _AttrDict({'Cached Name': 2}).cached_name == 2
+        with pytest.raises(AttributeError):
+            _AttrDict().cached_name
+        assert 'cached_name' not in vars(_AttrDict)
+        assert 'Cached_Name' not in SnakeCaselessAttrDict._attribute_keys
+
+    def test_attribute_of_subclass(self):
+        parent = _AttrDict({'Shared Name': 1})
+        child = _ConstantAttrDict({'Shared Name': 2})
+
+        assert parent.shared_name == 1
+        assert child.shared_name == 2
+        assert _ConstantAttrDict._attribute_keys['shared_name'] == (
+            'SHARED_NAME'
+        )
+        assert parent.shared_name == 1
+
+    def test_class_attributes_are_kept(self):
+        caseless_attr_dict = _AttrDict()
+        caseless_attr_dict.deep = True
+        caseless_attr_dict._private = 1
+
+        assert caseless_attr_dict['deep'] is True
+        assert caseless_attr_dict.deep is False
+        assert caseless_attr_dict._private == 1
+        assert _AttrDict.deep is False
+
+    def test_attributes_of_mixins_are_kept(self):
+        class _Mixin:
+            timeout = 30
+
+        class _MixinAttrDict(CaselessAttrDict, _Mixin):
+            pass
+
+        with pytest.raises(AttributeError):
+            CaselessAttrDict().timeout
+        CaselessAttrDict().version = 3
+
+        assert _MixinAttrDict().timeout == 30
+        assert 'timeout' not in vars(CaselessAttrDict)
+        assert 'version' not in vars(CaselessAttrDict)
+
+    def test_setattr(self):
+        caseless_attr_dict = _IncrementAttrDict()
+        caseless_attr_dict.Some_Value = 1
+        caseless_attr_dict.some_value = 2
+
+        assert caseless_attr_dict == {'some_value': 3}
+        assert caseless_attr_dict.SOME_VALUE == 3
+
+    def test_own_item_methods(self):
+        caseless_attr_dict = _OwnGetItemAttrDict({'Name': 1})
+        caseless_attr_dict.other = 2
+
+        assert _OwnGetItemAttrDict._attribute_keys is None
+        assert caseless_attr_dict.name == 'item 1'
+        assert caseless_attr_dict.other == 'item 2'
+
+    def test_missing_attribute(self):
+        caseless_attr_dict = _DefaultAttrDict()
+
+        assert caseless_attr_dict.missing_name == 'default missing_name'
+        with pytest.raises(AttributeError) as error:
+            _AttrDict().missing_name
+        assert isinstance(error.value.__cause__, CaselessKeyError)
+
+    def test_deep_attribute(self):
+        caseless_attr_dict = _DeepAttrDict({'Outer': {'Inner Name': [{}]}})
+
+        for _ in range(2):
+            assert type(caseless_attr_dict.outer) is _DeepAttrDict
+            assert (
+                type(caseless_attr_dict.outer.inner_name[0]) is _DeepAttrDict
+            )
+
+    def test_attribute_cache_size(self, monkeypatch):
+        monkeypatch.setattr(caseless_attribute_dict, 'ATTRIBUTE_CACHE_SIZE', 0)
+
+        class _UncachedAttrDict(SnakeCaselessAttrDict):
+            pass
+
+        caseless_attr_dict = _UncachedAttrDict({'Name': 1})
+        assert caseless_attr_dict.name == 1
+        caseless_attr_dict.name = 2
+        assert caseless_attr_dict.name == 2
+        assert not _UncachedAttrDict._attribute_keys
+
+    def test_attribute_cache_keeps_found_names(self, monkeypatch):
+        monkeypatch.setattr(caseless_attribute_dict, 'ATTRIBUTE_CACHE_SIZE', 2)
+
+        class _SmallCacheAttrDict(SnakeCaselessAttrDict):
+            pass
+
+        caseless_attr_dict = _SmallCacheAttrDict({'First': 1, 'Second': 2})
+        for _ in range(2):
+            with pytest.raises(AttributeError):
+                caseless_attr_dict.missing_name
+        assert not _SmallCacheAttrDict._attribute_keys
+
+        assert caseless_attr_dict.First == 1
+        assert caseless_attr_dict.Second == 2
+        caseless_attr_dict.Third = 3
+        assert caseless_attr_dict.third == 3
+        assert list(_SmallCacheAttrDict._attribute_keys) == ['Third', 'third']
@@ -1,9 +1,72 @@
 import contextlib
+import copy
+import pickle
 from copy import deepcopy
 from typing import Mapping
 
 import pytest
 
+from caseless_dictionary import (
+    CaselessDict,
+    ConstantCaselessDict,
+    KebabCaselessDict,
+    SnakeCaselessAttrDict,
+    SnakeCaselessDict,
+    TitleCaselessDict,
+)
+from caseless_dictionary.cases import case_fold
+from caseless_dictionary.exceptions import CaselessKeyError
+from caseless_dictionary.key_compiler import MIN_LOOKUP_BATCH_SIZE
+from caseless_dictionary.lazy_list import LazyCaselessList
+
+_NORMALIZED_KEYS = []
+
+
+def _recording_case_fold(value):
+    _NORMALIZED_KEYS.append(value)
+    return case_fold(value)
+
+
+class _RecordingCaselessDict(CaselessDict):
+    _key_modifiers = [_recording_case_fold]
+
+
+class _IncrementDict(CaselessDict):
+    _value_modifiers = [lambda value: value + 1]
+
+
+class _StatefulDict(CaselessDict):
+    pass
+
+
+class _InternedDict(CaselessDict):
+    intern_keys = True
+
+
+class _DashDict(CaselessDict):
+    def _modify_key(self, key):
+        key = super()._modify_key(key)
+        if isinstance(key, str):
+            return key.replace('-', '_')
+        return key
+
+
+class _DeepDict(SnakeCaselessDict):
+    deep = True
+
+
+class _DeepDashDict(_DashDict):
+    deep = True
+
+
+class _DeepSubclassDict(_DeepDict):
+    def __getitem__(self, key):
+        return super().__getitem__(key)
+
+
+class _SlashPathDict(CaselessDict):
+    path_separator = '/'
+
 
 class TestCaselessDictionary:
     def test__init__mapping(self, valid_mapping: Mapping, caseless_class):
@@ -253,7 +316,7 @@ class TestCaselessDictionary:
 
         expected.update(
             {_key_operation(key): value for key, value in args.items()},
-            **{_key_operation(key): value for key, value in kwargs.items()}
+            **{_key_operation(key): value for key, value in kwargs.items()},
         )
 
         caseless_dict.update(args, **kwargs)
@@ -285,7 +348,7 @@ class TestCaselessDictionary:
 
         expected.update(
             {_key_operation(key): value for key, value in args},
-            **{_key_operation(key): value for key, value in kwargs.items()}
+            **{_key_operation(key): value for key, value in kwargs.items()},
         )
 
         caseless_dict.update(args, **kwargs)
@@ -301,11 +364,774 @@ class TestCaselessDictionary:
         with pytest.raises(TypeError):
             caseless_dict.update(iterable)
 
-    def test_str_only(self, caseless_class):
+    def test_normalize_many(self, valid_mapping, caseless_class):
+        _class, _key_operation = caseless_class
+        keys = list(valid_mapping)
+
+        expected = [_key_operation(key) for key in keys]
+        assert _class.normalize_many(keys) == expected
+
+    def test_normalize_many_overridden_modify_key(self):
+        assert _DashDict.normalize_many(['A-B', ' C-d ', 1]) == [
+            'a_b',
+            'c_d',
+            1,
+        ]
+
+    def test_from_items(self, valid_mapping, caseless_class):
         _class, _ = caseless_class
 
-        _class.key_is_str_only = True
+        from_mapping = _class.from_items(valid_mapping)
+        from_iterable = _class.from_items(iter(valid_mapping.items()))
+
+        assert type(from_mapping) is _class
+        assert from_mapping == _class(valid_mapping)
+        assert from_iterable == _class(valid_mapping)
+        assert repr(from_iterable) == repr(_class(valid_mapping))
+
+    @pytest.mark.parametrize(
+        'on_collision, expected',
+        (('last', {'a': 3, 'b': 2}), ('first', {'a': 1, 'b': 2})),
+    )
+    def test_from_items_on_collision(self, on_collision, expected):
+        items = [('A', 1), (' b', 2), ('a ', 3)]
+        caseless_dict = CaselessDict.from_items(items, on_collision)
+
+        assert caseless_dict == expected
+        assert list(caseless_dict) == ['a', 'b']
+
+    def test_from_items_on_collision_raise(self, caseless_class):
+        _class, _ = caseless_class
+
+        assert _class.from_items([('One', 1)], on_collision='raise')
+        with pytest.raises(ValueError):
+            _class.from_items(
+                [('One', 1), ('Two', 2), ('One', 1)], on_collision='raise'
+            )
+
+    def test_from_items_value_modifiers(self):
+        class _UpperValuesDict(CaselessDict):
+            _value_modifiers = [str.upper]
+
+        caseless_dict = _UpperValuesDict.from_items({'Key': 'value'})
+        assert caseless_dict == _UpperValuesDict({'Key': 'value'})
+        assert caseless_dict == {'key': 'VALUE'}
+
+    def test_from_items_overridden_modify_key(self):
+        caseless_dict = _DashDict.from_items({'A-B': 1, ' C-d': 2})
+
+        assert type(caseless_dict) is _DashDict
+        assert caseless_dict == {'a_b': 1, 'c_d': 2}
+        assert caseless_dict == _DashDict({'A-B': 1, ' C-d': 2})
+        assert _IncrementDict.from_items([('Key', 1)]) == {'key': 2}
+
+    def test_from_items_invalid_on_collision(self, caseless_class):
+        _class, _ = caseless_class
+
+        with pytest.raises(ValueError):
+            _class.from_items({}, on_collision='middle')
+
+    @pytest.mark.parametrize('iterable', [[('1', 1), ('two', 2, 2)]])
+    def test_from_items_bad_iterable_elements(self, iterable, caseless_class):
+        _class, _ = caseless_class
+
+        with pytest.raises(ValueError):
+            _class.from_items(iterable)
+
+    def test_from_items_unhashable_key(self, caseless_class, unhashable_type):
+        _class, _ = caseless_class
+
+        with pytest.raises(TypeError):
+            _class.from_items([(unhashable_type, 1)])
+
+    def test_setdefault_returns_value(self, caseless_class):
+        _class, _ = caseless_class
+        caseless_dict: _class = _class({'Key': 1})
+
+        assert caseless_dict.setdefault('KEY', 2) == 1
+        assert caseless_dict.setdefault('Other', 3) == 3
+
+    def test_intern_keys(self, caseless_class):
+        _class, _key_operation = caseless_class
+
+        class _InternedDict(_class):
+            intern_keys = True
+
+        key = ''.join(['  Interned ', 'Key '])
+        caseless_dicts = [
+            _InternedDict({key: 1}),
+            _InternedDict.from_items({key: 1}),
+            _InternedDict(),
+            _InternedDict(),
+        ]
+        caseless_dicts[2][key] = 1
+        caseless_dicts[3].setdefault(key, 1)
+
+        expected = {_key_operation(key): 1}
+        stored_keys = [next(iter(d)) for d in caseless_dicts]
+        assert all(d == expected for d in caseless_dicts)
+        assert all(k is stored_keys[0] for k in stored_keys)
+
+    def test_overridden_modify_key_on_store(self):
+        caseless_dict = _DashDict({'A-B': 1})
+        caseless_dict['C-D'] = 2
+        caseless_dict.setdefault('E-F', 3)
+
+        assert caseless_dict == {'a_b': 1, 'c_d': 2, 'e_f': 3}
+        assert 'a_b' in caseless_dict
+        assert 'A-B' in caseless_dict
+        assert caseless_dict.get('c_d') == 2
+
+    def test_keys_not_interned_by_default(self, caseless_class):
+        _class, _ = caseless_class
+        key = ''.join(['  Not Interned ', 'Key '])
+
+        first, second = _class({key: 1}), _class({key: 1})
+        assert next(iter(first)) is not next(iter(second))
+
+    @pytest.mark.parametrize(
+        'copy_function', (CaselessDict.copy, copy.copy, copy.deepcopy)
+    )
+    def test_copy(self, valid_mapping, caseless_class, copy_function):
+        _class, _ = caseless_class
+        caseless_dict = _class(valid_mapping)
+
+        caseless_dict_copy = copy_function(caseless_dict)
+        assert type(caseless_dict_copy) is _class
+        assert caseless_dict_copy == caseless_dict
+        assert list(caseless_dict_copy) == list(caseless_dict)
+        assert caseless_dict_copy is not caseless_dict
+
+    @pytest.mark.parametrize(
+        'copy_function',
+        (_RecordingCaselessDict.copy, copy.copy, copy.deepcopy),
+    )
+    def test_copy_does_not_normalize_keys(self, copy_function):
+        caseless_dict = _RecordingCaselessDict({'Some Key': 1, 'Other': 2})
+        _NORMALIZED_KEYS.clear()
+
+        assert copy_function(caseless_dict) == {'some key': 1, 'other': 2}
+        assert _NORMALIZED_KEYS == []
+
+    def test_copy_does_not_modify_values(self):
+        caseless_dict = _IncrementDict({'Some Key': 1})
+        assert caseless_dict.copy() == {'some key': 2}
+        assert copy.deepcopy(caseless_dict) == {'some key': 2}
+
+    def test_shallow_and_deep_copy(self):
+        caseless_dict = CaselessDict({'Some Key': [1]})
+
+        shallow_copy = copy.copy(caseless_dict)
+        deep_copy = copy.deepcopy(caseless_dict)
+        caseless_dict['some key'].append(2)
+
+        assert shallow_copy['SOME KEY'] == [1, 2]
+        assert deep_copy['SOME KEY'] == [1]
+
+    def test_deepcopy_recursive(self):
+        caseless_dict = CaselessDict()
+        caseless_dict['Self'] = caseless_dict
+
+        deep_copy = copy.deepcopy(caseless_dict)
+        assert deep_copy['self'] is deep_copy
+
+    def test_copy_instance_state(self):
+        caseless_dict = _StatefulDict({'Some Key': 1})
+        caseless_dict.source = ['config.ini']
+
+        assert copy.copy(caseless_dict).source is caseless_dict.source
+        deep_copy = copy.deepcopy(caseless_dict)
+        assert deep_copy.source == ['config.ini']
+        assert deep_copy.source is not caseless_dict.source
+
+    def test_init_from_same_class_does_not_normalize_keys(self):
+        caseless_dict = _RecordingCaselessDict({'Some Key': 1})
+        _NORMALIZED_KEYS.clear()
+
+        new_caseless_dict = _RecordingCaselessDict(caseless_dict, Other=2)
+        assert new_caseless_dict == {'some key': 1, 'other': 2}
+        assert _NORMALIZED_KEYS == ['Other']
+
+    def test_init_from_same_class(self, valid_mapping, caseless_class):
+        _class, _ = caseless_class
+        caseless_dict = _class(valid_mapping)
+
+        assert _class(caseless_dict) == caseless_dict
+        assert _class(caseless_dict, Extra=1) == _class(valid_mapping, Extra=1)
+
+    def test_init_from_same_class_modifies_values(self):
+        assert _IncrementDict(_IncrementDict({'Some Key': 1})) == {
+            'some key': 3
+        }
+
+    def test_init_from_other_class(self):
+        title_dict = TitleCaselessDict({'Some Key': 1})
+        assert CaselessDict(title_dict) == {'some key': 1}
+        assert TitleCaselessDict(CaselessDict({'some key': 1})) == title_dict
+
+    @pytest.mark.parametrize(
+        'target_class, expected',
+        (
+            (CaselessDict, {'some_key': 1}),
+            (SnakeCaselessDict, {'some_key': 1}),
+            (KebabCaselessDict, {'some_key': 1}),
+            (SnakeCaselessAttrDict, {'some_key': 1}),
+            (ConstantCaselessDict, {'SOME_KEY': 1}),
+            (TitleCaselessDict, {'Some_Key': 1}),
+        ),
+    )
+    def test_convert_to(self, target_class, expected):
+        snake_dict = SnakeCaselessDict({'Some Key': 1})
+
+        converted = snake_dict.convert_to(target_class)
+        assert type(converted) is target_class
+        assert converted == expected
+        assert converted == target_class(snake_dict)
+
+    def test_convert_to_does_not_normalize_preserved_keys(self):
+        caseless_dict = _RecordingCaselessDict({'Some Key': 1})
+        _NORMALIZED_KEYS.clear()
+
+        assert caseless_dict.convert_to(_RecordingCaselessDict) == {
+            'some key': 1
+        }
+        assert _NORMALIZED_KEYS == []
+
+    def test_convert_to_overridden_modify_key(self):
+        converted = CaselessDict({'A-B': 1}).convert_to(_DashDict)
+
+        assert type(converted) is _DashDict
+        assert converted == {'a_b': 1}
+        assert converted == _DashDict(CaselessDict({'A-B': 1}))
+
+    def test_convert_to_interned(self):
+        key = ''.join(['some ', 'key'])
+        converted = CaselessDict({key: 1}).convert_to(_InternedDict)
+        assert next(iter(converted)) is _InternedDict({key: 1}).popitem()[0]
+
+    def test_missing_key_error(self, caseless_class):
+        _class, _key_operation = caseless_class
+
+        with pytest.raises(CaselessKeyError) as error:
+            _class({'Some Key': 1})['  Other Key ']
+        assert error.value.key == _key_operation('  Other Key ')
+        assert str(error.value) == (
+            'Missing key of some case variant of '
+            f"{_key_operation('  Other Key ')!r}"
+        )
+
+    def test_try_get(self, valid_mapping, caseless_class):
+        _class, _key_operation = caseless_class
+        caseless_dict = _class(valid_mapping)
+        caseless_dict['None Value'] = None
+
+        for key, value in valid_mapping.items():
+            assert caseless_dict.try_get(key) == (True, value)
+            assert caseless_dict.try_get(_key_operation(key)) == (True, value)
+        assert caseless_dict.try_get('NONE VALUE') == (True, None)
+        assert caseless_dict.try_get('Missing') == (False, None)
+
+    def test_try_get_unhashable_type(self, caseless_class, unhashable_type):
+        _class, _ = caseless_class
+        with pytest.raises(TypeError):
+            _class().try_get(unhashable_type)
+
+    def test_get_many(self, valid_mapping, caseless_class):
+        _class, _key_operation = caseless_class
+        caseless_dict = _class(valid_mapping)
+        keys = [*valid_mapping, 'Missing', *map(_key_operation, valid_mapping)]
+
+        assert caseless_dict.get_many(keys) == [
+            caseless_dict.get(key) for key in keys
+        ]
+        assert caseless_dict.get_many(iter(['Missing']), 0) == [0]
+        assert caseless_dict.get_many([]) == []
+
+    def test_get_many_caseless_keys(self):
+        caseless_dict = CaselessDict({'Some Key': 1})
+        keys = [CaselessDict.caseless_key('SOME KEY'), 'some key']
+
+        assert caseless_dict.get_many(keys) == [1, 1]
+
+    def test_get_many_unhashable_type(self, caseless_class, unhashable_type):
+        _class, _ = caseless_class
+        with pytest.raises(TypeError):
+            _class().get_many(['a', unhashable_type])
+
+    def test_contains_many(self, valid_mapping, caseless_class):
+        _class, _ = caseless_class
+        caseless_dict = _class(valid_mapping)
+        keys = [*valid_mapping, 'Missing']
+
+        assert caseless_dict.contains_many(keys) == [
+            key in caseless_dict for key in keys
+        ]
+
+    def test_pop_many(self, caseless_class):
+        _class, _key_operation = caseless_class
+        caseless_dict = _class({'A Key': 1, 'Other': 2, 3: 4})
+
+        assert caseless_dict.pop_many([' A KEY ', 3]) == [1, 4]
+        assert caseless_dict == {_key_operation('Other'): 2}
+
+    def test_pop_many_default(self):
+        caseless_dict = CaselessDict({'A Key': 1, 'Other': 2})
+
+        assert caseless_dict.pop_many(['a key', 'Missing', 'A KEY'], 0) == [
+            1,
+            0,
+            0,
+        ]
+        assert caseless_dict == {'other': 2}
+
+    @pytest.mark.parametrize(
+        'keys', (['a key', 'Missing'], ['a key', 'A KEY'])
+    )
+    def test_pop_many_missing_key(self, keys):
+        caseless_dict = CaselessDict({'A Key': 1, 'Other': 2})
+
+        with pytest.raises(CaselessKeyError):
+            caseless_dict.pop_many(keys)
+        assert caseless_dict == {'a key': 1, 'other': 2}
+
+    def test_set_many(self, valid_mapping, caseless_class):
+        _class, _ = caseless_class
+        caseless_dict = _class({'Existing': 0})
+        expected = _class({'Existing': 0})
+        expected.update(valid_mapping)
+
+        caseless_dict.set_many(valid_mapping)
+        assert caseless_dict == expected
+        caseless_dict.set_many(list(valid_mapping.items()))
+        assert caseless_dict == expected
+
+    def test_set_many_modifies_items(self):
+        key = ''.join(['some ', 'key'])
+        caseless_dict = _IncrementDict()
+        caseless_dict.set_many([(' SOME KEY ', 1)])
+        interned_dict = _InternedDict()
+        interned_dict.set_many({key: 1})
+
+        assert caseless_dict == {'some key': 2}
+        assert next(iter(interned_dict)) is next(iter(_InternedDict({key: 1})))
+
+    def test_set_many_invalid_items(self):
+        with pytest.raises(ValueError):
+            CaselessDict().set_many([('a', 1, 2)])
+
+    @pytest.mark.parametrize(
+        'count', (MIN_LOOKUP_BATCH_SIZE - 1, MIN_LOOKUP_BATCH_SIZE)
+    )
+    @pytest.mark.parametrize(
+        '_class', (CaselessDict, SnakeCaselessDict, _InternedDict, _DashDict)
+    )
+    def test_many_batch_sizes(self, _class, count):
+        items = [(f' Some-Key {index} ', index) for index in range(count)]
+        items[0] = (1, 'int')
+        items[1] = (_class.caseless_key('Other Key'), 'caseless key')
+        keys = [key for key, _ in items] + ['Missing']
+        caseless_dict = _class()
+        caseless_dict.set_many(items)
+
+        assert caseless_dict == _class(items)
+        assert caseless_dict.get_many(keys, 0) == [
+            caseless_dict.get(key, 0) for key in keys
+        ]
+        assert caseless_dict.get_many(tuple(keys))[:2] == [
+            'int',
+            'caseless key',
+        ]
+        assert caseless_dict.contains_many(iter(keys)) == [
+            key in caseless_dict for key in keys
+        ]
+
+    @pytest.mark.parametrize(
+        'count', (MIN_LOOKUP_BATCH_SIZE - 1, MIN_LOOKUP_BATCH_SIZE)
+    )
+    def test_set_many_value_modifiers(self, count):
+        caseless_dict = _IncrementDict()
+        caseless_dict.set_many(
+            {f'Key {index}': index for index in range(count)}
+        )
+
+        assert caseless_dict == {
+            f'key {index}': index + 1 for index in range(count)
+        }
+
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, valid_mapping, caseless_class, protocol):
+        _class, _ = caseless_class
+        caseless_dict = _class(valid_mapping)
+
+        unpickled = pickle.loads(pickle.dumps(caseless_dict, protocol))
+        assert type(unpickled) is _class
+        assert unpickled == caseless_dict
+        assert list(unpickled) == list(caseless_dict)
+
+    def test_pickle_does_not_normalize_keys(self):
+        pickled = pickle.dumps(_RecordingCaselessDict({'Some Key': 1}))
+        _NORMALIZED_KEYS.clear()
+
+        assert pickle.loads(pickled) == {'some key': 1}
+        assert _NORMALIZED_KEYS == []
+
+    def test_pickle_does_not_modify_values(self):
+        pickled = pickle.dumps(_IncrementDict({'Some Key': 1}))
+        assert pickle.loads(pickled) == {'some key': 2}
+
+    def test_pickle_recursive(self):
+        caseless_dict = CaselessDict()
+        caseless_dict['Self'] = caseless_dict
+
+        unpickled = pickle.loads(pickle.dumps(caseless_dict))
+        assert unpickled['self'] is unpickled
+
+    def test_pickle_instance_state(self):
+        caseless_dict = _StatefulDict({'Some Key': 1})
+        caseless_dict.source = 'config.ini'
+
+        unpickled = pickle.loads(pickle.dumps(caseless_dict))
+        assert unpickled == {'some key': 1}
+        assert unpickled.source == 'config.ini'
+
+    def test_pickle_interned(self):
+        key = ''.join(['some ', 'key'])
+        pickled = pickle.dumps(_InternedDict({key: 1}))
+
+        unpickled_key = next(iter(pickle.loads(pickled)))
+        assert unpickled_key is next(iter(_InternedDict({key: 1})))
+
+    def test_update_from_same_class_does_not_normalize_keys(self):
+        caseless_dict = _RecordingCaselessDict({'Some Key': 1})
+        other = _RecordingCaselessDict({'Other Key': 2})
+        _NORMALIZED_KEYS.clear()
+
+        caseless_dict.update(other, Extra=3)
+        assert caseless_dict == {'some key': 1, 'other key': 2, 'extra': 3}
+        assert _NORMALIZED_KEYS == ['Extra']
+
+    def test_update_from_other_class(self):
+        caseless_dict = TitleCaselessDict({'Some Key': 1})
+        caseless_dict.update(CaselessDict({'some key': 2, 'other': 3}))
+        assert caseless_dict == {'Some Key': 2, 'Other': 3}
+
+    def test_update_modifies_values(self):
+        caseless_dict = _IncrementDict()
+        caseless_dict.update(_IncrementDict({'Some Key': 1}))
+        assert caseless_dict == {'some key': 3}
+
+    def test_or(self, valid_mapping, caseless_class):
+        _class, _ = caseless_class
+        caseless_dict = _class({'Extra': 1})
+        expected = _class([('Extra', 1), *valid_mapping.items()])
+
+        merged = caseless_dict | valid_mapping
+        assert type(merged) is _class
+        assert merged == expected
+        assert caseless_dict | _class(valid_mapping) == expected
+        assert caseless_dict == _class({'Extra': 1})
+
+    def test_ror(self, valid_mapping, caseless_class):
+        _class, _key_operation = caseless_class
+        caseless_dict = _class(valid_mapping)
+        mapping = {'Extra': 1, next(iter(valid_mapping)): None}
+
+        merged = mapping | caseless_dict
+        assert type(merged) is _class
+        assert merged == _class([*mapping.items(), *valid_mapping.items()])
+        assert list(merged)[0] == _key_operation('Extra')
+
+    def test_or_does_not_normalize_keys(self):
+        caseless_dict = _RecordingCaselessDict({'Some Key': 1})
+        other = _RecordingCaselessDict({'Other Key': 2})
+        _NORMALIZED_KEYS.clear()
+
+        assert caseless_dict | other == {'some key': 1, 'other key': 2}
+        caseless_dict |= other
+        assert caseless_dict == {'some key': 1, 'other key': 2}
+        assert _NORMALIZED_KEYS == []
+
+    def test_or_keeps_instance_state(self):
+        caseless_dict = _StatefulDict({'Some Key': 1})
+        caseless_dict.source = 'config.ini'
+
+        assert (caseless_dict | {'Other': 2}).source == 'config.ini'
+        assert ({'Other': 2} | caseless_dict).source == 'config.ini'
+
+    def test_or_other_class(self):
+        merged = CaselessDict({'A': 1}) | SnakeCaselessDict({'B C': 2})
+        assert type(merged) is CaselessDict
+        assert merged == {'a': 1, 'b_c': 2}
+
+    @pytest.mark.parametrize('other', ([('a', 1)], 'a', 1))
+    def test_or_not_a_mapping(self, other):
+        with pytest.raises(TypeError):
+            CaselessDict() | other
+        with pytest.raises(TypeError):
+            other | CaselessDict()
+
+    def test_ior(self, valid_mapping, caseless_class):
+        _class, _ = caseless_class
+        caseless_dict = _class({'Extra': 1})
+        same = caseless_dict
+
+        caseless_dict |= valid_mapping
+        assert caseless_dict is same
+        assert caseless_dict == _class([('Extra', 1), *valid_mapping.items()])
+        caseless_dict |= [('Other Key', 2)]
+        assert caseless_dict[' OTHER KEY'] == 2
+
+    def test_eq(self):
+        assert CaselessDict({'Some Key': 1}) == CaselessDict({'SOME KEY': 1})
+        assert CaselessDict({'Some Key': 1}) == {'some key': 1}
+        assert CaselessDict({'Some Key': 1}) != {'Some Key': 1}
+        assert CaselessDict({'Some Key': 1}) != SnakeCaselessDict(
+            {'Some Key': 1}
+        )
+
+    def test_str_only(self, caseless_class, monkeypatch):
+        _class, _ = caseless_class
+
+        monkeypatch.setattr(_class, 'key_is_str_only', True)
         caseless_dict: _class = _class()
 
         with pytest.raises(TypeError):
             caseless_dict[1] = 2
+
+        with pytest.raises(TypeError):
+            _class.from_items({1: 2})
+
+        with pytest.raises(TypeError):
+            caseless_dict.set_many({'a': 1, 1: 2})
+        assert caseless_dict == {}
+
+        monkeypatch.setattr(_class, 'key_is_str_only', False)
+        not_str_only = _class({1: 2})
+        monkeypatch.setattr(_class, 'key_is_str_only', True)
+        with pytest.raises(TypeError):
+            _class(not_str_only)
+        with pytest.raises(TypeError):
+            caseless_dict.update(not_str_only)
+
+    def test_deep_wraps_on_first_access(self):
+        nested = {'Inner Key': 1}
+        caseless_dict = _DeepDict({'Outer Key': nested, 'Items': [nested]})
+
+        assert dict.__getitem__(caseless_dict, 'outer_key') is nested
+        inner = caseless_dict['OUTER KEY']
+        assert type(inner) is _DeepDict
+        assert inner == {'inner_key': 1}
+        assert dict.__getitem__(caseless_dict, 'outer_key') is inner
+        assert caseless_dict['outer_key'] is inner
+        assert caseless_dict.get('Outer Key') is inner
+        assert caseless_dict.try_get('Outer Key') == (True, inner)
+
+        items = caseless_dict.get_many(['Items', 'Missing'], {'A': 1})[0]
+        assert type(items) is LazyCaselessList
+        assert items[0] == {'inner_key': 1}
+        assert items[0] is not inner
+
+    def test_deep_overridden_modify_key(self):
+        caseless_dict = _DeepDashDict({'A-B': {'C-D': [{'E-F': 1}]}})
+
+        inner = caseless_dict['a-b']
+        assert type(inner) is _DeepDashDict
+        assert inner == {'c_d': [{'E-F': 1}]}
+        assert inner['c-d'][0] == {'e_f': 1}
+
+    @pytest.mark.parametrize(
+        'lookup',
+        (
+            lambda d, key: d[key],
+            lambda d, key: d.get(key),
+            lambda d, key: d.try_get(key)[1],
+            lambda d, key: d.get_many([key])[0],
+        ),
+    )
+    @pytest.mark.parametrize(
+        'key', ('Some Key', CaselessDict.caseless_key('Some Key'))
+    )
+    def test_deep_lookups(self, lookup, key):
+        for _class in (_DeepDict, _DeepSubclassDict):
+            caseless_dict = _class({'Some Key': {'A B': [[{'C D': 1}]]}})
+
+            value = lookup(caseless_dict, key)
+            assert type(value) is _class
+            assert lookup(value, 'a b')[0][0]['c_d'] == 1
+
+    def test_deep_missing_and_defaults(self):
+        caseless_dict = _DeepDict({'A': 1})
+        default = {'Not': 'wrapped'}
+
+        assert caseless_dict.get('Missing', default) is default
+        assert caseless_dict.get_many(['Missing'], default) == [default]
+        assert caseless_dict.try_get('Missing') == (False, None)
+        with pytest.raises(CaselessKeyError):
+            caseless_dict['Missing']
+
+    def test_deep_keeps_other_values(self):
+        caseless_inner = CaselessDict({'A': 1})
+        caseless_dict = _DeepDict(
+            {'Caseless': caseless_inner, 'Tuple': ({'A': 1},), 'Int': 1}
+        )
+
+        assert caseless_dict['caseless'] is caseless_inner
+        assert caseless_dict['tuple'] == ({'A': 1},)
+        assert caseless_dict['int'] == 1
+        assert list(caseless_dict.values()) == [caseless_inner, ({'A': 1},), 1]
+
+    def test_not_deep(self):
+        caseless_dict = SnakeCaselessDict({'Outer Key': {'Inner Key': 1}})
+
+        assert type(caseless_dict['outer key']) is dict
+        assert type(caseless_dict.get('outer key')) is dict
+
+    def test_deep_copy_and_pickle(self):
+        caseless_dict = _DeepDict({'Outer': {'Inner': [{'A': 1}]}})
+        caseless_dict['outer']
+
+        for copied in (
+            copy.deepcopy(caseless_dict),
+            pickle.loads(pickle.dumps(caseless_dict)),
+        ):
+            assert copied == caseless_dict
+            assert type(copied['outer']) is _DeepDict
+            assert copied['outer']['inner'][0]['a'] == 1
+
+    def test_get_path(self, caseless_class):
+        _class, _key_operation = caseless_class
+        caseless_dict = _class(
+            {
+                'Database': _class(
+                    {'Primary Host': 'db1', 'Replicas': ['db2', 'db3']}
+                ),
+                'Plain': {'Exact Key': 1},
+                'Other': SnakeCaselessDict({'Some Key': 2}),
+            }
+        )
+
+        assert caseless_dict.get_path('DATABASE.Primary Host') == 'db1'
+        assert caseless_dict.get_path(('database', 'PRIMARY HOST')) == 'db1'
+        assert caseless_dict.get_path('Database.Replicas.1') == 'db3'
+        assert caseless_dict.get_path('Database.Replicas.-1') == 'db3'
+        assert caseless_dict.get_path(('Database', 'Replicas', 0)) == 'db2'
+        assert caseless_dict.get_path('Plain.Exact Key') == 1
+        assert caseless_dict.get_path('Other.SOME KEY') == 2
+        assert caseless_dict.get_path('Database') is caseless_dict['database']
+
+    @pytest.mark.parametrize(
+        'path',
+        (
+            'Missing',
+            'Database.Missing',
+            'Database.Primary Host.Deeper',
+            'Database.Replicas.2',
+            'Database.Replicas.Name',
+            'Plain.exact key',
+        ),
+    )
+    def test_missing_path(self, path):
+        caseless_dict = CaselessDict(
+            {
+                'Database': CaselessDict(
+                    {'Primary Host': 'db1', 'Replicas': ['db2', 'db3']}
+                ),
+                'Plain': {'Exact Key': 1},
+            }
+        )
+
+        assert caseless_dict.get_path(path) is None
+        assert caseless_dict.get_path(path, 0) == 0
+        assert not caseless_dict.has_path(path)
+
+    def test_has_path(self):
+        caseless_dict = CaselessDict({'A': CaselessDict({'B': None})})
+
+        assert caseless_dict.has_path('a.b')
+        assert caseless_dict.has_path('A')
+        assert not caseless_dict.has_path('a.c')
+        with pytest.raises(ValueError):
+            caseless_dict.has_path(())
+
+    def test_get_paths(self):
+        caseless_dict = CaselessDict({'A': CaselessDict({'B': 1, 'C': 2})})
+
+        assert caseless_dict.get_paths(['a.b', 'A.C', 'A.D'], 0) == [1, 2, 0]
+        assert caseless_dict.get_paths([]) == []
+
+    def test_path_is_parsed_once(self):
+        caseless_dict = _RecordingCaselessDict(
+            {'Unique Outer': _RecordingCaselessDict({'Unique Inner': 1})}
+        )
+        _NORMALIZED_KEYS.clear()
+
+        for _ in range(3):
+            assert caseless_dict.get_path('UNIQUE OUTER.Unique Inner') == 1
+        assert _NORMALIZED_KEYS == ['UNIQUE OUTER', 'Unique Inner']
+
+    def test_path_separator(self):
+        caseless_dict = _SlashPathDict({'A.B': _SlashPathDict({'C': 1})})
+
+        assert caseless_dict.get_path('a.b/C') == 1
+        assert CaselessDict({'A.B': 1}).get_path(('a.b',)) == 1
+
+    def test_set_path(self):
+        caseless_dict = SnakeCaselessDict({'Servers': [{'Host': 'a'}]})
+
+        caseless_dict.set_path('Database.Primary Host', 'db1')
+        caseless_dict.set_path('DATABASE.Port', 5432)
+        caseless_dict.set_path('Servers.0.Host', 'b')
+        caseless_dict.set_path(('Servers', 0), 'c')
+
+        assert caseless_dict == {
+            'database': {'primary_host': 'db1', 'port': 5432},
+            'servers': ['c'],
+        }
+        assert type(caseless_dict['database']) is SnakeCaselessDict
+
+    def test_set_path_modifies_items(self):
+        caseless_dict = _IncrementDict()
+
+        caseless_dict.set_path('A', 1)
+        assert caseless_dict == {'a': 2}
+
+    def test_path_overridden_modify_key(self):
+        caseless_dict = _DashDict({'A-B': _DashDict({'C-D': 1})})
+
+        assert caseless_dict.get_path('a-b.c-d') == 1
+        assert caseless_dict.has_path('A_B.C-D')
+        caseless_dict.set_path('a-b.E-F', 2)
+        caseless_dict.set_path('G-H.I-J', 3)
+        assert caseless_dict == {
+            'a_b': {'c_d': 1, 'e_f': 2},
+            'g_h': {'i_j': 3},
+        }
+
+    def test_set_path_errors(self):
+        caseless_dict = CaselessDict({'A': 1, 'Items': [1]})
+
+        with pytest.raises(TypeError):
+            caseless_dict.set_path('A.B', 2)
+        with pytest.raises(TypeError):
+            caseless_dict.set_path('A.B.C', 2)
+        with pytest.raises(IndexError):
+            caseless_dict.set_path('Items.1', 2)
+        with pytest.raises(IndexError):
+            caseless_dict.set_path('Items.1.A', 2)
+        with pytest.raises(ValueError):
+            caseless_dict.set_path((), 2)
+        assert caseless_dict == {'a': 1, 'items': [1]}
+
+    def test_deep_path(self):
+        caseless_dict = _DeepDict(
+            {'Database': {'Primary Host': 'db1', 'Replicas': [{'Name': 'r'}]}}
+        )
+
+        assert caseless_dict.get_path('database.primary host') == 'db1'
+        assert type(dict.__getitem__(caseless_dict, 'database')) is _DeepDict
+        assert caseless_dict.get_path('Database.Replicas.0.NAME') == 'r'
+        caseless_dict.set_path('Database.Replicas.0.Other Key', 1)
+        assert caseless_dict['database']['replicas'][0] == {
+            'name': 'r',
+            'other_key': 1,
+        }
@@ -0,0 +1,132 @@
+"""Test cases for the caseless_key module.
+
+Classes:
+    TestCaselessKey: Test case for the CaselessKey class.
+    TestCaselessKeyLookups: Test case for looking up keys with CaselessKey.
+"""
+import pickle
+
+import pytest
+
+from caseless_dictionary import (
+    CaselessDict,
+    SnakeCaselessAttrDict,
+    SnakeCaselessDict,
+)
+from caseless_dictionary.caseless_dict import CaseFoldCaselessDict
+from caseless_dictionary.caseless_key import CaselessKey, caseless_key_type
+from caseless_dictionary.cases import snake_case
+
+
+class _DeepDict(SnakeCaselessDict):
+    deep = True
+
+
+class _SuperDict(SnakeCaselessDict):
+    def __getitem__(self, key):
+        return super().__getitem__(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+
+
+class TestCaselessKey:
+    def test_caseless_key(self, caseless_class):
+        _class, _key_operation = caseless_class
+
+        caseless_key = _class.caseless_key('  Some Key ')
+        assert isinstance(caseless_key, CaselessKey)
+        assert caseless_key.normalized_key == _key_operation('  Some Key ')
+        assert str(caseless_key) == _key_operation('  Some Key ')
+        assert caseless_key == _key_operation('  Some Key ')
+        assert hash(caseless_key) == hash(_key_operation('  Some Key '))
+
+    @pytest.mark.parametrize('key', (1, 5.56, ('a', 'B')))
+    def test_caseless_key_not_str(self, key, caseless_class):
+        _class, _ = caseless_class
+        assert _class.caseless_key(key) == key
+
+    def test_caseless_key_of_caseless_key(self):
+        caseless_key = CaselessDict.caseless_key('Some Key')
+        assert CaselessDict.caseless_key(caseless_key) == caseless_key
+
+    def test_key_type_is_shared_by_same_modifiers(self):
+        assert CaselessDict._key_type is CaseFoldCaselessDict._key_type
+        assert SnakeCaselessDict._key_type is SnakeCaselessAttrDict._key_type
+        assert CaselessDict._key_type is not SnakeCaselessDict._key_type
+        assert caseless_key_type([snake_case]) is SnakeCaselessDict._key_type
+
+    def test_pickle_as_str(self):
+        caseless_key = CaselessDict.caseless_key('Some Key')
+        unpickled = pickle.loads(pickle.dumps(caseless_key))
+
+        assert type(unpickled) is str
+        assert unpickled == 'some key'
+
+
+class TestCaselessKeyLookups:
+    def test_lookups(self, caseless_class):
+        _class, _ = caseless_class
+        caseless_dict = _class({'  Some Key ': 1})
+        caseless_key = _class.caseless_key('SOME KEY')
+
+        assert caseless_dict[caseless_key] == 1
+        assert caseless_dict.get(caseless_key) == 1
+        assert caseless_key in caseless_dict
+        assert caseless_dict.pop(caseless_key) == 1
+        assert caseless_key not in caseless_dict
+        assert caseless_dict.get(caseless_key, 2) == 2
+        with pytest.raises(KeyError):
+            _ = caseless_dict[caseless_key]
+
+    def test_delete(self, caseless_class):
+        _class, _ = caseless_class
+        caseless_dict = _class({'  Some Key ': 1, 'Other Key': 2})
+
+        del caseless_dict[_class.caseless_key('SOME KEY')]
+        assert caseless_dict.pop(_class.caseless_key('OTHER KEY'), 3) == 2
+        assert caseless_dict.pop(_class.caseless_key('OTHER KEY'), 3) == 3
+        assert not caseless_dict
+        with pytest.raises(KeyError):
+            del caseless_dict[_class.caseless_key('SOME KEY')]
+
+    def test_deep_lookups(self):
+        caseless_key = _DeepDict.caseless_key('Some Key')
+        caseless_dict = _DeepDict({'SOME KEY': {'Other Key': 1}})
+
+        assert caseless_dict[caseless_key]['OTHER KEY'] == 1
+        assert caseless_dict.get(caseless_key)['other key'] == 1
+        assert caseless_dict.get(_DeepDict.caseless_key('Missing'), 2) == 2
+
+    def test_lookups_through_super(self):
+        caseless_key = _SuperDict.caseless_key('Some Key')
+        caseless_dict = _SuperDict({'SOME KEY': 1})
+
+        assert caseless_dict[caseless_key] == 1
+        del caseless_dict[caseless_key]
+        assert caseless_key not in caseless_dict
+
+    def test_set_stores_str(self, caseless_class):
+        _class, _key_operation = caseless_class
+        caseless_dict = _class()
+        caseless_dict[_class.caseless_key('Some Key')] = 1
+
+        (key,) = caseless_dict
+        assert type(key) is str
+        assert caseless_dict == {_key_operation('Some Key'): 1}
+
+    def test_attr_dict_lookups(self):
+        caseless_key = SnakeCaselessAttrDict.caseless_key('Some Key')
+        caseless_attr_dict = SnakeCaselessAttrDict({'SOME KEY': 1})
+
+        assert caseless_attr_dict[caseless_key] == 1
+        assert caseless_key in caseless_attr_dict
+
+    def test_key_of_other_modifiers(self):
+        snake_key = SnakeCaselessDict.caseless_key('Some Key')
+        caseless_dict = CaselessDict({'SOME_KEY': 1})
+
+        assert caseless_dict[snake_key] == 1
+        caseless_dict[snake_key] = 2
+        assert caseless_dict == {'some_key': 2}
+        assert CaselessDict.normalize_many([snake_key]) == ['some_key']
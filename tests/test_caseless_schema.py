@@ -0,0 +1,316 @@
+"""Test cases for the caseless_schema module.
+
+Classes:
+    TestCaselessSchema: Test case for the CaselessSchema class.
+    TestCaselessRecord: Test case for the mapping API of the records.
+    TestCaselessAttrRecord: Test case for attribute access of the records.
+"""
+import copy
+import pickle
+import sys
+
+import pytest
+
+from caseless_dictionary import CaselessDict, SnakeCaselessAttrDict
+from caseless_dictionary.exceptions import CaselessKeyError
+from caseless_dictionary.caseless_schema import (
+    CaselessAttrRecord,
+    CaselessRecord,
+    CaselessSchema,
+)
+
+
+class TestCaselessSchema:
+    def test_keys(self, valid_mapping, caseless_class):
+        _class, _key_operation = caseless_class
+        schema = CaselessSchema(valid_mapping, _class)
+
+        assert schema.keys == tuple(map(_key_operation, valid_mapping))
+        assert list(schema) == list(schema.keys)
+        assert len(schema) == len(valid_mapping)
+        assert schema.caseless_class is _class
+
+    def test_record(self, valid_mapping, caseless_class):
+        _class, _ = caseless_class
+        schema = CaselessSchema(valid_mapping, _class)
+
+        record = schema(valid_mapping.values())
+        assert isinstance(record, CaselessRecord)
+        assert record == _class(valid_mapping)
+        assert list(record.items()) == list(_class(valid_mapping).items())
+
+    def test_record_class(self):
+        assert not issubclass(
+            CaselessSchema(['a'], CaselessDict).record_class,
+            CaselessAttrRecord,
+        )
+        assert issubclass(
+            CaselessSchema(['a'], SnakeCaselessAttrDict).record_class,
+            CaselessAttrRecord,
+        )
+
+    def test_wrong_number_of_values(self):
+        schema = CaselessSchema(['a', 'b'])
+        with pytest.raises(ValueError):
+            schema([1])
+        with pytest.raises(ValueError):
+            schema([1, 2, 3])
+
+    def test_header_collision(self):
+        with pytest.raises(ValueError):
+            CaselessSchema(['Some Key', '  SOME KEY '])
+
+    def test_str_only(self, caseless_class, monkeypatch):
+        _class, _ = caseless_class
+        monkeypatch.setattr(_class, 'key_is_str_only', True)
+
+        with pytest.raises(TypeError):
+            CaselessSchema(['a', 1], _class)
+        record = CaselessSchema(['a'], _class)([1])
+        with pytest.raises(TypeError):
+            record[1] = 2
+
+    def test_records(self):
+        schema = CaselessSchema(['Name', 'Age'])
+        records = schema.records(iter([('Ada', 36), ('Grace', 85)]))
+
+        assert list(records) == [
+            {'name': 'Ada', 'age': 36},
+            {'name': 'Grace', 'age': 85},
+        ]
+
+    def test_from_mapping(self, valid_mapping, caseless_class):
+        _class, _ = caseless_class
+        schema = CaselessSchema(valid_mapping, _class)
+
+        assert schema.from_mapping(valid_mapping) == _class(valid_mapping)
+
+    def test_from_mapping_other_spelling_and_extra_keys(self):
+        schema = CaselessSchema(['User ID', 'First Name'])
+        record = schema.from_mapping(
+            {'USER ID': 1, 'First Name': 'Ada', 'Extra': True}
+        )
+
+        assert record == {'user id': 1, 'first name': 'Ada', 'extra': True}
+        assert schema.from_mapping({'user id': 2}) == {'user id': 2}
+
+    def test_value_modifiers(self):
+        class _StrValueDict(CaselessDict):
+            _value_modifiers = [str]
+
+        schema = CaselessSchema(['A', 'B'], _StrValueDict)
+        record = schema([1, 2])
+        record['C'] = 3
+
+        assert record == {'a': '1', 'b': '2', 'c': '3'}
+        assert schema.from_mapping({'A': 4}) == {'a': '4'}
+
+    def test_repr(self):
+        schema = CaselessSchema(['A', 'B'], SnakeCaselessAttrDict)
+        assert (
+            repr(schema) == "CaselessSchema(['a', 'b'], SnakeCaselessAttrDict)"
+        )
+
+    def test_pickle(self):
+        schema = CaselessSchema(['User ID', 1], SnakeCaselessAttrDict)
+        unpickled = pickle.loads(pickle.dumps(schema))
+
+        assert unpickled.keys == schema.keys
+        assert unpickled.caseless_class is SnakeCaselessAttrDict
+        assert unpickled([2, 3]) == {'user_id': 2, 1: 3}
+
+    def test_records_share_keys(self):
+        schema = CaselessSchema([' '.join(['Some', 'Key'])])
+        first, second = schema([1]), schema([2])
+
+        assert next(iter(first)) is next(iter(second))
+
+    def test_record_is_smaller_than_dict(self):
+        header = [f'Column {index}' for index in range(20)]
+        record = CaselessSchema(header)(range(20))
+        record_size = sys.getsizeof(record) + sys.getsizeof(record._values)
+
+        assert record_size < sys.getsizeof(
+            CaselessDict(zip(header, range(20)))
+        )
+
+
+class TestCaselessRecord:
+    @pytest.fixture
+    def record(self):
+        return CaselessSchema(['Some Key', 'Other Key'])([1, 2])
+
+    def test_getitem(self, record):
+        assert record['  SOME KEY '] == 1
+        assert record[CaselessDict.caseless_key('Other Key')] == 2
+        with pytest.raises(KeyError):
+            record['Missing']
+
+    def test_setitem(self, record):
+        record['SOME KEY'] = 3
+        record['New Key'] = 4
+
+        assert record == {'some key': 3, 'other key': 2, 'new key': 4}
+        assert record._extra == {'new key': 4}
+
+    def test_delitem(self, record):
+        record['New Key'] = 3
+        del record['SOME KEY']
+        del record['new key']
+
+        assert record == {'other key': 2}
+        assert len(record) == 1
+        assert 'some key' not in record
+        with pytest.raises(KeyError):
+            del record['Some Key']
+        with pytest.raises(KeyError):
+            record['Some Key']
+        with pytest.raises(KeyError):
+            del record['Missing']
+
+    def test_contains(self, record):
+        record['New Key'] = 3
+
+        assert ' SOME key' in record
+        assert 'NEW KEY' in record
+        assert 'Missing' not in record
+
+    def test_get(self, record):
+        assert record.get('SOME KEY') == 1
+        assert record.get('Missing') is None
+        assert record.get('Missing', 3) == 3
+
+    def test_try_get(self, record):
+        record['New Key'] = None
+        del record['Other Key']
+
+        assert record.try_get('SOME KEY') == (True, 1)
+        assert record.try_get('new key') == (True, None)
+        assert record.try_get('Other Key') == (False, None)
+        assert record.try_get('Missing') == (False, None)
+
+    def test_missing_key_error(self, record):
+        with pytest.raises(CaselessKeyError) as error:
+            record['  Missing ']
+        assert error.value.key == 'missing'
+
+    def test_mapping_methods(self, record):
+        assert list(record.keys()) == ['some key', 'other key']
+        assert list(record.values()) == [1, 2]
+        assert record.pop('SOME KEY') == 1
+        assert record.setdefault('Some Key', 5) == 5
+        assert record.setdefault('SOME KEY', 6) == 5
+        record.update({'Other Key': 7}, new_key=8)
+        assert record == {'some key': 5, 'other key': 7, 'new_key': 8}
+
+    def test_clear(self, record):
+        record['New Key'] = 3
+        record.clear()
+
+        assert record == {}
+        assert len(record) == 0
+        record['Some Key'] = 1
+        assert record == {'some key': 1}
+
+    def test_copy(self, record):
+        record['New Key'] = 3
+        copy = record.copy()
+        copy['Some Key'] = 4
+        copy['New Key'] = 5
+
+        assert type(copy) is type(record)
+        assert record == {'some key': 1, 'other key': 2, 'new key': 3}
+        assert copy == {'some key': 4, 'other key': 2, 'new key': 5}
+
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, record, protocol):
+        record['New Key'] = 3
+        del record['Other Key']
+        other_record = record._schema([4, 5])
+
+        unpickled, other_unpickled = pickle.loads(
+            pickle.dumps([record, other_record], protocol)
+        )
+
+        assert unpickled == {'some key': 1, 'new key': 3}
+        assert 'OTHER KEY' not in unpickled
+        assert unpickled._schema.keys == ('some key', 'other key')
+        assert other_unpickled == {'some key': 4, 'other key': 5}
+        assert type(other_unpickled) is type(unpickled)
+        unpickled['Other Key'] = 6
+        assert unpickled._extra == {'new key': 3}
+
+    def test_copy_module(self, record):
+        shallow_copy = copy.copy(record)
+        deep_copy = copy.deepcopy(record)
+        shallow_copy['Some Key'] = 3
+        deep_copy['Some Key'] = 4
+
+        assert record == {'some key': 1, 'other key': 2}
+        assert shallow_copy == {'some key': 3, 'other key': 2}
+        assert deep_copy == {'some key': 4, 'other key': 2}
+
+    def test_to_caseless_dict(self, record):
+        caseless_dict = record.to_caseless_dict()
+
+        assert type(caseless_dict) is CaselessDict
+        assert caseless_dict == {'some key': 1, 'other key': 2}
+        assert caseless_dict['SOME KEY'] == 1
+
+    def test_init(self):
+        record_class = CaselessSchema(['Some Key']).record_class
+
+        assert record_class({'SOME KEY': 1}, Other=2) == {
+            'some key': 1,
+            'other': 2,
+        }
+
+    def test_repr(self, record):
+        assert repr(record) == "{'some key': 1, 'other key': 2}"
+
+    def test_unhashable_type(self, record, unhashable_type):
+        with pytest.raises(TypeError):
+            record[unhashable_type]
+
+    def test_no_other_attributes(self, record):
+        with pytest.raises(AttributeError):
+            record.some_key = 1
+
+
+class TestCaselessAttrRecord:
+    @pytest.fixture
+    def record(self):
+        schema = CaselessSchema(
+            ['User ID', 'First Name'], SnakeCaselessAttrDict
+        )
+        return schema([1, 'Ada'])
+
+    def test_get_attribute(self, record):
+        assert record.USER_ID == 1
+        assert record.first_name == 'Ada'
+        with pytest.raises(AttributeError):
+            record.last_name
+
+    def test_set_attribute(self, record):
+        record.First_Name = 'Grace'
+        record.last_name = 'Hopper'
+
+        assert record == {
+            'user_id': 1,
+            'first_name': 'Grace',
+            'last_name': 'Hopper',
+        }
+
+    def test_pickle(self, record):
+        unpickled = pickle.loads(pickle.dumps(record))
+
+        assert isinstance(unpickled, CaselessAttrRecord)
+        assert unpickled.first_name == 'Ada'
+        assert unpickled._schema.caseless_class is SnakeCaselessAttrDict
+
+    def test_delete_attribute(self, record):
+        del record.user_id
+
+        assert record == {'first_name': 'Ada'}
+        with pytest.raises(AttributeError):
+            del record.user_id
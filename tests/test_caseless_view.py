@@ -0,0 +1,163 @@
+"""Test cases for the caseless_view module.
+
+Classes:
+    TestCaselessView: Test case for the CaselessView class.
+    TestLazyIndex: Test case for the lazily built index of CaselessView.
+"""
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Iterator, Mapping
+
+import pytest
+
+from caseless_dictionary import CaselessDict, SnakeCaselessDict
+from caseless_dictionary.caseless_view import CaselessView
+from caseless_dictionary.exceptions import CaselessKeyError
+
+
+class _CustomMapping(Mapping):
+    """Mapping which can not be reversed."""
+
+    def __init__(self, items):
+        self._items = dict(items)
+
+    def __getitem__(self, key):
+        return self._items[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class TestCaselessView:
+    def test_same_items_as_caseless_dict(self, valid_mapping, caseless_class):
+        _class, _ = caseless_class
+        view = CaselessView(valid_mapping, _class)
+        caseless_dict = _class(valid_mapping)
+
+        assert view == caseless_dict
+        assert list(view) == list(caseless_dict)
+        assert list(view.items()) == list(caseless_dict.items())
+        assert len(view) == len(caseless_dict)
+
+    def test_getitem(self, valid_mapping, caseless_class):
+        _class, _key_operation = caseless_class
+        view = CaselessView(valid_mapping, _class)
+
+        for key, value in valid_mapping.items():
+            assert view[key] == value
+            assert view[_key_operation(key)] == value
+            assert key in view
+            assert view.get(key) == value
+            assert view.try_get(key) == (True, value)
+
+    def test_missing_key(self):
+        view = CaselessView({'Some Key': 1})
+
+        with pytest.raises(CaselessKeyError) as error:
+            view['Missing']
+        assert error.value.key == 'missing'
+        assert 'Missing' not in view
+        assert view.try_get('Missing') == (False, None)
+        assert view.get('Missing') is None
+        assert view.get('Missing', 2) == 2
+
+    def test_empty_mapping(self):
+        view = CaselessView({})
+
+        assert 'Some Key' not in view
+        assert len(view) == 0
+        assert view == {}
+
+    def test_colliding_keys_last_wins(self):
+        mapping = {'Some Key': 1, 'Other': 2, 'SOME KEY': 3}
+        expected = CaselessDict(mapping)
+
+        lookup_first = CaselessView(mapping)
+        assert lookup_first['some key'] == 3
+        assert lookup_first == expected
+        assert list(lookup_first) == list(expected)
+
+        iterate_first = CaselessView(mapping)
+        assert list(iterate_first) == list(expected)
+        assert iterate_first['some key'] == 3
+
+    @pytest.mark.parametrize(
+        'mapping_type',
+        (dict, OrderedDict, MappingProxyType, _CustomMapping, CaselessDict),
+    )
+    def test_mapping_types(self, mapping_type):
+        mapping = mapping_type({'Some Key': 1, 'Other': 2, 'SOME KEY': 3})
+        view = CaselessView(mapping)
+
+        assert view['SOME KEY'] == 3
+        assert 'other' in view
+        assert 'missing' not in view
+        assert view == CaselessDict(mapping)
+
+    def test_caseless_key(self):
+        view = CaselessView({'Content-Type': 'text/html'})
+
+        assert view[CaselessDict.caseless_key('CONTENT-TYPE')] == 'text/html'
+
+    def test_caseless_class(self):
+        view = CaselessView({'User Name': 'ada'}, SnakeCaselessDict)
+
+        assert view['USER_NAME'] == 'ada'
+        assert list(view) == ['user_name']
+
+    def test_read_only(self):
+        view = CaselessView({'Some Key': 1})
+
+        with pytest.raises(TypeError):
+            view['Some Key'] = 2
+        with pytest.raises(AttributeError):
+            view.other = 2
+
+    def test_repr(self):
+        view = CaselessView({'Some Key': 1})
+        assert repr(view) == "CaselessView({'some key': 1})"
+
+    def test_to_caseless_dict(self):
+        view = CaselessView({'User Name': 'ada'}, SnakeCaselessDict)
+        caseless_dict = view.to_caseless_dict()
+
+        assert type(caseless_dict) is SnakeCaselessDict
+        assert caseless_dict == {'user_name': 'ada'}
+
+    def test_does_not_copy(self):
+        mapping = {'Some Key': [1]}
+        CaselessView(mapping)['SOME KEY'].append(2)
+
+        assert mapping == {'Some Key': [1, 2]}
+
+    def test_unhashable_type(self, unhashable_type):
+        with pytest.raises(TypeError):
+            CaselessView({'Some Key': 1})[unhashable_type]
+
+
+class TestLazyIndex:
+    def test_lookup_indexes_only_needed_keys(self):
+        mapping = {f'Key {index}': index for index in range(100)}
+        view = CaselessView(mapping)
+
+        assert view['KEY 97'] == 97
+        assert len(view._index) == 3
+        assert view['KEY 99'] == 99
+        assert len(view._index) == 3
+
+    def test_miss_indexes_every_key(self):
+        mapping = {f'Key {index}': index for index in range(100)}
+        view = CaselessView(mapping)
+
+        assert 'Missing' not in view
+        assert len(view._index) == 100
+        assert view['KEY 0'] == 0
+
+    def test_not_reversible_mapping_indexed_on_first_miss(self):
+        view = CaselessView(_CustomMapping({'A': 1, 'B': 2}))
+
+        assert view['a'] == 1
+        assert len(view._index) == 2
@@ -10,7 +10,11 @@ Classes:
     TestLowerCase: Test case for the lower function.
     TestSnakeCase: Test case for the snake_case function.
     TestKebabCase: Test case for the kebab_case function.
+    TestAsciiFastPath: Test case for the ASCII fast path of the functions.
+    TestNormalizeMany: Test case for the batch normalization of keys.
 """
+import itertools
+import random
 import typing
 
 import pytest
@@ -23,6 +27,7 @@ from caseless_dictionary.cases import (
     kebab_case,
     lower,
     constant_case,
+    normalize_many,
 )
 
 
@@ -111,3 +116,94 @@ class TestLowerCase:
 
         actual = lower(data)
         assert actual == expected
+
+
+_ASCII = ''.join(map(chr, range(128)))
+
+
+@pytest.fixture(params=range(5))
+def random_ascii_strings(request) -> typing.List[str]:
+    _random = random.Random(request.param)
+    return [
+        ''.join(_random.choice(_ASCII) for _ in range(_random.randint(0, 64)))
+        for _ in range(500)
+    ]
+
+
+class TestAsciiFastPath:
+    """The ASCII fast path must match the full unicode path exactly."""
+
+    @pytest.mark.parametrize(
+        'case_function, unicode_path',
+        (
+            (case_fold, lambda value: value.strip().casefold()),
+            (lower, lambda value: value.strip().lower()),
+            (upper, lambda value: value.strip().upper()),
+            (title, lambda value: value.strip().title()),
+            (
+                snake_case,
+                lambda value: value.strip().replace(' ', '_').casefold(),
+            ),
+            (
+                kebab_case,
+                lambda value: value.strip().replace(' ', '-').casefold(),
+            ),
+            (
+                constant_case,
+                lambda value: value.strip().replace(' ', '_').upper(),
+            ),
+        ),
+    )
+    def test_equivalent_to_unicode_path(
+        self, case_function, unicode_path, random_ascii_strings
+    ):
+        pairs = [a + b for a in _ASCII for b in _ASCII]
+        for value in itertools.chain(_ASCII, pairs, random_ascii_strings):
+            assert case_function(value) == unicode_path(value)
+
+    def test_title_non_ascii(self):
+        value = '  ǆemal ßtraße ΣΊΣΥΦΟΣ '
+        assert title(value) == value.strip().title()
+
+    def test_casefold_matches_lower_for_ascii(self):
+        for character in _ASCII:
+            assert character.casefold() == character.lower()
+
+
+class TestNormalizeMany:
+    @pytest.mark.parametrize(
+        'case_function',
+        (
+            case_fold,
+            upper,
+            lower,
+            title,
+            snake_case,
+            kebab_case,
+            constant_case,
+        ),
+    )
+    @pytest.mark.parametrize(
+        'keys',
+        (
+            [],
+            [''],
+            ['', '  '],
+            ['  Some Word ', 'OTHER  word', 'x\x1fy ', 'ΣΊΣΥΦΟΣ Σ', 'ßtraße'],
+            ['  a long ascii key with many words and spaces  '] * 3,
+            ['has\x00separator', 'Plain Key'],
+            ['  Some Word ', 1, 5.56, ('a', 'B')],
+        ),
+    )
+    def test_matches_case_function(self, case_function, keys):
+        expected = [case_function(key) for key in keys]
+
+        assert case_function.normalize_many(keys) == expected
+        assert case_function.normalize_many(iter(keys)) == expected
+        assert normalize_many(keys, case_function) == expected
+
+    def test_many_case_functions(self):
+        keys = ['  Some Word ', 'other word', 2]
+        expected = [constant_case(snake_case(key)) for key in keys]
+
+        assert normalize_many(keys, snake_case, constant_case) == expected
@@ -0,0 +1,248 @@
+"""Test cases for the concurrent_caseless_dict module.
+
+Classes:
+    TestConcurrentCaselessDict: Test case for the ConcurrentCaselessDict
+        class.
+    TestThreads: Test case for ConcurrentCaselessDict shared by threads.
+"""
+import copy
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from caseless_dictionary import CaselessDict
+from caseless_dictionary.concurrent_caseless_dict import (
+    ConcurrentCaselessDict,
+)
+from caseless_dictionary.exceptions import CaselessKeyError
+
+_THREADS = 8
+
+
+class _StrOnlyDict(ConcurrentCaselessDict):
+    key_is_str_only = True
+
+
+class _TwoStripesDict(ConcurrentCaselessDict):
+    lock_stripes = 2
+    intern_keys = True
+    _value_modifiers = [str]
+
+
+class _DashDict(ConcurrentCaselessDict):
+    def _modify_key(self, key):
+        return super()._modify_key(key).replace('-', '_')
+
+
+class TestConcurrentCaselessDict:
+    def test_same_items_as_caseless_dict(self, valid_mapping):
+        concurrent_dict = ConcurrentCaselessDict(valid_mapping)
+        expected = CaselessDict(valid_mapping)
+
+        assert concurrent_dict == expected
+        concurrent_dict['  New Key'] = 1
+        expected['  New Key'] = 1
+        assert concurrent_dict.setdefault('NEW KEY', 2) == 1
+        concurrent_dict.update({'Other': 3}, Extra=4)
+        concurrent_dict.set_many([('MORE', 5)])
+        assert concurrent_dict.pop('other') == 3
+        del concurrent_dict['EXTRA']
+        assert concurrent_dict.pop_many(['more']) == [5]
+        assert concurrent_dict == expected
+
+    def test_locks(self):
+        concurrent_dict = _TwoStripesDict()
+
+        assert len(concurrent_dict._locks) == 2
+        assert len(ConcurrentCaselessDict()._locks) == 16
+        assert concurrent_dict._locks[0] is not concurrent_dict._locks[1]
+
+    def test_value_modifiers_and_intern_keys(self):
+        key = ''.join(['  Interned ', 'Key '])
+        first, second = _TwoStripesDict(), _TwoStripesDict()
+        first[key] = 1
+        assert second.get_or_compute(key, len) == '12'
+
+        assert first == {'interned key': '1'}
+        assert next(iter(first)) is next(iter(second))
+
+    def test_get_or_compute(self):
+        concurrent_dict = ConcurrentCaselessDict({'Some Key': 1})
+
+        assert concurrent_dict.get_or_compute('SOME KEY', len) == 1
+        assert concurrent_dict.get_or_compute(' Other', len) == 5
+        assert concurrent_dict == {'some key': 1, 'other': 5}
+
+    def test_get_or_compute_exception(self):
+        def factory(key):
+            raise ValueError(key)
+
+        concurrent_dict = ConcurrentCaselessDict()
+        with pytest.raises(ValueError):
+            concurrent_dict.get_or_compute('Key', factory)
+        assert concurrent_dict == {}
+
+    def test_reentrant_factory(self):
+        fibonacci = ConcurrentCaselessDict({0: 0, 1: 1})
+
+        def factory(number):
+            return fibonacci.get_or_compute(
+                number - 1, factory
+            ) + fibonacci.get_or_compute(number - 2, factory)
+
+        assert fibonacci.get_or_compute(30, factory) == 832040
+
+    def test_factory_computes_same_key(self):
+        concurrent_dict = ConcurrentCaselessDict()
+
+        def factory(key):
+            return concurrent_dict.get_or_compute(key.upper(), len)
+
+        with pytest.raises(RuntimeError) as error:
+            concurrent_dict.get_or_compute('Key', factory)
+        assert str(error.value) == "Key is already being computed: 'key'"
+        assert concurrent_dict == {}
+        assert concurrent_dict.get_or_compute('Key', len) == 3
+
+    def test_key_set_while_computing(self):
+        concurrent_dict = ConcurrentCaselessDict()
+
+        def factory(key):
+            concurrent_dict[key] = 'set'
+            return 'computed'
+
+        assert concurrent_dict.get_or_compute('Key', factory) == 'set'
+        assert concurrent_dict == {'key': 'set'}
+
+    def test_overridden_modify_key(self):
+        concurrent_dict = _DashDict({'A-B': 1, 'C-D': 2, 'E-F': 3})
+
+        concurrent_dict.set_many({'G-H': 4})
+        concurrent_dict.set_many([('I-J', 5)])
+        del concurrent_dict['a-b']
+        assert concurrent_dict.pop('C-D') == 2
+        assert concurrent_dict.pop('X-Y', None) is None
+        assert concurrent_dict == {'e_f': 3, 'g_h': 4, 'i_j': 5}
+
+    def test_str_only(self):
+        concurrent_dict = _StrOnlyDict()
+
+        for operation in (
+            lambda: concurrent_dict.__setitem__(1, 2),
+            lambda: concurrent_dict.setdefault(1, 2),
+            lambda: concurrent_dict.get_or_compute(1, str),
+            lambda: concurrent_dict.update({1: 2}),
+        ):
+            with pytest.raises(TypeError):
+                operation()
+        assert concurrent_dict == {}
+
+    def test_pop_many_missing_key(self):
+        concurrent_dict = ConcurrentCaselessDict({'A': 1})
+
+        with pytest.raises(CaselessKeyError):
+            concurrent_dict.pop_many(['a', 'b'])
+        assert concurrent_dict == {'a': 1}
+        assert concurrent_dict.pop_many(['a', 'b'], None) == [1, None]
+
+    def test_popitem_and_clear(self):
+        concurrent_dict = ConcurrentCaselessDict({'A': 1, 'B': 2})
+
+        assert concurrent_dict.popitem() == ('b', 2)
+        concurrent_dict.clear()
+        assert concurrent_dict == {}
+        with pytest.raises(KeyError):
+            concurrent_dict.pop('A')
+
+    def test_copies_have_their_own_locks(self):
+        concurrent_dict = ConcurrentCaselessDict({'Some Key': 1})
+
+        for copied in (
+            concurrent_dict.copy(),
+            copy.deepcopy(concurrent_dict),
+            pickle.loads(pickle.dumps(concurrent_dict)),
+            {'Other': 2} | concurrent_dict,
+            concurrent_dict | {'Other': 2},
+        ):
+            assert type(copied) is ConcurrentCaselessDict
+            assert copied['SOME KEY'] == 1
+            assert len(copied._locks) == len(concurrent_dict._locks)
+            assert copied._locks[0] is not concurrent_dict._locks[0]
+
+
+class TestThreads:
+    def test_get_or_compute_calls_factory_once(self):
+        concurrent_dict = ConcurrentCaselessDict()
+        calls = []
+        barrier = threading.Barrier(_THREADS)
+
+        def factory(key):
+            calls.append(key)
+            time.sleep(0.01)
+            return object()
+
+        def compute(index):
+            barrier.wait()
+            return concurrent_dict.get_or_compute(
+                'Some Key' if index % 2 else 'SOME KEY', factory
+            )
+
+        with ThreadPoolExecutor(_THREADS) as executor:
+            values = list(executor.map(compute, range(_THREADS)))
+
+        assert calls == ['some key']
+        assert all(value is values[0] for value in values)
+
+    def test_factory_waits_for_other_thread(self):
+        concurrent_dict = ConcurrentCaselessDict()
+        updated = threading.Event()
+
+        def update():
+            concurrent_dict.update({'Other Key': 2})
+            updated.set()
+
+        thread = threading.Thread(target=update)
+
+        def factory(key):
+            thread.start()
+            return updated.wait(5)
+
+        value = concurrent_dict.get_or_compute('Some Key', factory)
+        thread.join()
+        assert value is True
+        assert concurrent_dict == {'some key': True, 'other key': 2}
+
+    def test_setdefault_returns_same_value(self):
+        concurrent_dict = ConcurrentCaselessDict()
+        barrier = threading.Barrier(_THREADS)
+
+        def insert(_):
+            barrier.wait()
+            return concurrent_dict.setdefault('Some Key', object())
+
+        with ThreadPoolExecutor(_THREADS) as executor:
+            values = list(executor.map(insert, range(_THREADS)))
+
+        assert all(value is values[0] for value in values)
+
+    def test_concurrent_changes(self):
+        concurrent_dict = ConcurrentCaselessDict()
+
+        def change(index):
+            for number in range(200):
+                key = f'Key {index} {number}'
+                concurrent_dict[key.upper()] = number
+                concurrent_dict.setdefault(key, -1)
+                if number % 2:
+                    del concurrent_dict[key]
+            concurrent_dict.update({f'Thread {index}': index})
+
+        with ThreadPoolExecutor(_THREADS) as executor:
+            list(executor.map(change, range(_THREADS)))
+
+        assert len(concurrent_dict) == _THREADS * 101
+        assert concurrent_dict['KEY 3 198'] == 198
+        assert concurrent_dict['thread 5'] == 5
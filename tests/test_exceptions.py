@@ -0,0 +1,34 @@
+"""Test cases for the exceptions module.
+
+Classes:
+    TestCaselessKeyError: Test case for the CaselessKeyError class.
+"""
+import pickle
+
+import pytest
+
+from caseless_dictionary.exceptions import CaselessKeyError
+
+
+class TestCaselessKeyError:
+    def test_is_key_error(self):
+        with pytest.raises(KeyError):
+            raise CaselessKeyError('some key')
+
+    def test_key(self):
+        error = CaselessKeyError('some key')
+
+        assert error.key == 'some key'
+        assert error.args == ('some key',)
+        assert CaselessKeyError().key is None
+
+    @pytest.mark.parametrize('key', ('some key', 1, ('a', 'b')))
+    def test_str(self, key):
+        error = CaselessKeyError(key)
+        assert str(error) == f'Missing key of some case variant of {key!r}'
+
+    def test_pickle(self):
+        error = pickle.loads(pickle.dumps(CaselessKeyError('some key')))
+
+        assert type(error) is CaselessKeyError
+        assert error.key == 'some key'
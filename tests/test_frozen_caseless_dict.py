@@ -0,0 +1,179 @@
+"""Test cases for the frozen_caseless_dict module.
+
+Classes:
+    TestFrozenCaselessDict: Test case for the FrozenCaselessDict class.
+"""
+import copy
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from caseless_dictionary import CaselessDict, SnakeCaselessDict
+from caseless_dictionary.exceptions import CaselessKeyError
+from caseless_dictionary.frozen_caseless_dict import (
+    FrozenCaselessDict,
+    _index_typecode,
+)
+
+
+class _StrOnlyDict(SnakeCaselessDict):
+    key_is_str_only = True
+    _value_modifiers = [str]
+
+
+class TestFrozenCaselessDict:
+    def test_same_items_as_caseless_class(self, caseless_class, valid_mapping):
+        _class, _ = caseless_class
+        frozen_dict = FrozenCaselessDict(valid_mapping, _class)
+        expected = _class(valid_mapping)
+
+        assert frozen_dict == expected
+        assert list(frozen_dict) == list(expected)
+        assert list(frozen_dict.items()) == list(expected.items())
+        assert list(frozen_dict.values()) == list(expected.values())
+        assert len(frozen_dict) == len(expected)
+        for key in valid_mapping:
+            assert frozen_dict[key] == expected[key]
+            assert key in frozen_dict
+            assert frozen_dict.get(key) == expected.get(key)
+            assert frozen_dict.try_get(key) == (True, expected[key])
+
+    @pytest.mark.parametrize('length', (0, 1, 2, 3, 100, 300, 5_000))
+    def test_every_key_is_found(self, length):
+        mapping = {f'Key {index}': index for index in range(length)}
+        mapping.update({index: -index for index in range(length)})
+        frozen_dict = FrozenCaselessDict(mapping)
+
+        for key, value in mapping.items():
+            assert (
+                frozen_dict[key.upper() if isinstance(key, str) else key]
+                == value
+            )
+        for key in ('Missing', -1, length, None, (1,)):
+            assert key not in frozen_dict
+            assert frozen_dict.get(key, 'default') == 'default'
+            assert frozen_dict.try_get(key) == (False, None)
+
+    def test_missing_key(self):
+        with pytest.raises(CaselessKeyError) as error:
+            FrozenCaselessDict({'A': 1})['Missing']
+        assert error.value.key == 'missing'
+
+    def test_duplicate_keys(self):
+        frozen_dict = FrozenCaselessDict(
+            [('Key', 1), ('Other', 2), ('KEY', 3)]
+        )
+
+        assert list(frozen_dict.items()) == [('key', 3), ('other', 2)]
+
+    @pytest.mark.parametrize(
+        'length, typecode', ((0, 'B'), (255, 'B'), (256, 'H'), (70_000, 'I'))
+    )
+    def test_index_typecode(self, length, typecode):
+        assert _index_typecode(length) == typecode
+
+    def test_index_is_compact(self):
+        frozen_dict = FrozenCaselessDict({f'Key {i}': i for i in range(200)})
+
+        assert frozen_dict._index.typecode == 'B'
+        assert len(frozen_dict._index) == 512
+
+    def test_immutable(self):
+        frozen_dict = FrozenCaselessDict({'A': 1})
+
+        with pytest.raises(TypeError):
+            frozen_dict['B'] = 2
+        with pytest.raises(TypeError):
+            del frozen_dict['A']
+        assert not hasattr(frozen_dict, 'pop')
+
+    def test_state_is_immutable(self):
+        frozen_dict = FrozenCaselessDict({'A': 1})
+        hash(frozen_dict)
+
+        with pytest.raises(TypeError):
+            frozen_dict.__setstate__((CaselessDict, ('b',), (2,)))
+        with pytest.raises(TypeError):
+            frozen_dict.__init__({'B': 2})
+        with pytest.raises(TypeError):
+            frozen_dict._values = (2,)
+        with pytest.raises(TypeError):
+            frozen_dict._hash = None
+        with pytest.raises(TypeError):
+            del frozen_dict._keys
+        assert frozen_dict == {'a': 1}
+        assert hash(frozen_dict) == hash(FrozenCaselessDict({'A': 1}))
+
+    def test_hash(self):
+        first = FrozenCaselessDict({'A': 1, 'B': (2,)})
+        second = FrozenCaselessDict([('b', (2,)), ('a', 1)])
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert hash(first) == first._hash
+        assert {first: 'cached'}[second] == 'cached'
+        assert first != FrozenCaselessDict({'A': 1, 'B': (3,)})
+        hash(FrozenCaselessDict({'A': 1, 'B': (3,)}))
+        assert first != FrozenCaselessDict({'A': 1, 'B': (3,)})
+
+    def test_unhashable_value(self):
+        frozen_dict = FrozenCaselessDict({'A': [1]})
+
+        with pytest.raises(TypeError):
+            hash(frozen_dict)
+        assert frozen_dict == {'a': [1]}
+
+    def test_caseless_class_options(self):
+        frozen_dict = FrozenCaselessDict({'Some Key': 1}, _StrOnlyDict)
+
+        assert frozen_dict == {'some_key': '1'}
+        with pytest.raises(TypeError):
+            FrozenCaselessDict({1: 2}, _StrOnlyDict)
+
+    def test_copy_and_pickle(self):
+        frozen_dict = FrozenCaselessDict({'Some Key': 1}, SnakeCaselessDict)
+
+        for copied in (
+            copy.copy(frozen_dict),
+            copy.deepcopy(frozen_dict),
+            pickle.loads(pickle.dumps(frozen_dict)),
+        ):
+            assert type(copied) is FrozenCaselessDict
+            assert copied == frozen_dict
+            assert copied['SOME KEY'] == 1
+            assert copied.caseless_class is SnakeCaselessDict
+
+    def test_unpickle_in_other_process(self):
+        frozen_dict = FrozenCaselessDict(
+            {f'Key {index}': index for index in range(100)}
+        )
+        code = (
+            'import pickle, sys; '
+            'frozen_dict = pickle.loads(sys.stdin.buffer.read()); '
+            'print(sum(frozen_dict[key] for key in frozen_dict))'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            input=pickle.dumps(frozen_dict),
+            capture_output=True,
+            check=True,
+        )
+
+        assert int(result.stdout) == sum(range(100))
+
+    def test_to_caseless_dict(self, caseless_class, valid_mapping):
+        _class, _ = caseless_class
+        caseless_dict = FrozenCaselessDict(
+            valid_mapping, _class
+        ).to_caseless_dict()
+
+        assert type(caseless_dict) is _class
+        assert caseless_dict == _class(valid_mapping)
+
+    def test_repr(self):
+        assert repr(FrozenCaselessDict({'A': 1})) == (
+            "FrozenCaselessDict({'a': 1})"
+        )
+        assert FrozenCaselessDict().caseless_class is CaselessDict
@@ -0,0 +1,145 @@
+"""Test cases for the json module.
+
+Classes:
+    TestLoads: Test case for the loads and load functions.
+    TestIterload: Test case for the iterload function.
+"""
+import decimal
+import io
+import json
+
+import pytest
+
+from caseless_dictionary import (
+    CaselessDict,
+    SnakeCaselessAttrDict,
+    UpperCaselessDict,
+)
+from caseless_dictionary.json import iterload, load, loads
+
+_DOCUMENT = (
+    '{"Server Name": "web", "Tags": ["a", {"Inner Key": 1.5}],'
+    ' "Nested": {"Deeper": {"Last KEY": null}}}'
+)
+
+
+class _DashDict(CaselessDict):
+    def _modify_key(self, key):
+        return super()._modify_key(key).replace('-', '_')
+
+
+def _wrap(value, caseless_class):
+    """Wrap every object of a decoded document after it is loaded."""
+    if isinstance(value, dict):
+        return caseless_class(
+            (key, _wrap(item, caseless_class)) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return [_wrap(item, caseless_class) for item in value]
+    return value
+
+
+class TestLoads:
+    def test_every_object_is_caseless(self, caseless_class):
+        _class, _ = caseless_class
+        document = loads(_DOCUMENT, _class)
+
+        assert type(document) is _class
+        assert type(document['tags'][1]) is _class
+        assert type(document['NESTED']['deeper']) is _class
+        assert document == _wrap(json.loads(_DOCUMENT), _class)
+        assert document['Tags'][0] == 'a'
+
+    def test_attribute_dict(self):
+        document = loads(_DOCUMENT, SnakeCaselessAttrDict)
+
+        assert document.server_name == 'web'
+        assert document.nested.deeper.last_key is None
+        assert document.tags[1].inner_key == 1.5
+
+    def test_not_an_object(self):
+        assert loads('[{"A": 1}, 2]', UpperCaselessDict) == [{'A': 1}, 2]
+        assert loads('"Text"') == 'Text'
+
+    def test_on_collision(self):
+        document = '{"Some Key": 1, "SOME KEY": 2}'
+
+        assert loads(document) == {'some key': 2}
+        assert loads(document, on_collision='first') == {'some key': 1}
+        with pytest.raises(ValueError):
+            loads(document, on_collision='raise')
+
+    @pytest.mark.parametrize(
+        'load_document',
+        (
+            lambda document, **kwargs: loads(document, **kwargs),
+            lambda document, **kwargs: load(io.StringIO(document), **kwargs),
+            lambda document, **kwargs: next(iterload([document], **kwargs)),
+        ),
+    )
+    def test_overridden_modify_key(self, load_document):
+        document = load_document(
+            '{"A-B": {"C-D": [{"E-F": 1}]}}', caseless_class=_DashDict
+        )
+
+        assert type(document) is _DashDict
+        assert document == {'a_b': {'c_d': [{'e_f': 1}]}}
+        assert document['A-B']['c-d'][0]['e-f'] == 1
+
+    @pytest.mark.parametrize(
+        'load_document',
+        (
+            lambda **kwargs: loads('{}', **kwargs),
+            lambda **kwargs: load(io.StringIO('{}'), **kwargs),
+            lambda **kwargs: iterload(['{}'], **kwargs),
+        ),
+    )
+    def test_invalid_on_collision(self, load_document):
+        with pytest.raises(ValueError):
+            load_document(on_collision='middle')
+
+    def test_json_arguments(self):
+        document = loads('{"Price": 1.10}', parse_float=decimal.Decimal)
+
+        assert document['PRICE'] == decimal.Decimal('1.10')
+
+    def test_invalid_document(self):
+        with pytest.raises(json.JSONDecodeError):
+            loads('{"A": ')
+
+    @pytest.mark.parametrize(
+        'file',
+        (io.StringIO(_DOCUMENT), io.BytesIO(_DOCUMENT.encode('utf-8'))),
+    )
+    def test_load(self, file):
+        document = load(file, CaselessDict)
+
+        assert document == loads(_DOCUMENT)
+        assert type(document['nested']) is CaselessDict
+
+
+class TestIterload:
+    def test_records(self):
+        lines = io.StringIO('{"User ID": 1}\n\n  \n{"USER id": {"A": 2}}\n')
+        records = iterload(lines, UpperCaselessDict)
+
+        assert next(records) == {'USER ID': 1}
+        assert lines.readline() == '\n'
+        assert list(records) == [{'USER ID': {'A': 2}}]
+
+    def test_binary_lines(self):
+        lines = io.BytesIO('{"Straße": 1}\n[{"Key": 2}]\n'.encode('utf-8'))
+
+        assert list(iterload(lines)) == [{'strasse': 1}, [{'key': 2}]]
+
+    def test_invalid_line(self):
+        records = iterload(['{"A": 1}', '{"A": ', '{"A": 3}'])
+
+        assert next(records) == {'a': 1}
+        with pytest.raises(json.JSONDecodeError, match='on line 2'):
+            next(records)
+
+    def test_json_arguments(self):
+        records = iterload(['{"N": 1}'], parse_int=str)
+
+        assert list(records) == [{'n': '1'}]
@@ -0,0 +1,201 @@
+"""Test cases for the key_compiler module.
+
+Classes:
+    TestCompileKeyModifiers: Test case for the compile_key_modifiers function.
+    TestCompileNormalizeMany: Test case for the compile_normalize_many
+        function.
+    TestStrKeyExpression: Test case for the str_key_expression function.
+    TestCompiledSubclass: Test case for the compilation of subclasses.
+    TestPreservesNormalizedKeys: Test case for the preserves_normalized_keys
+        function.
+"""
+import pytest
+
+from caseless_dictionary import CaselessDict, SnakeCaselessAttrDict
+from caseless_dictionary.cases import (
+    case_fold,
+    upper,
+    lower,
+    title,
+    snake_case,
+    kebab_case,
+    constant_case,
+)
+from caseless_dictionary.key_compiler import (
+    MIN_BATCH_SIZE,
+    PRESERVED_CASES,
+    compile_key_modifiers,
+    compile_normalize_many,
+    preserves_normalized_keys,
+    str_key_expression,
+)
+
+_KEYS = ('  CamelCase ', 'snake_case', 'Two Words', 1, 5.56, True, ('a',))
+
+
+def _reverse(value):
+    if isinstance(value, str):
+        return value[::-1]
+    return value
+
+
+def _to_int(value):
+    if value == 'one':
+        return 1
+    return value
+
+
+@pytest.fixture(
+    params=(
+        [case_fold],
+        [title],
+        [snake_case, constant_case],
+        [upper, _reverse, case_fold],
+        [_to_int, snake_case],
+        [_reverse],
+        [_reverse, _to_int],
+    )
+)
+def modifiers(request):
+    return request.param
+
+
+class TestCompileKeyModifiers:
+    def test_matches_sequential_application(self, modifiers):
+        normalize_key = compile_key_modifiers(modifiers)
+
+        for key in _KEYS + (' One', 'one'):
+            expected = key
+            for modifier in modifiers:
+                expected = modifier(expected)
+            assert normalize_key(key) == expected
+
+    def test_single_callable(self):
+        normalize_key = compile_key_modifiers(_reverse)
+        assert normalize_key('abc') == 'cba'
+
+    @pytest.mark.parametrize('modifiers', (None, [], ()))
+    def test_no_modifiers(self, modifiers):
+        normalize_key = compile_key_modifiers(modifiers)
+        for key in _KEYS:
+            assert normalize_key(key) is key
+
+    @pytest.mark.parametrize('modifiers', ('case_fold', 1))
+    def test_invalid_modifiers(self, modifiers):
+        with pytest.raises(TypeError):
+            compile_key_modifiers(modifiers)
+
+    def test_non_case_modifier_is_returned(self):
+        assert compile_key_modifiers([_reverse]) is _reverse
+
+
+class TestCompileNormalizeMany:
+    def test_matches_sequential_application(self, modifiers):
+        normalize_keys = compile_normalize_many(modifiers)
+        keys = _KEYS + (' One', 'one')
+
+        expected = []
+        for key in keys:
+            for modifier in modifiers:
+                key = modifier(key)
+            expected.append(key)
+        assert normalize_keys(keys) == expected
+
+    @pytest.mark.parametrize(
+        'size', (0, 1, MIN_BATCH_SIZE - 1, MIN_BATCH_SIZE, 100)
+    )
+    def test_batch_sizes(self, modifiers, size):
+        normalize_keys = compile_normalize_many(modifiers)
+        normalize_key = compile_key_modifiers(modifiers)
+        keys = [f' Some Key {index}' for index in range(size)]
+
+        expected = list(map(normalize_key, keys))
+        assert normalize_keys(keys) == expected
+        assert normalize_keys(iter(keys)) == expected
+
+
+class TestStrKeyExpression:
+    def test_matches_compile_key_modifiers(self, modifiers):
+        expression, namespace = str_key_expression(modifiers)
+        normalize_key = compile_key_modifiers(modifiers)
+
+        for key in (' One', 'one', '', 'Two Words', 'snake_case'):
+            assert eval(expression, dict(namespace, key=key)) == normalize_key(
+                key
+            )
+
+    def test_inlined_case_functions(self):
+        assert str_key_expression([case_fold]) == (
+            'key.strip().casefold()',
+            {},
+        )
+        assert str_key_expression(None) == ('key', {})
+
+    def test_case_function_after_other_modifier(self):
+        expression, namespace = str_key_expression([_to_int, snake_case])
+
+        assert expression == '_normalize_key(key)'
+        assert namespace['_normalize_key']('one') == 1
+
+
+class TestCompiledSubclass:
+    def test_subclass_key_modifiers(self):
+        class _ReversedCaselessDict(CaselessDict):
+            _key_modifiers = [case_fold, _reverse]
+
+        caseless_dict = _ReversedCaselessDict({' AbC ': 1})
+        assert caseless_dict == {'cba': 1}
+        assert caseless_dict['ABC'] == 1
+
+    def test_subclass_of_attr_dict(self):
+        class _UpperAttrDict(SnakeCaselessAttrDict):
+            _key_modifiers = [upper]
+
+        caseless_attr_dict = _UpperAttrDict({' some word ': 1})
+        assert caseless_attr_dict == {'SOME WORD': 1}
+        assert caseless_attr_dict[' Some Word'] == 1
+
+
+class TestPreservesNormalizedKeys:
+    def test_preserved_cases_for_every_code_point(self):
+        characters = [
+            chr(code_point)
+            for code_point in range(0x110000)
+            if not 0xD800 <= code_point < 0xE000
+        ]
+        keys = (
+            ' '.join(characters),
+            'a'.join(characters),
+            ' \tSome  ΑΣ Key_Σ-ς ',
+        )
+        normalized = {
+            source: [source(key) for key in keys] for source in PRESERVED_CASES
+        }
+        for modifier, sources in PRESERVED_CASES.items():
+            for source in sources:
+                for normalized_key in normalized[source]:
+                    assert modifier(normalized_key) == normalized_key
+
+    @pytest.mark.parametrize(
+        'modifiers, normalized_by, expected',
+        (
+            ([case_fold], [case_fold], True),
+            ([case_fold], [snake_case], True),
+            ([snake_case], [kebab_case], True),
+            ([case_fold, kebab_case], [snake_case], True),
+            ([upper], [constant_case], True),
+            ([title], [title], True),
+            ([_reverse], [_reverse], True),
+            ([], [snake_case], True),
+            ([snake_case], [case_fold], False),
+            ([lower], [case_fold], False),
+            ([title], [case_fold], False),
+            ([case_fold], [upper], False),
+            ([case_fold], [snake_case, _reverse], False),
+            ([_reverse], [case_fold], False),
+        ),
+    )
+    def test_preserves_normalized_keys(
+        self, modifiers, normalized_by, expected
+    ):
+        assert preserves_normalized_keys(modifiers, normalized_by) is expected
@@ -0,0 +1,85 @@
+"""Test cases for the lazy_list module.
+
+Classes:
+    TestWrapNested: Test case for the wrap_nested function.
+    TestLazyCaselessList: Test case for the LazyCaselessList class.
+"""
+import copy
+import pickle
+
+import pytest
+
+from caseless_dictionary import CaselessDict, SnakeCaselessDict
+from caseless_dictionary.lazy_list import LazyCaselessList, wrap_nested
+
+
+class TestWrapNested:
+    def test_dict(self):
+        wrapped = wrap_nested({'Some Key': {'Inner': 1}}, SnakeCaselessDict)
+
+        assert type(wrapped) is SnakeCaselessDict
+        assert wrapped == {'some_key': {'Inner': 1}}
+
+    def test_list(self):
+        items = [{'A': 1}]
+        wrapped = wrap_nested(items, CaselessDict)
+
+        assert type(wrapped) is LazyCaselessList
+        assert wrapped.caseless_class is CaselessDict
+        assert wrapped is not items
+
+    @pytest.mark.parametrize(
+        'value', (1, 'Text', None, ({'A': 1},), CaselessDict({'A': 1}))
+    )
+    def test_other_values(self, value):
+        assert wrap_nested(value, CaselessDict) is value
+
+
+class TestLazyCaselessList:
+    def test_wraps_on_first_access(self):
+        nested = {'Some Key': 1}
+        items = LazyCaselessList([nested, [nested], 3], CaselessDict)
+
+        assert list.__getitem__(items, 0) is nested
+        first = items[0]
+        assert type(first) is CaselessDict
+        assert first == {'some key': 1}
+        assert items[0] is first
+        assert items[-3] is first
+        assert list.__getitem__(items, 0) is first
+        assert type(items[-2]) is LazyCaselessList
+        assert items[1][0] == {'some key': 1}
+        assert items[2] == 3
+
+    def test_iteration(self):
+        items = LazyCaselessList([{'A': 1}, {'B': 2}], CaselessDict)
+
+        assert [type(item) for item in items] == [CaselessDict, CaselessDict]
+        assert all(type(item) is CaselessDict for item in list.__iter__(items))
+        assert list(items) == [{'a': 1}, {'b': 2}]
+
+    def test_slice(self):
+        items = LazyCaselessList([{'A': 1}, 2, {'C': 3}], CaselessDict)
+
+        assert items[::2] == [{'a': 1}, {'c': 3}]
+        assert type(items[-1:][0]) is CaselessDict
+        assert items[5:] == []
+
+    def test_index_error(self):
+        with pytest.raises(IndexError):
+            LazyCaselessList([], CaselessDict)[0]
+
+    def test_copy_and_pickle(self):
+        items = LazyCaselessList([{'A': 1}, {'B': [2]}], SnakeCaselessDict)
+        items[0]
+
+        for copied in (
+            copy.copy(items),
+            copy.deepcopy(items),
+            pickle.loads(pickle.dumps(items)),
+        ):
+            assert type(copied) is LazyCaselessList
+            assert copied.caseless_class is SnakeCaselessDict
+            assert type(list.__getitem__(copied, 0)) is SnakeCaselessDict
+            assert type(list.__getitem__(copied, 1)) is dict
+            assert copied == [{'a': 1}, {'B': [2]}]
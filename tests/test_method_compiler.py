@@ -0,0 +1,211 @@
+"""Test cases for the method_compiler module.
+
+Classes:
+    TestCompileMethods: Test case for the compile_methods function.
+    TestGeneratedMethods: Test case for the methods generated for the
+        subclasses of BaseCaselessDict.
+"""
+import pytest
+
+from caseless_dictionary import (
+    CaselessAttrDict,
+    CaselessDict,
+    SnakeCaselessAttrDict,
+    SnakeCaselessDict,
+)
+from caseless_dictionary.base_caseless_dict import BaseCaselessDict
+from caseless_dictionary.cases import case_fold, snake_case, upper
+from caseless_dictionary.method_compiler import (
+    SPECIALIZED_METHODS,
+    compile_methods,
+    is_specializable,
+    specializable,
+)
+
+
+def _reverse(value):
+    if isinstance(value, str):
+        return value[::-1]
+    return value
+
+
+class _ReversedDict(CaselessDict):
+    _key_modifiers = [case_fold, _reverse]
+
+
+class _OverridingDict(CaselessDict):
+    def __getitem__(self, key):
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+
+
+class _UpperOverridingDict(_OverridingDict):
+    _key_modifiers = [upper]
+
+
+class _DashDict(CaselessDict):
+    def _modify_key(self, key):
+        key = super()._modify_key(key)
+        if isinstance(key, str):
+            return key.replace('-', '_')
+        return key
+
+
+class _StrValueDict(CaselessDict):
+    def _modify_value(self, value):
+        return str(value)
+
+
+class TestCompileMethods:
+    def test_methods(self):
+        methods = compile_methods(SnakeCaselessDict, [snake_case])
+
+        assert set(methods) == set(SPECIALIZED_METHODS)
+        assert all(map(is_specializable, methods.values()))
+        assert methods['get'].__qualname__ == 'SnakeCaselessDict.get'
+
+    def test_specializable(self):
+        def method():
+            pass
+
+        assert not is_specializable(method)
+        assert specializable(method) is method
+        assert is_specializable(method)
+
+
+class TestGeneratedMethods:
+    @pytest.mark.parametrize('name', SPECIALIZED_METHODS)
+    def test_every_class_has_its_own_methods(self, name, caseless_class):
+        _class, _ = caseless_class
+        method = vars(_class)[name]
+
+        assert is_specializable(method)
+        assert method.__qualname__ == f'{_class.__qualname__}.{name}'
+
+    def test_docstrings_are_kept(self):
+        assert CaselessDict.__setitem__.__doc__.startswith('Set the value')
+        assert CaselessDict.get.__doc__ == BaseCaselessDict.get.__doc__
+
+    def test_custom_key_modifiers(self):
+        caseless_dict = _ReversedDict({' Some Key': 1})
+        caseless_dict.setdefault('OTHER', 2)
+
+        assert caseless_dict == {'yek emos': 1, 'rehto': 2}
+        assert caseless_dict['SOME KEY '] == 1
+        assert 'other' in caseless_dict
+        assert caseless_dict.get('Other') == 2
+        assert caseless_dict.pop('OTHER') == 2
+        del caseless_dict['some key']
+        assert caseless_dict == {}
+
+    def test_defined_methods_are_kept(self):
+        assert not is_specializable(_OverridingDict.__getitem__)
+        assert _UpperOverridingDict.__getitem__ is _OverridingDict.__getitem__
+        assert is_specializable(vars(_UpperOverridingDict)['get'])
+
+    def test_super_from_subclass_with_other_modifiers(self):
+        caseless_dict = _UpperOverridingDict()
+        caseless_dict['Some Key'] = 1
+
+        assert caseless_dict == {'SOME KEY': 1}
+        assert caseless_dict['some key'] == 1
+        assert CaselessDict.get(caseless_dict, 'some key') == 1
+        assert CaselessDict.__contains__(caseless_dict, 'some key')
+        assert CaselessDict.pop(caseless_dict, 'some key') == 1
+
+    @pytest.mark.parametrize(
+        'key', (CaselessDict.caseless_key('Some Key'), 'SOME KEY')
+    )
+    def test_keys_which_are_not_exactly_str(self, key):
+        class _Str(str):
+            pass
+
+        caseless_dict = CaselessDict({'Some Key': 1})
+        assert caseless_dict[key] == 1
+        assert caseless_dict[_Str(key)] == 1
+        caseless_dict[_Str(key)] = 2
+        assert caseless_dict == {'some key': 2}
+
+    def test_str_only(self, caseless_class, monkeypatch):
+        _class, _ = caseless_class
+        monkeypatch.setattr(_class, 'key_is_str_only', True)
+        caseless_dict = _class()
+
+        with pytest.raises(TypeError):
+            caseless_dict[1] = 2
+        with pytest.raises(TypeError):
+            caseless_dict.setdefault(1, 2)
+        caseless_dict[_class.caseless_key('Key')] = 1
+        assert caseless_dict == {_class._normalize_key('Key'): 1}
+
+    def test_str_only_attr_dict(self, monkeypatch):
+        monkeypatch.setattr(CaselessAttrDict, 'key_is_str_only', True)
+
+        with pytest.raises(TypeError):
+            CaselessAttrDict()[1] = 2
+
+    def test_value_modifiers_and_intern_keys(self):
+        class _ModifiedDict(CaselessDict):
+            _value_modifiers = [str]
+            intern_keys = True
+
+        key = ''.join(['  Interned ', 'Key '])
+        first, second = _ModifiedDict(), _ModifiedDict()
+        first[key] = 1
+        second.setdefault(key, 2)
+
+        assert first == {'interned key': '1'}
+        assert second == {'interned key': '2'}
+        assert next(iter(first)) is next(iter(second))
+
+    def test_pop_missing_key(self):
+        with pytest.raises(KeyError):
+            CaselessDict().pop('Missing')
+        assert CaselessDict().pop('Missing', None) is None
+
+    def test_overridden_hooks_keep_base_methods(self):
+        for name in SPECIALIZED_METHODS:
+            assert vars(_DashDict)[name] is vars(BaseCaselessDict)[name]
+            assert vars(_StrValueDict)[name] is vars(BaseCaselessDict)[name]
+        assert _DashDict._has_item_hooks
+        assert not CaselessDict._has_item_hooks
+
+    @pytest.mark.parametrize('key', ('A-B', 'a_b', ' A-b '))
+    def test_overridden_modify_key(self, key):
+        caseless_dict = _DashDict()
+        dict.__setitem__(caseless_dict, 'a_b', 1)
+
+        assert key in caseless_dict
+        assert caseless_dict[key] == 1
+        assert caseless_dict.get(key) == 1
+        assert caseless_dict.try_get(key) == (True, 1)
+        assert caseless_dict.get_many([key]) == [1]
+        assert caseless_dict.contains_many([key]) == [True]
+        assert CaselessDict.get(caseless_dict, key) == 1
+        assert caseless_dict.pop(key) == 1
+        assert caseless_dict == {}
+
+    def test_overridden_modify_value(self):
+        caseless_dict = _StrValueDict({'A': 1})
+        caseless_dict['B'] = 2
+        caseless_dict.setdefault('C', 3)
+        caseless_dict.set_many({'D': 4})
+        caseless_dict.update(E=5)
+        CaselessDict.__setitem__(caseless_dict, 'F', 6)
+
+        assert caseless_dict == dict(zip('abcdef', '123456'))
+        assert _StrValueDict(caseless_dict) == caseless_dict
+
+    def test_overridden_hooks_of_attr_dict(self):
+        class _StrValueAttrDict(SnakeCaselessAttrDict):
+            def _modify_value(self, value):
+                return str(value)
+
+        caseless_attr_dict = _StrValueAttrDict({'Some Key': 1})
+        caseless_attr_dict.other_key = 2
+
+        assert _StrValueAttrDict._attribute_keys is None
+        assert caseless_attr_dict == {'some_key': '1', 'other_key': '2'}
+        assert caseless_attr_dict.SOME_KEY == '1'
@@ -0,0 +1,168 @@
+"""Test cases for the mmap_caseless_dict module.
+
+Classes:
+    TestWriteCaselessDict: Test case for the write_caseless_dict function.
+    TestMmapCaselessDict: Test case for the MmapCaselessDict class.
+"""
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from caseless_dictionary import CaselessDict, SnakeCaselessDict
+from caseless_dictionary.exceptions import CaselessKeyError
+from caseless_dictionary.mmap_caseless_dict import (
+    _HEADER,
+    MAGIC,
+    VERSION,
+    MmapCaselessDict,
+    write_caseless_dict,
+)
+
+_MAPPING = {
+    '  Some Key ': 1,
+    'OTHER key': [2, 3],
+    'Straße Σσ': None,
+    'snake_case': {'nested': True},
+}
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    return tmp_path / 'table.caseless'
+
+
+def _open(path, caseless_dict):
+    write_caseless_dict(path, caseless_dict)
+    return MmapCaselessDict(path)
+
+
+class TestWriteCaselessDict:
+    def test_not_str_key(self, table_path):
+        with pytest.raises(TypeError):
+            write_caseless_dict(table_path, CaselessDict({1: 2}))
+        assert not table_path.exists()
+        assert not list(table_path.parent.iterdir())
+
+    def test_class_not_importable(self, table_path):
+        class _LocalDict(CaselessDict):
+            pass
+
+        with pytest.raises(ValueError):
+            write_caseless_dict(table_path, _LocalDict({'A': 1}))
+
+    def test_replaces_file(self, table_path):
+        write_caseless_dict(table_path, CaselessDict({'A': 1}))
+        with MmapCaselessDict(table_path) as old_table:
+            write_caseless_dict(table_path, CaselessDict({'B': 2}))
+            assert old_table['a'] == 1
+        with MmapCaselessDict(table_path) as new_table:
+            assert dict(new_table) == {'b': 2}
+
+    def test_header(self, table_path):
+        write_caseless_dict(table_path, SnakeCaselessDict())
+
+        assert table_path.read_bytes().startswith(MAGIC)
+        assert b'caseless_dictionary.caseless_dict:SnakeCaselessDict' in (
+            table_path.read_bytes()
+        )
+
+
+class TestMmapCaselessDict:
+    def test_same_items_as_caseless_class(self, caseless_class, table_path):
+        _class, _ = caseless_class
+        expected = _class(_MAPPING)
+
+        with _open(table_path, expected) as table:
+            assert table.caseless_class is _class
+            assert table == expected
+            assert list(table) == list(expected)
+            assert list(table.items()) == list(expected.items())
+            assert list(table.values()) == list(expected.values())
+            assert len(table) == len(expected)
+            for key in _MAPPING:
+                assert table[key] == expected[key]
+                assert key in table
+                assert table.get(key) == expected[key]
+                assert table.try_get(key) == (True, expected[key])
+
+    @pytest.mark.parametrize('length', (0, 1, 2, 3, 100, 1_000))
+    def test_every_key_is_found(self, table_path, length):
+        mapping = {f'Key {index}': index for index in range(length)}
+
+        with _open(table_path, CaselessDict(mapping)) as table:
+            for key, value in mapping.items():
+                assert table[key.upper()] == value
+            for key in ('Missing', f'Key {length}', 1, None):
+                assert key not in table
+                assert table.get(key, 'default') == 'default'
+                assert table.try_get(key) == (False, None)
+
+    def test_missing_key(self, table_path):
+        with _open(table_path, CaselessDict()) as table:
+            with pytest.raises(CaselessKeyError) as error:
+                table['Missing']
+        assert error.value.key == 'missing'
+
+    def test_not_a_caseless_file(self, table_path):
+        for content in (b'x' * 100, MAGIC + b'\x02' + b'\x00' * 40):
+            table_path.write_bytes(content)
+            with pytest.raises(ValueError):
+                MmapCaselessDict(table_path)
+
+    @pytest.mark.parametrize(
+        'class_path',
+        (b'caseless_dictionary.cases:case_fold', b'builtins:dict'),
+    )
+    def test_not_a_caseless_class(self, table_path, class_path):
+        table_path.write_bytes(
+            _HEADER.pack(MAGIC, VERSION, len(class_path), 1, 0)
+            + class_path
+            + bytes(8)
+        )
+
+        with pytest.raises(ValueError):
+            MmapCaselessDict(table_path)
+
+    def test_close(self, table_path):
+        table = _open(table_path, CaselessDict({'A': 1}))
+        table.close()
+
+        with pytest.raises(ValueError):
+            table['A']
+
+    def test_pickle(self, table_path):
+        with _open(table_path, SnakeCaselessDict(_MAPPING)) as table:
+            with pickle.loads(pickle.dumps(table)) as unpickled:
+                assert unpickled.path == table.path
+                assert unpickled == table
+
+    def test_other_process(self, table_path):
+        write_caseless_dict(table_path, CaselessDict(_MAPPING))
+        code = (
+            'import sys; '
+            'from caseless_dictionary.mmap_caseless_dict import '
+            'MmapCaselessDict; '
+            'print(MmapCaselessDict(sys.argv[1])["other KEY"])'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code, str(table_path)],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        assert result.stdout.strip() == '[2, 3]'
+
+    def test_to_caseless_dict(self, table_path):
+        expected = SnakeCaselessDict(_MAPPING)
+
+        with _open(table_path, expected) as table:
+            caseless_dict = table.to_caseless_dict()
+        assert type(caseless_dict) is SnakeCaselessDict
+        assert caseless_dict == expected
+
+    def test_repr(self, table_path):
+        with _open(table_path, CaselessDict()) as table:
+            assert repr(table) == f'MmapCaselessDict({table_path!r})'
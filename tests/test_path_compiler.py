@@ -0,0 +1,60 @@
+"""Test cases for the path_compiler module.
+
+Classes:
+    TestCompilePathParser: Test case for the compile_path_parser function.
+"""
+import pytest
+
+from caseless_dictionary import CaselessDict, SnakeCaselessDict
+from caseless_dictionary.path_compiler import compile_path_parser
+
+
+class TestCompilePathParser:
+    def test_str_path(self):
+        parse_path = compile_path_parser(SnakeCaselessDict._normalize_key)
+
+        assert parse_path('Database.Primary Host.0') == (
+            ('Database', 'database'),
+            ('Primary Host', 'primary_host'),
+            ('0', '0'),
+        )
+        assert parse_path('') == (('', ''),)
+
+    def test_tuple_path(self):
+        parse_path = compile_path_parser(CaselessDict._normalize_key)
+
+        assert parse_path(('A.B', 1, None)) == (
+            ('A.B', 'a.b'),
+            (1, 1),
+            (None, None),
+        )
+
+    def test_separator(self):
+        parse_path = compile_path_parser(CaselessDict._normalize_key, '/')
+
+        assert parse_path('A.B/C') == (('A.B', 'a.b'), ('C', 'c'))
+        with pytest.raises(ValueError):
+            compile_path_parser(CaselessDict._normalize_key, '')
+
+    def test_cache(self):
+        calls = []
+
+        def normalize_key(key):
+            calls.append(key)
+            return key
+
+        parse_path = compile_path_parser(normalize_key, maxsize=1)
+        parsed = parse_path('A.B')
+
+        assert parse_path('A.B') is parsed
+        assert calls == ['A', 'B']
+        parse_path('C')
+        parse_path('A.B')
+        assert calls == ['A', 'B', 'C', 'A', 'B']
+        assert parse_path.cache_info().maxsize == 1
+
+    def test_empty_tuple(self):
+        parse_path = compile_path_parser(CaselessDict._normalize_key)
+
+        with pytest.raises(ValueError):
+            parse_path(())
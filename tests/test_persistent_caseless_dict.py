@@ -0,0 +1,253 @@
+"""Test cases for the persistent_caseless_dict module.
+
+Classes:
+    TestPersistentCaselessDict: Test case for the PersistentCaselessDict
+        class.
+"""
+import gc
+import sqlite3
+
+import pytest
+
+from caseless_dictionary import (
+    CaselessDict,
+    SnakeCaselessDict,
+    UpperCaselessDict,
+)
+from caseless_dictionary.exceptions import CaselessKeyError
+from caseless_dictionary.persistent_caseless_dict import (
+    KEY_TYPES,
+    PersistentCaselessDict,
+)
+
+
+class _StrOnlyDict(SnakeCaselessDict):
+    key_is_str_only = True
+    _value_modifiers = [str]
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    return str(tmp_path / 'items.sqlite')
+
+
+def _storable(mapping):
+    return {
+        key: value
+        for key, value in mapping.items()
+        if isinstance(key, KEY_TYPES)
+    }
+
+
+def _stored_keys(path):
+    connection = sqlite3.connect(path)
+    try:
+        return [
+            key
+            for (key,) in connection.execute(
+                'SELECT key FROM caseless_items ORDER BY rowid'
+            )
+        ]
+    finally:
+        connection.close()
+
+
+class TestPersistentCaselessDict:
+    def test_same_items_as_caseless_class(self, caseless_class, valid_mapping):
+        _class, _ = caseless_class
+        valid_mapping = _storable(valid_mapping)
+        expected = _class(valid_mapping)
+        with PersistentCaselessDict(':memory:', _class) as persistent_dict:
+            persistent_dict.update(valid_mapping)
+
+            assert persistent_dict == expected
+            assert list(persistent_dict) == list(expected)
+            for key in valid_mapping:
+                assert persistent_dict[key] == expected[key]
+                assert key in persistent_dict
+                assert persistent_dict.get(key) == expected.get(key)
+
+    def test_mutable_mapping(self):
+        with PersistentCaselessDict(':memory:') as persistent_dict:
+            persistent_dict['  Some Key'] = 1
+            assert persistent_dict.setdefault('SOME KEY', 2) == 1
+            assert persistent_dict.setdefault('Other', 3) == 3
+            persistent_dict.update({'other': 4}, Extra=5)
+            persistent_dict.update([('More', [6])])
+            assert persistent_dict == {
+                'some key': 1,
+                'other': 4,
+                'extra': 5,
+                'more': [6],
+            }
+            assert list(persistent_dict) == [
+                'some key',
+                'other',
+                'extra',
+                'more',
+            ]
+            assert persistent_dict.pop('MORE') == [6]
+            assert persistent_dict.pop('More', None) is None
+            del persistent_dict['EXTRA']
+            assert persistent_dict.get_many(['OTHER', 'Missing'], 0) == [4, 0]
+            assert len(persistent_dict) == 2
+            persistent_dict.clear()
+            assert persistent_dict == {}
+            assert not persistent_dict
+
+    def test_missing_key(self):
+        with PersistentCaselessDict(':memory:') as persistent_dict:
+            for operation in (
+                lambda: persistent_dict['Missing'],
+                lambda: persistent_dict.pop('Missing'),
+                lambda: persistent_dict.__delitem__('Missing'),
+            ):
+                with pytest.raises(CaselessKeyError) as error:
+                    operation()
+                assert error.value.key == 'missing'
+            assert persistent_dict.get('Missing') is None
+            assert (1, 2) not in persistent_dict
+
+    def test_reopen(self, database_path):
+        with PersistentCaselessDict(database_path) as persistent_dict:
+            persistent_dict['Some Key'] = {'nested': [1]}
+            persistent_dict.update({'Other': 2})
+            del persistent_dict['OTHER']
+
+        with PersistentCaselessDict(database_path) as persistent_dict:
+            assert persistent_dict == {'some key': {'nested': [1]}}
+            assert persistent_dict['SOME KEY'] == {'nested': [1]}
+
+    def test_garbage_collected_without_close(self, database_path):
+        persistent_dict = PersistentCaselessDict(database_path, batch_size=3)
+        persistent_dict['Some Key'] = 1
+        del persistent_dict['SOME KEY']
+        persistent_dict['Other Key'] = 2
+        assert _stored_keys(database_path) == []
+
+        del persistent_dict
+        gc.collect()
+
+        assert _stored_keys(database_path) == ['other key']
+
+    def test_close_twice(self, database_path):
+        persistent_dict = PersistentCaselessDict(database_path)
+        persistent_dict['Some Key'] = 1
+        persistent_dict.close()
+        persistent_dict.close()
+
+        assert _stored_keys(database_path) == ['some key']
+
+    def test_batched_writes(self, database_path):
+        with PersistentCaselessDict(
+            database_path, batch_size=3
+        ) as persistent_dict:
+            persistent_dict['A'] = 1
+            persistent_dict['B'] = 2
+            assert _stored_keys(database_path) == []
+            assert persistent_dict['a'] == 1
+
+            persistent_dict['C'] = 3
+            assert _stored_keys(database_path) == ['a', 'b', 'c']
+
+            del persistent_dict['A']
+            assert 'a' not in persistent_dict
+            assert _stored_keys(database_path) == ['a', 'b', 'c']
+            persistent_dict.flush()
+            assert _stored_keys(database_path) == ['b', 'c']
+
+            persistent_dict['D'] = 4
+            assert len(persistent_dict) == 3
+            assert _stored_keys(database_path) == ['b', 'c', 'd']
+
+    def test_update_keeps_insertion_order(self, database_path):
+        with PersistentCaselessDict(database_path) as persistent_dict:
+            persistent_dict.update({'A': 1, 'B': 2})
+            persistent_dict['a'] = 3
+            persistent_dict.update(b=4)
+
+            assert list(persistent_dict.items()) == [('a', 3), ('b', 4)]
+
+    def test_cache(self, database_path):
+        with PersistentCaselessDict(
+            database_path, cache_size=2, batch_size=1
+        ) as persistent_dict:
+            persistent_dict.update({'A': 1, 'B': 2, 'C': 3})
+            assert not persistent_dict._cache
+
+            for key in ('A', 'B', 'C', 'b'):
+                persistent_dict[key]
+            assert list(persistent_dict._cache) == ['c', 'b']
+
+            persistent_dict.update(B=4)
+            assert persistent_dict._cache['b'] == 4
+            persistent_dict['D'] = 5
+            assert list(persistent_dict._cache) == ['b', 'd']
+            persistent_dict.clear()
+            assert not persistent_dict._cache
+
+        with PersistentCaselessDict(
+            database_path, cache_size=0
+        ) as persistent_dict:
+            persistent_dict['A'] = 1
+            assert persistent_dict['a'] == 1
+            assert not persistent_dict._cache
+
+    def test_caseless_class_mismatch(self, database_path):
+        PersistentCaselessDict(database_path, UpperCaselessDict).close()
+
+        with pytest.raises(ValueError):
+            PersistentCaselessDict(database_path)
+        with PersistentCaselessDict(
+            database_path, UpperCaselessDict
+        ) as persistent_dict:
+            assert persistent_dict.caseless_class is UpperCaselessDict
+
+    def test_caseless_class_options(self):
+        with PersistentCaselessDict(
+            ':memory:', _StrOnlyDict
+        ) as persistent_dict:
+            persistent_dict['  Some Key '] = 1
+            persistent_dict.update({'Other': 2})
+
+            assert persistent_dict == {'some_key': '1', 'other': '2'}
+            for operation in (
+                lambda: persistent_dict.__setitem__(1, 2),
+                lambda: persistent_dict.update({1: 2}),
+            ):
+                with pytest.raises(TypeError):
+                    operation()
+
+    def test_unsupported_key_type(self):
+        with PersistentCaselessDict(':memory:') as persistent_dict:
+            persistent_dict[1] = 'int'
+            persistent_dict[b'Bytes'] = 'bytes'
+            for operation in (
+                lambda: persistent_dict.__setitem__((1, 2), 3),
+                lambda: persistent_dict.update({None: 3}),
+            ):
+                with pytest.raises(TypeError):
+                    operation()
+            assert persistent_dict == {1: 'int', b'Bytes': 'bytes'}
+
+    @pytest.mark.parametrize('sizes', ({'cache_size': -1}, {'batch_size': 0}))
+    def test_invalid_sizes(self, sizes):
+        with pytest.raises(ValueError):
+            PersistentCaselessDict(':memory:', **sizes)
+
+    def test_to_caseless_dict(self, caseless_class, valid_mapping):
+        _class, _ = caseless_class
+        valid_mapping = _storable(valid_mapping)
+        with PersistentCaselessDict(':memory:', _class) as persistent_dict:
+            persistent_dict.update(valid_mapping)
+            caseless_dict = persistent_dict.to_caseless_dict()
+
+        assert type(caseless_dict) is _class
+        assert caseless_dict == _class(valid_mapping)
+
+    def test_repr(self):
+        with PersistentCaselessDict(':memory:') as persistent_dict:
+            assert (
+                repr(persistent_dict) == "PersistentCaselessDict(':memory:')"
+            )
+            assert persistent_dict.caseless_class is CaselessDict
@@ -0,0 +1,193 @@
+"""Test cases for the sharded_caseless_dict module.
+
+Classes:
+    TestShardedCaselessDict: Test case for the ShardedCaselessDict class.
+"""
+import copy
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from caseless_dictionary import CaselessDict, SnakeCaselessDict
+from caseless_dictionary.exceptions import CaselessKeyError
+from caseless_dictionary.sharded_caseless_dict import (
+    DEFAULT_SHARD_COUNT,
+    ShardedCaselessDict,
+)
+
+
+class _StrOnlyDict(SnakeCaselessDict):
+    key_is_str_only = True
+    intern_keys = True
+    _value_modifiers = [str]
+
+
+@pytest.fixture(params=(1, 2, 7, DEFAULT_SHARD_COUNT))
+def shard_count(request):
+    return request.param
+
+
+class TestShardedCaselessDict:
+    def test_same_items_as_caseless_class(
+        self, caseless_class, valid_mapping, shard_count
+    ):
+        _class, _ = caseless_class
+        sharded_dict = ShardedCaselessDict(valid_mapping, _class, shard_count)
+        expected = _class(valid_mapping)
+
+        assert sharded_dict == expected
+        assert len(sharded_dict) == len(expected)
+        assert sorted(map(repr, sharded_dict)) == sorted(map(repr, expected))
+        assert sharded_dict.shard_count == shard_count
+        for key, value in valid_mapping.items():
+            assert sharded_dict[key] == expected[key]
+            assert key in sharded_dict
+            assert sharded_dict.get(key) == expected.get(key)
+
+    def test_mutable_mapping(self, shard_count):
+        sharded_dict = ShardedCaselessDict(shard_count=shard_count)
+
+        sharded_dict['  Some Key'] = 1
+        assert sharded_dict.setdefault('SOME KEY', 2) == 1
+        assert sharded_dict.setdefault('Other', 3) == 3
+        sharded_dict.update({'other': 4}, Extra=5)
+        sharded_dict.update([('More', 6)])
+        assert sharded_dict == {
+            'some key': 1,
+            'other': 4,
+            'extra': 5,
+            'more': 6,
+        }
+        assert sharded_dict.pop('MORE') == 6
+        assert sharded_dict.pop('More', None) is None
+        del sharded_dict['EXTRA']
+        assert sharded_dict.popitem() in {('some key', 1), ('other', 4)}
+        assert len(sharded_dict) == 1
+        sharded_dict.clear()
+        assert sharded_dict == {}
+        assert not sharded_dict
+
+    def test_missing_key(self):
+        sharded_dict = ShardedCaselessDict()
+
+        for operation in (
+            lambda: sharded_dict['Missing'],
+            lambda: sharded_dict.pop('Missing'),
+            lambda: sharded_dict.__delitem__('Missing'),
+        ):
+            with pytest.raises(CaselessKeyError) as error:
+                operation()
+            assert error.value.key == 'missing'
+        with pytest.raises(KeyError):
+            sharded_dict.popitem()
+        assert sharded_dict.get('Missing') is None
+
+    def test_views(self):
+        mapping = {f'Key {index}': index for index in range(100)}
+        sharded_dict = ShardedCaselessDict(mapping)
+
+        assert list(sharded_dict.items()) == list(
+            zip(sharded_dict.keys(), sharded_dict.values())
+        )
+        assert sorted(sharded_dict.values()) == list(range(100))
+        assert ('KEY 5', 5) in sharded_dict.items()
+        assert 'key 5' in sharded_dict.keys()
+        assert list(sharded_dict) == list(sharded_dict)
+
+    def test_shards(self):
+        sharded_dict = ShardedCaselessDict(
+            {index: index for index in range(100)}, shard_count=7
+        )
+
+        sizes = [len(shard) for shard in sharded_dict._shards]
+        assert sizes == [15, 15, 14, 14, 14, 14, 14]
+
+    @pytest.mark.parametrize('shard_count', (0, -1))
+    def test_invalid_shard_count(self, shard_count):
+        with pytest.raises(ValueError):
+            ShardedCaselessDict(shard_count=shard_count)
+
+    def test_caseless_class_options(self):
+        sharded_dict = ShardedCaselessDict(caseless_class=_StrOnlyDict)
+        key = ''.join(['  Interned ', 'Key '])
+        sharded_dict[key] = 1
+        sharded_dict.setdefault('Other', 2)
+        sharded_dict.update(More=3)
+
+        assert sharded_dict == {'interned_key': '1', 'other': '2', 'more': '3'}
+        stored_key = next(k for k in sharded_dict if k == 'interned_key')
+        assert stored_key is _StrOnlyDict({key: 1}).popitem()[0]
+        for operation in (
+            lambda: sharded_dict.__setitem__(1, 2),
+            lambda: sharded_dict.setdefault(1, 2),
+            lambda: sharded_dict.update({1: 2}),
+        ):
+            with pytest.raises(TypeError):
+                operation()
+
+    def test_copy_and_pickle(self, shard_count):
+        sharded_dict = ShardedCaselessDict(
+            {'Some Key': [1]}, SnakeCaselessDict, shard_count
+        )
+
+        for copied in (
+            sharded_dict.copy(),
+            copy.copy(sharded_dict),
+            copy.deepcopy(sharded_dict),
+            pickle.loads(pickle.dumps(sharded_dict)),
+        ):
+            assert type(copied) is ShardedCaselessDict
+            assert copied == sharded_dict
+            assert copied.caseless_class is SnakeCaselessDict
+            assert copied.shard_count == shard_count
+            copied['Other'] = 2
+            assert 'other' not in sharded_dict
+
+    def test_unpickle_in_other_process(self):
+        code = (
+            'import pickle, sys; '
+            'from caseless_dictionary.sharded_caseless_dict import '
+            'ShardedCaselessDict; '
+            'sys.stdout.buffer.write(pickle.dumps(ShardedCaselessDict('
+            '{f"Key {index}": index for index in range(20)})))'
+        )
+        pickled = subprocess.run(
+            [sys.executable, '-c', code],
+            env={**os.environ, 'PYTHONHASHSEED': '1'},
+            capture_output=True,
+            check=True,
+        ).stdout
+        code = (
+            'import pickle, sys; '
+            'sharded_dict = pickle.loads(sys.stdin.buffer.read()); '
+            'print(sum(sharded_dict[key] for key in sharded_dict), '
+            'sharded_dict.get("KEY 7"), "key 19" in sharded_dict)'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            env={**os.environ, 'PYTHONHASHSEED': '2'},
+            input=pickled,
+            capture_output=True,
+            check=True,
+        )
+
+        assert result.stdout.split() == [b'190', b'7', b'True']
+
+    def test_to_caseless_dict(self, caseless_class, valid_mapping):
+        _class, _ = caseless_class
+        caseless_dict = ShardedCaselessDict(
+            valid_mapping, _class
+        ).to_caseless_dict()
+
+        assert type(caseless_dict) is _class
+        assert caseless_dict == _class(valid_mapping)
+
+    def test_repr(self):
+        assert (
+            repr(ShardedCaselessDict({'A': 1}, shard_count=1))
+            == "ShardedCaselessDict({'a': 1})"
+        )
+        assert CaselessDict is ShardedCaselessDict().caseless_class